@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for applying AI data_mods to the local user-data cache.
+
+Compares services.data_mods.apply_data_mods against the previous per-mod
+walk from APIClient.apply_user_data_mods (kept below as legacy_apply) on
+several synthetic workloads:
+
+- stream: long runs of appends and edits on one project's chats, as sent
+  while a reply streams in
+- mixed: create/edit/del/append spread over many projects and nested keys,
+  with a share of malformed or unresolvable mods
+- deep: mods under deeply nested dictionaries
+
+Before timing, both implementations run on the same input and the resulting
+caches and modified-project sets are compared.
+
+Run from the repository root:
+    python benchmarks/bench_data_mods.py --mods 50000
+"""
+
+import argparse
+import copy
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from services.data_mods import apply_data_mods  # noqa: E402
+
+
+def legacy_apply(cache: dict, context_mods: list[dict]) -> set:
+    """The original APIClient.apply_user_data_mods loop (without mod_count bumps)"""
+    modified_projects: set[str] = set()
+    for mod in context_mods or []:
+        key_path = mod.get("key_path")
+        mode = mod.get("mode")
+        value = mod.get("value")
+        if not isinstance(key_path, list) or mode not in {"create", "edit", "del", "append"}:
+            continue
+        if len(key_path) >= 2 and key_path[0] == "projects" and isinstance(key_path[1], str):
+            if not (len(key_path) == 3 and key_path[2] == "mod_count"):
+                modified_projects.add(key_path[1])
+        target = cache
+        try:
+            for key in key_path[:-1]:
+                if isinstance(target, dict):
+                    if key not in target:
+                        if mode == "create":
+                            target[key] = {}
+                        else:
+                            raise KeyError
+                    target = target[key]
+                elif isinstance(target, list) and isinstance(key, int):
+                    target = target[key]
+                else:
+                    raise TypeError
+            last_key = key_path[-1]
+            if mode == "create":
+                if isinstance(target, dict):
+                    target[last_key] = value
+                elif isinstance(target, list) and isinstance(last_key, int):
+                    if last_key == len(target):
+                        target.append(value)
+                    elif last_key < len(target):
+                        target[last_key] = value
+            elif mode == "edit":
+                if isinstance(target, dict):
+                    target[last_key] = value
+                elif isinstance(target, list) and isinstance(last_key, int):
+                    target[last_key] = value
+            elif mode == "del":
+                if isinstance(target, dict):
+                    if last_key in target:
+                        del target[last_key]
+                elif isinstance(target, list) and isinstance(last_key, int):
+                    if last_key < len(target):
+                        target.pop(last_key)
+            elif mode == "append":
+                if isinstance(target, dict):
+                    if last_key not in target or not isinstance(target[last_key], list):
+                        target[last_key] = []
+                    target[last_key].append(value)
+                elif isinstance(target, list) and isinstance(last_key, int):
+                    if last_key < len(target):
+                        if not isinstance(target[last_key], list):
+                            target[last_key] = []
+                        target[last_key].append(value)
+        except Exception:
+            continue
+    return modified_projects
+
+
+def base_cache(projects: int) -> dict:
+    return {
+        "global_data": {"ai_memory": {}, "video_reflections": {}},
+        "projects": {f"p{i}": {"chats": [], "mod_count": 0, "meta": {}} for i in range(projects)},
+    }
+
+
+def build_mods(workload: str, count: int, seed: int = 5) -> list[dict]:
+    rng = random.Random(seed)
+    mods = []
+    if workload == "stream":
+        while len(mods) < count:
+            mods.append({"key_path": ["projects", "p0", "chats"], "mode": "append",
+                         "value": {"role": "assistant", "type": "text", "text": ""}})
+            for _ in range(rng.randint(5, 40)):
+                mods.append({"key_path": ["projects", "p0", "chats", -1, "text"], "mode": "edit",
+                             "value": "x" * rng.randint(1, 200)})
+    elif workload == "mixed":
+        for i in range(count):
+            project = f"p{rng.randrange(20)}"
+            roll = rng.random()
+            if roll < 0.3:
+                mods.append({"key_path": ["projects", project, "chats"], "mode": "append", "value": {"text": str(i)}})
+            elif roll < 0.5:
+                mods.append({"key_path": ["projects", project, "meta", f"k{rng.randrange(50)}"], "mode": "create", "value": i})
+            elif roll < 0.65:
+                mods.append({"key_path": ["projects", project, "chats", rng.randrange(-3, 5), "text"], "mode": "edit", "value": str(i)})
+            elif roll < 0.75:
+                mods.append({"key_path": ["projects", project, "chats", rng.randrange(0, 3)], "mode": "del"})
+            elif roll < 0.85:
+                mods.append({"key_path": ["global_data", "ai_memory", f"m{rng.randrange(100)}"], "mode": "edit", "value": i})
+            elif roll < 0.92:
+                mods.append({"key_path": ["projects", project, "missing", "x"], "mode": "edit", "value": i})
+            else:
+                mods.append({"key_path": "not-a-list", "mode": "edit"})
+    elif workload == "deep":
+        for i in range(count):
+            path = ["projects", "p0", "meta"] + [f"d{j}" for j in range(rng.randint(4, 10))]
+            mods.append({"key_path": path, "mode": "create", "value": i})
+    return mods
+
+
+def bench(fn, cache: dict, mods: list[dict], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        work = copy.deepcopy(cache)
+        start = time.perf_counter()
+        fn(work, mods)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mods", type=int, default=50000, help="mods per workload")
+    parser.add_argument("--batch", type=int, default=200, help="mods per apply call (one streamed chunk)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case (best time is reported)")
+    parser.add_argument("--workloads", nargs="+", default=["stream", "mixed", "deep"])
+    args = parser.parse_args()
+
+    def batched(fn):
+        def run(cache, mods):
+            for i in range(0, len(mods), args.batch):
+                fn(cache, mods[i:i + args.batch])
+        return run
+
+    print(f"{'workload':<10} {'impl':<8} {'mods':>8} {'ms':>9} {'mods/s':>12} {'speedup':>8}")
+    for workload in args.workloads:
+        cache = base_cache(20)
+        mods = build_mods(workload, args.mods)
+
+        legacy_cache, engine_cache = copy.deepcopy(cache), copy.deepcopy(cache)
+        legacy_projects, engine_projects = set(), set()
+        for i in range(0, len(mods), args.batch):
+            legacy_projects |= legacy_apply(legacy_cache, mods[i:i + args.batch])
+            report = apply_data_mods(engine_cache, mods[i:i + args.batch])
+            engine_projects |= report["modified_projects"]
+        if legacy_cache != engine_cache or legacy_projects != engine_projects:
+            sys.exit(f"{workload}: engine result differs from the legacy implementation")
+
+        legacy = bench(batched(legacy_apply), cache, mods, args.repeat)
+        engine = bench(batched(apply_data_mods), cache, mods, args.repeat)
+        for name, elapsed in (("legacy", legacy), ("engine", engine)):
+            print(f"{workload:<10} {name:<8} {len(mods):>8} {elapsed * 1000:>9.1f} {len(mods) / elapsed:>12.0f} {legacy / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
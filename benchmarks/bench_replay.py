@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Replay benchmark for recorded API traffic.
+
+Replays a corpus exported from the debug sidebar ("Export replay corpus",
+see services/replay.py) through the client code paths with no network:
+
+- make_request: every recorded call through APIClient._make_request, served
+  by an in-memory transport that returns the recorded status and body (the
+  JSON is parsed again on every call, as with a real response); run with
+  debug logging off and on
+- stream: every recorded /ai/respond stream through
+  process_streaming_response, re-chunked with the recorded chunk sizes
+- data_mods: every data_mods batch from those streams through
+  apply_user_data_mods against a fresh project cache
+
+The recorded server durations are shown next to the client-side times for
+context. Without a production corpus, --record drives a short session
+against benchmarks/mock_backend.py and writes one.
+
+Run from the repository root:
+    python benchmarks/bench_replay.py --record replay_corpus.json
+    python benchmarks/bench_replay.py replay_corpus.json --repeat 5
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import statistics
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Bare-mode Streamlit warns on every session_state access outside `streamlit run`
+logging.disable(logging.WARNING)
+
+import streamlit as st  # noqa: E402
+
+import main  # noqa: E402
+from services.replay import build_replay_corpus, dump_replay_corpus, load_replay_corpus  # noqa: E402
+
+
+class ReplayResponse:
+    """Just enough of requests.Response for APIClient"""
+
+    def __init__(self, status_code: int, body: Any, chunks: List[str] = ()):
+        self.status_code = status_code
+        self._text = body if isinstance(body, str) else json.dumps(body)
+        self._chunks = chunks
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @property
+    def content(self) -> bytes:
+        return self._text.encode("utf-8")
+
+    def json(self):
+        return json.loads(self._text)
+
+    def iter_content(self, chunk_size=None, decode_unicode=False):
+        return iter(self._chunks)
+
+    def close(self):
+        pass
+
+
+class ReplayTransport:
+    """Serves recorded responses by method and path, cycling through repeats of the same call"""
+
+    def __init__(self, requests: List[Dict[str, Any]]):
+        self._recorded = defaultdict(list)
+        for req in requests:
+            self._recorded[(req["method"], req["path"])].append(req)
+        self._cursor = defaultdict(int)
+
+    def request(self, method, url, headers=None, json=None, timeout=None, stream=False, idempotent=None, **kwargs):
+        split = urlsplit(url)
+        key = (method, split.path + (f"?{split.query}" if split.query else ""))
+        recorded = self._recorded[key]
+        if not recorded:
+            return ReplayResponse(404, "not in corpus")
+        req = recorded[self._cursor[key] % len(recorded)]
+        self._cursor[key] += 1
+        return ReplayResponse(req["status_code"], req["response"])
+
+
+def rechunk(stream: Dict[str, Any]) -> List[str]:
+    """Re-serialize a stream's documents and split them like the recorded chunks"""
+    text = "".join(json.dumps(doc) + "\n" for doc in stream["documents"])
+    sizes = [size for size in stream.get("chunk_bytes") or [] if size]
+    if not sizes:
+        return [text]
+    scale = len(text) / sum(sizes)
+    chunks, i = [], 0
+    for size in sizes[:-1]:
+        step = max(int(size * scale), 1)
+        chunks.append(text[i:i + step])
+        i += step
+    chunks.append(text[i:])
+    return [chunk for chunk in chunks if chunk]
+
+
+def endpoint_group(req: Dict[str, Any]) -> str:
+    path = urlsplit(req["path"]).path
+    return f"{req['method']} " + re.sub(r"/[0-9a-f]{24}$", "/{id}", path).replace("/codvid-ai", "")
+
+
+def fresh_cache(project: str):
+    st.session_state.local_user_data = {"projects": {project: {"chats": [], "mod_count": 0}}}
+
+
+def new_log_store() -> "main.LogStore":
+    return main.LogStore(
+        max_entries=main.Config.API_LOG_CONFIG["max_entries"],
+        max_bytes=main.Config.API_LOG_CONFIG["max_bytes"],
+        max_body_bytes=main.Config.API_LOG_CONFIG["max_body_bytes"],
+        max_full_bytes=main.Config.API_LOG_CONFIG["max_full_bytes"],
+    )
+
+
+def make_client(transport) -> "main.APIClient":
+    client = main.APIClient("http://replay.invalid")
+    client.transport = transport
+    client.session_token = "replay"
+    client.session_state_enabled = False
+    client.set_log_raw_streaming(False)
+    return client
+
+
+def bench_requests(corpus: Dict[str, Any], repeat: int, debug: bool) -> Dict[str, List[float]]:
+    client = make_client(ReplayTransport(corpus["requests"]))
+    client.set_debug(debug)
+    timings = defaultdict(list)
+    for _ in range(repeat):
+        st.session_state.api_logs = new_log_store()
+        for req in corpus["requests"]:
+            body = req["body"] or {}
+            start = time.perf_counter()
+            client._make_request(req["path"], method=req["method"], data=body.get("data") if req["body"] is not None else None)
+            timings[endpoint_group(req)].append(time.perf_counter() - start)
+    return timings
+
+
+def bench_streams(corpus: Dict[str, Any], repeat: int) -> List[float]:
+    client = make_client(None)
+    prepared = [(stream["project"], rechunk(stream)) for stream in corpus["streams"]]
+    timings = []
+    for _ in range(repeat):
+        for project, chunks in prepared:
+            fresh_cache(project)
+            response = ReplayResponse(200, "", chunks)
+            start = time.perf_counter()
+            for _ in client.process_streaming_response(response, project):
+                pass
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def bench_data_mods(corpus: Dict[str, Any], repeat: int) -> tuple[List[float], int]:
+    client = make_client(None)
+    batches = [
+        (stream["project"], doc["response"]["data_mods"])
+        for stream in corpus["streams"]
+        for doc in stream["documents"]
+        if isinstance(doc, dict) and isinstance(doc.get("response"), dict) and isinstance(doc["response"].get("data_mods"), list)
+    ]
+    timings = []
+    for _ in range(repeat):
+        for project, mods in batches:
+            fresh_cache(project)
+            start = time.perf_counter()
+            client.apply_user_data_mods(json.loads(json.dumps(mods)))
+            timings.append(time.perf_counter() - start)
+    return timings, sum(len(mods) for _, mods in batches)
+
+
+def record(path: str):
+    """Drive a short session against the mock backend with debug and raw-stream logging on"""
+    from mock_backend import MockBackend, MockOptions
+
+    with MockBackend(options=MockOptions(stream_delay_ms=0, scrape_seconds=0)) as backend:
+        client = main.APIClient(backend.base_url)
+        client.session_state_enabled = False
+        client.set_debug(True)
+        client.set_log_raw_streaming(True)
+        st.session_state.api_logs = new_log_store()
+        client.login("replay@example.com", "replay")
+        for project in client.get_project_list():
+            client.get_project_mod_count(project)
+            client.get_project_data(project)
+            client.get_project_reel_tasks(project)
+            for mode in ("text", "mods"):
+                backend.state.options.stream_mode = mode
+                fresh_cache(project)
+                for _ in client.process_streaming_response(client.ai_chat(project, f"Hooks for {project}?"), project):
+                    pass
+        for task in client.get_tracking_tasks():
+            client.get_task_details(task["_id"])
+            client.get_sentiment_summary(task["_id"])
+            client.get_task_status(task["_id"])
+            client.get_task_status(task["_id"], logs_count=50)
+        corpus = build_replay_corpus(st.session_state.api_logs.full_entries(), backend.base_url)
+    with open(path, "w", encoding="utf-8") as out:
+        out.write(dump_replay_corpus(corpus))
+    print(f"Recorded {len(corpus['requests'])} requests and {len(corpus['streams'])} streams to {path}")
+
+
+def summarize(name: str, timings: List[float], recorded_ms: List[float] = ()):
+    if not timings:
+        print(f"{name:<44} {'-':>6}")
+        return
+    ordered = sorted(timings)
+    p95 = ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+    recorded = f"{statistics.median(recorded_ms):>10.0f}" if recorded_ms else f"{'-':>10}"
+    print(f"{name:<44} {len(timings):>6} {statistics.mean(timings) * 1e6:>10.1f} {p95 * 1e6:>10.1f} {recorded}")
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("corpus", nargs="?", help="replay corpus exported from the debug sidebar")
+    parser.add_argument("--record", metavar="PATH", help="record a corpus from the mock backend to PATH and exit")
+    parser.add_argument("--repeat", type=int, default=5, help="passes over the corpus")
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.record)
+        return
+    if not args.corpus:
+        parser.error("a corpus path (or --record PATH) is required")
+
+    corpus = load_replay_corpus(args.corpus)
+    print(f"Corpus: {len(corpus['requests'])} requests, {len(corpus['streams'])} streams "
+          f"({corpus.get('skipped_entries', 0)} log entries skipped at export), {args.repeat} passes")
+    print(f"{'case':<44} {'calls':>6} {'mean us':>10} {'p95 us':>10} {'server ms':>10}")
+
+    recorded = defaultdict(list)
+    for req in corpus["requests"]:
+        if req.get("duration_ms") is not None:
+            recorded[endpoint_group(req)].append(req["duration_ms"])
+    for debug in (False, True):
+        timings = bench_requests(corpus, args.repeat, debug)
+        label = "make_request+debug" if debug else "make_request"
+        summarize(label, [t for values in timings.values() for t in values], [d for values in recorded.values() for d in values])
+        if not debug:
+            for group in sorted(timings):
+                summarize(f"  {group}", timings[group], recorded[group])
+    summarize("process_streaming_response", bench_streams(corpus, args.repeat))
+    mod_timings, mod_count = bench_data_mods(corpus, args.repeat)
+    summarize(f"apply_user_data_mods ({mod_count} mods)", mod_timings)
+
+
+if __name__ == "__main__":
+    main_cli()
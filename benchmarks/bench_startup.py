@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark: import phase and first login-page render.
+
+Every sample runs in a fresh interpreter so nothing is already in
+sys.modules, and reports:
+
+- import_main: wall time of `import main` (bare mode, no server)
+- login_render: wall time of the first AppTest run of main.py on the login
+  page, which includes the app's own imports and the first render
+- which heavy analytics modules (pandas, numpy, plotly.express) got loaded
+  along the way; none of them should be needed for the login page
+
+No backend is contacted. Run from the repository root:
+    python benchmarks/bench_startup.py --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+HEAVY_MODULES = ["pandas", "numpy", "plotly.express", "plotly.subplots"]
+
+_IMPORT_MAIN = """
+import json, logging, sys, time
+logging.disable(logging.WARNING)
+start = time.perf_counter()
+import main  # noqa: F401
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "loaded": [m for m in %(heavy)r if m in sys.modules]}))
+"""
+
+_LOGIN_RENDER = """
+import json, logging, os, sys, time
+logging.disable(logging.WARNING)
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(os.path.abspath("main.py"), default_timeout=60)
+start = time.perf_counter()
+at.run()
+elapsed = time.perf_counter() - start
+if at.exception:
+    raise SystemExit(f"login page raised: {at.exception[0].value}")
+print(json.dumps({"seconds": elapsed, "loaded": [m for m in %(heavy)r if m in sys.modules]}))
+"""
+
+
+def sample(code: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", code % {"heavy": HEAVY_MODULES}],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per phase (median and min are reported)")
+    args = parser.parse_args()
+
+    print(f"{'phase':<14} {'median ms':>10} {'min ms':>8}  heavy modules loaded")
+    for name, code in (("import_main", _IMPORT_MAIN), ("login_render", _LOGIN_RENDER)):
+        samples = [sample(code) for _ in range(args.runs)]
+        times = [s["seconds"] * 1000 for s in samples]
+        loaded = sorted({m for s in samples for m in s["loaded"]})
+        print(f"{name:<14} {statistics.median(times):>10.0f} {min(times):>8.0f}  {', '.join(loaded) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for the AI streaming response decoder.
+
+Builds a large synthetic /codvid-ai/ai/respond stream (text pieces plus
+data_mods), replays it with several chunking patterns and measures
+JSONStreamDecoder against two baselines:
+
+- per_chunk: the previous json.loads-per-chunk approach, which drops any
+  document that is split or coalesced (its "documents" column shows the loss)
+- rescan: an accumulate-and-retry raw_decode loop, which re-parses the whole
+  pending document after every chunk
+
+The no_newlines pattern removes the separators so the decoder has to use
+its scanner mode.
+
+Run from the repository root:
+    python benchmarks/bench_stream_decoder.py --documents 20000
+"""
+
+import argparse
+import codecs
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from services.stream_decoder import JSONStreamDecoder  # noqa: E402
+
+
+def build_stream(documents: int, seed: int = 7) -> tuple[bytes, int]:
+    rng = random.Random(seed)
+    lines = []
+    for i in range(documents):
+        response = {"text": " ".join(rng.choice(["reel", "hook", "trend", "caption", "engagement", "✨"]) for _ in range(rng.randint(3, 40)))}
+        if i % 10 == 0:
+            response["data_mods"] = [
+                {
+                    "key_path": ["projects", "demo", "chats"],
+                    "mode": "append",
+                    "value": {"role": "assistant", "type": "text", "text": "x" * rng.randint(50, 2000)},
+                }
+                for _ in range(rng.randint(1, 20))
+            ]
+        lines.append(json.dumps({"result": True, "response": response}))
+    return "\n".join(lines).encode("utf-8"), documents
+
+
+def chunk_stream(data: bytes, pattern: str, seed: int = 11) -> list[bytes]:
+    rng = random.Random(seed)
+    if pattern == "aligned":
+        return [line + b"\n" for line in data.split(b"\n")]
+    if pattern == "no_newlines":
+        # Documents back to back without separators exercise the scanner mode
+        data, pattern = data.replace(b"\n", b""), "network"
+    sizes = {"tiny": (1, 64), "network": (512, 16384), "coalesced": (65536, 262144)}[pattern]
+    chunks, i = [], 0
+    while i < len(data):
+        size = rng.randint(*sizes)
+        chunks.append(data[i:i + size])
+        i += size
+    return chunks
+
+
+def run_incremental(chunks: list[bytes]) -> int:
+    decoder = JSONStreamDecoder()
+    count = 0
+    for chunk in chunks:
+        count += len(decoder.feed(chunk))
+    return count + len(decoder.finish())
+
+
+def run_per_chunk(chunks: list[bytes]) -> int:
+    count = 0
+    for chunk in chunks:
+        try:
+            json.loads(chunk)
+            count += 1
+        except ValueError:
+            continue
+    return count
+
+
+def run_rescan(chunks: list[bytes]) -> int:
+    decoder = json.JSONDecoder()
+    bytes_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer, count = "", 0
+    for chunk in chunks:
+        buffer += bytes_decoder.decode(chunk)
+        while True:
+            stripped = buffer.lstrip()
+            if not stripped:
+                buffer = ""
+                break
+            try:
+                _, end = decoder.raw_decode(stripped)
+            except ValueError:
+                buffer = stripped
+                break
+            count += 1
+            buffer = stripped[end:]
+    return count
+
+
+def bench(fn, chunks: list[bytes], repeat: int) -> tuple[float, int]:
+    best, count = float("inf"), 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = fn(chunks)
+        best = min(best, time.perf_counter() - start)
+    return best, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=20000, help="documents in the replayed stream")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case (best time is reported)")
+    parser.add_argument("--patterns", nargs="+", default=["aligned", "network", "tiny", "coalesced", "no_newlines"])
+    parser.add_argument("--skip-rescan", action="store_true", help="skip the quadratic rescan baseline")
+    args = parser.parse_args()
+
+    data, expected = build_stream(args.documents)
+    mb = len(data) / 1_000_000
+    print(f"Stream: {expected} documents, {mb:.1f} MB")
+    print(f"{'pattern':<10} {'decoder':<12} {'chunks':>8} {'documents':>10} {'MB/s':>9} {'docs/s':>11}")
+
+    decoders = [("incremental", run_incremental), ("per_chunk", run_per_chunk)]
+    if not args.skip_rescan:
+        decoders.append(("rescan", run_rescan))
+    for pattern in args.patterns:
+        chunks = chunk_stream(data, pattern)
+        for name, fn in decoders:
+            elapsed, count = bench(fn, chunks, args.repeat)
+            print(f"{pattern:<10} {name:<12} {len(chunks):>8} {count:>10} {mb / elapsed:>9.1f} {count / elapsed:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Multi-session load test for the Streamlit app.
+
+Starts the app exactly as run.py does (streamlit run main.py, headless, on a
+free port) against benchmarks/mock_backend.py, then drives simulated browser
+sessions over Streamlit's websocket protocol. Each session clicks through the
+real page flows with real widget events:
+
+    login page -> login -> [profile details -> dashboard -> project chat ->
+    chat streaming -> tracker -> project chat -> dashboard] x iterations
+
+A step's render time runs from sending the widget event to the end of the
+script run it triggers, including any st.rerun() and the AI stream. Each
+concurrency level gets a fresh server, warmed up by one session, so that:
+
+- per-page p50/p95 render times are comparable between levels
+- memory per session is (server RSS with every session connected - RSS after
+  warm-up) / sessions, read from /proc (Linux only)
+- the saturation point is the first level whose overall p95 exceeds
+  --slo-factor x the single-session p95, or whose throughput grows by less
+  than 10% over the previous level
+
+Needs the websockets package (installed with Streamlit >= 1.5x). Run from
+the repository root:
+    python benchmarks/load_test.py --levels 1 2 4 8 16 --iterations 3
+    python benchmarks/load_test.py --latency-ms 80 --jitter-ms 40 --json load.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Dict, List, Optional
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+try:
+    from websockets.asyncio.client import connect
+except ImportError:  # pragma: no cover - depends on the installed Streamlit
+    sys.exit("benchmarks/load_test.py needs websockets >= 13: pip install 'websockets>=13'")
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+PAGES = ["login_page", "login", "profile_details", "dashboard", "project_chat", "chat_stream", "project_tracker"]
+
+_FINISHED = {ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_WITH_COMPILE_ERROR}
+
+
+class StepError(Exception):
+    pass
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _rss_bytes(pid: int) -> Optional[int]:
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(int(round(pct / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def _wait_http(url: str, timeout: float):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"{url} did not come up within {timeout:.0f}s")
+
+
+class AppSession:
+    """One simulated browser tab: sends widget events and waits for the script run to finish"""
+
+    def __init__(self, url: str, step_timeout: float):
+        self.url = url
+        self.step_timeout = step_timeout
+        self.ws = None
+        self.widgets: List[Dict[str, str]] = []
+
+    async def connect(self):
+        self.ws = await connect(self.url, subprotocols=["streamlit"], max_size=None, open_timeout=self.step_timeout)
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    async def rerun(self, states: List[WidgetState] = ()) -> float:
+        """Send a rerun with the given widget states; returns seconds until the run finished"""
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.widget_states.widgets.extend(states)
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        widgets, errors = [], []
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await asyncio.wait_for(self.ws.recv(), self.step_timeout))
+            kind = forward.WhichOneof("type")
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                element_type = element.WhichOneof("type")
+                inner = getattr(element, element_type)
+                if element_type == "exception":
+                    errors.append(inner.message)
+                widget_id = getattr(inner, "id", "")
+                if widget_id.startswith("$$ID-"):
+                    widgets.append({
+                        "type": element_type,
+                        "label": getattr(inner, "label", ""),
+                        "form": getattr(inner, "form_id", ""),
+                        "key": widget_id.split("-", 2)[2],
+                        "id": widget_id,
+                    })
+            elif kind == "script_finished":
+                if forward.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    # st.rerun(): the next run belongs to the same step
+                    widgets, errors = [], []
+                elif forward.script_finished in _FINISHED:
+                    elapsed = time.perf_counter() - start
+                    self.widgets = widgets
+                    if errors:
+                        raise StepError(f"script raised: {errors[0]}")
+                    return elapsed
+
+    def find(self, label: str = None, key: str = None, form: str = "") -> str:
+        for widget in self.widgets:
+            if key is not None and widget["key"] != key:
+                continue
+            if label is not None and (widget["label"] != label or widget["form"] != form):
+                continue
+            return widget["id"]
+        raise StepError(f"widget not found on page (label={label!r}, key={key!r})")
+
+    async def click(self, label: str = None, key: str = None) -> float:
+        return await self.rerun([WidgetState(id=self.find(label=label, key=key), trigger_value=True)])
+
+    async def submit(self, form: str, submit_label: str, values: Dict[str, str]) -> float:
+        states = [WidgetState(id=self.find(label=label, form=form), string_value=value) for label, value in values.items()]
+        states.append(WidgetState(id=self.find(label=submit_label, form=form), trigger_value=True))
+        return await self.rerun(states)
+
+
+async def run_session(url: str, email: str, iterations: int, think: float, step_timeout: float,
+                      timings: Dict[str, List[float]], failures: List[str], connected: asyncio.Event,
+                      release: asyncio.Event, done_counter: List[int], sessions: int):
+    """Drive one session through the flows, then stay connected until every session is done"""
+    session = AppSession(url, step_timeout)
+
+    async def step(page: str, action):
+        elapsed = await action
+        timings.setdefault(page, []).append(elapsed)
+        if think:
+            await asyncio.sleep(think)
+
+    try:
+        await session.connect()
+        await step("login_page", session.rerun())
+        await step("login", session.submit("login_form", "Login", {"Email": email, "Password": "load-test"}))
+        for i in range(iterations):
+            await step("profile_details", session.click(key="own_profile_view"))
+            await step("dashboard", session.click(label="Back to Dashboard"))
+            await step("project_chat", session.click(key="quick_chat"))
+            await step("chat_stream", session.submit("chat_form", "Send Message", {"Type your message...": f"Ideas for reel #{i + 1}?"}))
+            await step("project_tracker", session.click(key="tracker_button"))
+            await step("project_chat", session.click(label="Chat"))
+            await step("dashboard", session.click(key="home_button"))
+    except Exception as e:  # a failed step ends this session's flow but not the run
+        failures.append(f"{email}: {type(e).__name__}: {e}")
+    finally:
+        done_counter[0] += 1
+        if done_counter[0] == sessions:
+            connected.set()
+        # Hold the session open so the memory sample sees every session at once
+        await release.wait()
+        await session.close()
+
+
+class Server:
+    """The app under test (launched like run.py), or an already running one"""
+
+    def __init__(self, backend_url: str, external_url: Optional[str] = None):
+        self.backend_url = backend_url
+        self.external_url = external_url
+        self.process: Optional[subprocess.Popen] = None
+        self.port = None
+
+    def __enter__(self) -> "Server":
+        if self.external_url:
+            return self
+        self.port = _free_port()
+        env = dict(os.environ, APP_ENV="local", CODVID_LOCAL_API_URL=self.backend_url)
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "streamlit", "run", "main.py",
+             "--server.port", str(self.port), "--server.address", "127.0.0.1",
+             "--server.headless", "true", "--browser.gatherUsageStats", "false"],
+            cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        _wait_http(f"http://127.0.0.1:{self.port}/_stcore/health", 60)
+        return self
+
+    def __exit__(self, *exc):
+        if self.process is not None:
+            self.process.terminate()
+            self.process.wait(timeout=30)
+
+    @property
+    def ws_url(self) -> str:
+        base = self.external_url or f"http://127.0.0.1:{self.port}"
+        return base.rstrip("/").replace("http", "ws", 1) + "/_stcore/stream"
+
+    def rss(self) -> Optional[int]:
+        return _rss_bytes(self.process.pid) if self.process is not None else None
+
+
+async def run_level(server: Server, sessions: int, args, run_id: str) -> Dict:
+    timings: Dict[str, List[float]] = {}
+    failures: List[str] = []
+    all_done, release = asyncio.Event(), asyncio.Event()
+    done_counter = [0]
+    think = args.think_ms / 1000
+    start = time.perf_counter()
+    tasks = [
+        asyncio.create_task(run_session(
+            server.ws_url, f"load-{run_id}-{sessions}-{i}@example.com", args.iterations, think,
+            args.step_timeout, timings, failures, all_done, release, done_counter, sessions,
+        ))
+        for i in range(sessions)
+    ]
+    await all_done.wait()
+    wall = time.perf_counter() - start
+    rss = server.rss()
+    release.set()
+    await asyncio.gather(*tasks)
+    steps = sum(len(v) for v in timings.values())
+    all_times = [t for v in timings.values() for t in v]
+    return {
+        "sessions": sessions,
+        "wall_seconds": wall,
+        "steps": steps,
+        "throughput": steps / wall if wall else 0.0,
+        "p50_ms": statistics.median(all_times) * 1000 if all_times else None,
+        "p95_ms": _percentile(all_times, 95) * 1000 if all_times else None,
+        "pages": {
+            page: {"count": len(v), "p50_ms": statistics.median(v) * 1000, "p95_ms": _percentile(v, 95) * 1000}
+            for page, v in timings.items()
+        },
+        "rss_bytes": rss,
+        "failures": failures,
+    }
+
+
+def _find_saturation(results: List[Dict], slo_factor: float) -> Optional[Dict]:
+    baseline = results[0]["p95_ms"] if results and results[0]["p95_ms"] else None
+    for previous, level in zip([None] + results, results):
+        if baseline and level["p95_ms"] and level["p95_ms"] > baseline * slo_factor:
+            return {"sessions": level["sessions"], "reason": f"p95 {level['p95_ms']:.0f} ms > {slo_factor:g}x single-session p95"}
+        if previous and level["throughput"] < previous["throughput"] * 1.1:
+            return {"sessions": level["sessions"], "reason": f"throughput {level['throughput']:.1f} steps/s gained < 10% over {previous['sessions']} sessions"}
+    return None
+
+
+def _print_level(level: Dict, baseline_rss: Optional[int]):
+    per_session = None
+    if level["rss_bytes"] and baseline_rss:
+        per_session = (level["rss_bytes"] - baseline_rss) / level["sessions"]
+        level["memory_per_session_bytes"] = per_session
+    memory = f"{per_session / 1024 / 1024:.1f} MB/session" if per_session is not None else "memory n/a"
+    print(f"\n{level['sessions']} session(s): {level['steps']} steps in {level['wall_seconds']:.1f}s, "
+          f"{level['throughput']:.1f} steps/s, {memory}, {len(level['failures'])} failure(s)")
+    print(f"  {'page':<16} {'count':>6} {'p50 ms':>8} {'p95 ms':>8}")
+    for page in PAGES:
+        stats = level["pages"].get(page)
+        if stats:
+            print(f"  {page:<16} {stats['count']:>6} {stats['p50_ms']:>8.0f} {stats['p95_ms']:>8.0f}")
+    for failure in level["failures"][:5]:
+        print(f"  ! {failure}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="concurrent sessions per level")
+    parser.add_argument("--iterations", type=int, default=2, help="page-flow loops per session")
+    parser.add_argument("--think-ms", type=float, default=250, help="pause between a session's steps")
+    parser.add_argument("--step-timeout", type=float, default=120, help="seconds before a step counts as failed")
+    parser.add_argument("--slo-factor", type=float, default=2.0, help="p95 growth over one session that counts as saturated")
+    parser.add_argument("--latency-ms", type=float, default=50, help="mock backend latency")
+    parser.add_argument("--jitter-ms", type=float, default=25, help="mock backend latency jitter")
+    parser.add_argument("--stream-pieces", type=int, default=20, help="mock AI reply pieces")
+    parser.add_argument("--stream-delay-ms", type=float, default=20, help="mock AI delay between pieces")
+    parser.add_argument("--url", help="drive an already running app instead (no restarts, no memory figures)")
+    parser.add_argument("--backend-url", help="with --url: the backend that app talks to (default: start the mock)")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    mock = None
+    backend_url = args.backend_url
+    if not backend_url:
+        port = _free_port()
+        backend_url = f"http://127.0.0.1:{port}"
+        mock = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, "benchmarks", "mock_backend.py"), "--port", str(port),
+             "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms),
+             "--stream-pieces", str(args.stream_pieces), "--stream-delay-ms", str(args.stream_delay_ms)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+    run_id = str(int(time.time()))
+    results = []
+    try:
+        print(f"Mock backend {backend_url}; levels {args.levels}, {args.iterations} iteration(s), think {args.think_ms:g} ms")
+        for sessions in args.levels:
+            with Server(backend_url, args.url) as server:
+                # One full warm-up flow loads the lazily imported pages before measuring
+                asyncio.run(run_level(server, 1, argparse.Namespace(**dict(vars(args), iterations=1)), f"{run_id}w"))
+                baseline_rss = server.rss()
+                level = asyncio.run(run_level(server, sessions, args, run_id))
+            _print_level(level, baseline_rss)
+            results.append(level)
+    finally:
+        if mock is not None:
+            mock.terminate()
+            mock.wait(timeout=30)
+
+    saturation = _find_saturation(results, args.slo_factor)
+    if saturation:
+        print(f"\nSaturation point: {saturation['sessions']} concurrent sessions ({saturation['reason']})")
+    else:
+        print(f"\nSaturation point: not reached up to {args.levels[-1]} concurrent sessions")
+    if args.json:
+        with open(args.json, "w") as out:
+            json.dump({"levels": results, "saturation": saturation, "args": vars(args)}, out, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,653 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the CodVid.AI backend, for offline load and integration testing.
+
+Implements the endpoints APIClient uses (auth, user, project, ai/respond
+streaming with data_mods, ig-tracking) over plain HTTP with in-memory state,
+deterministic fixture data and configurable latency, so the app, the load
+tests and the benchmarks can run reproducibly without network access.
+
+- Logging in with an unknown email creates the account (signup works too),
+  so load tests can use any number of throwaway users. Each new account is
+  seeded with projects, chats, tracked profiles with scraped posts and
+  comments, and reel tasks, derived from --seed and the email.
+- Every request waits --latency-ms plus up to --jitter-ms first; force
+  scrapes run for --scrape-seconds, during which the task status reports
+  is_processing with progress logs.
+- ai/respond streams --stream-pieces newline-delimited JSON documents,
+  --stream-delay-ms apart. In "text" mode the reply arrives as text pieces
+  and a final data_mods document appends the user message; in "mods" mode
+  the whole exchange arrives as data_mods appending both messages to
+  projects/<name>/chats. Server-side mod_count advances like the real one.
+- --error-rate makes that fraction of non-streaming requests fail with 503.
+
+Run from the repository root, then point the app at it:
+    python benchmarks/mock_backend.py --port 8080 --latency-ms 80 --jitter-ms 40
+    APP_ENV=local streamlit run main.py
+
+The local environment URL can be moved with CODVID_LOCAL_API_URL. Other
+scripts can run the server in-process with MockBackend(...).start().
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+_WORDS = ["hook", "reel", "trend", "caption", "audio", "engagement", "story", "carousel", "creator",
+          "audience", "retention", "thumbnail", "posting", "schedule", "collab", "hashtag"]
+_COMMENTS = {
+    "positive": ["Love this!", "So good 🔥", "Best one yet", "This is amazing", "Saving this 🙌"],
+    "neutral": ["Where is this?", "First", "What song is this?", "Interesting", "👀"],
+    "negative": ["Not a fan", "Too long", "Seen this before", "Meh", "Audio is off"],
+}
+_SENTIMENTS = ["positive", "positive", "neutral", "negative"]
+
+
+def _new_id() -> str:
+    return uuid.uuid4().hex[:24]
+
+
+class MockOptions:
+    """Behaviour knobs for the mock backend (see the module docstring)"""
+
+    def __init__(self, latency_ms: float = 0, jitter_ms: float = 0, error_rate: float = 0.0,
+                 scrape_seconds: float = 2.0, stream_pieces: int = 20, stream_delay_ms: float = 30,
+                 stream_mode: str = "text", projects: int = 2, chat_messages: int = 20,
+                 profiles: int = 3, posts: int = 30, comments: int = 8, reels: int = 5, seed: int = 7):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.scrape_seconds = scrape_seconds
+        self.stream_pieces = stream_pieces
+        self.stream_delay_ms = stream_delay_ms
+        self.stream_mode = stream_mode
+        self.projects = projects
+        self.chat_messages = chat_messages
+        self.profiles = profiles
+        self.posts = posts
+        self.comments = comments
+        self.reels = reels
+        self.seed = seed
+
+
+class MockState:
+    """In-memory accounts, projects and tracking tasks, guarded by one lock"""
+
+    def __init__(self, options: MockOptions):
+        self.options = options
+        self.lock = threading.Lock()
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.tokens: Dict[str, str] = {}
+
+    # ---------- Fixtures ----------
+    def _rng(self, *parts: str) -> random.Random:
+        digest = hashlib.sha256("|".join([str(self.options.seed), *parts]).encode("utf-8")).hexdigest()
+        return random.Random(int(digest[:16], 16))
+
+    def _sentence(self, rng: random.Random, words: int) -> str:
+        return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+    def _comments(self, rng: random.Random, now: float) -> List[Dict]:
+        comments = []
+        for i in range(self.options.comments):
+            sentiment = rng.choice(_SENTIMENTS)
+            comments.append({
+                "owner_username": f"fan_{rng.randint(100, 9999)}",
+                "text": rng.choice(_COMMENTS[sentiment]),
+                "sentiment": sentiment,
+                "likes_count": rng.randint(0, 500),
+                "timestamp": now - rng.randint(60, 86400 * 7),
+            })
+        return comments
+
+    def _posts(self, rng: random.Random, now: float) -> List[Dict]:
+        posts = []
+        for i in range(self.options.posts):
+            is_video = rng.random() < 0.6
+            shortcode = uuid.UUID(int=rng.getrandbits(128)).hex[:11]
+            posts.append({
+                "id": str(rng.getrandbits(60)),
+                "shortcode": shortcode,
+                "url": f"https://www.instagram.com/p/{shortcode}/",
+                "type": "Video" if is_video else "Image",
+                "caption": self._sentence(rng, rng.randint(4, 20)),
+                "likes": rng.randint(50, 50000),
+                "comments_count": rng.randint(0, 2000),
+                "video_view_count": rng.randint(1000, 500000) if is_video else None,
+                "timestamp": now - (i + 1) * 86400 * rng.uniform(0.5, 2.5),
+                "top_comments": self._comments(rng, now),
+            })
+        return posts
+
+    def _profile_task(self, rng: random.Random, handle: str, is_competitor: bool, now: float, scraped: bool) -> Dict:
+        interval = 2.0
+        last_scraped = now - rng.randint(600, 86400) if scraped else None
+        return {
+            "_id": _new_id(),
+            "target_profile": handle,
+            "is_competitor": is_competitor,
+            "status": "active",
+            "created_at": now - 86400 * 30,
+            "last_scraped": last_scraped,
+            "scrape_interval_days": interval,
+            "next_scrape_due": (last_scraped or now) + interval * 86400,
+            "scraped_posts": self._posts(rng, now) if scraped else [],
+            "logs": [],
+            "processing_until": 0.0,
+        }
+
+    def _reel_task(self, rng: random.Random, project_name: str, reel_url: str, interval: float, now: float, scraped: bool) -> Dict:
+        match = re.search(r"/(?:reel|reels|p)/([A-Za-z0-9_-]+)", reel_url)
+        reel_id = match.group(1) if match else uuid.UUID(int=rng.getrandbits(128)).hex[:11]
+        task = {
+            "_id": _new_id(),
+            "reel_id": reel_id,
+            "reel_url": reel_url,
+            "project_name": project_name,
+            "status": "active",
+            "scrape_interval_days": interval,
+            "last_scraped": now - rng.randint(600, 86400) if scraped else None,
+            "reel_data": None,
+            "logs": [],
+            "processing_until": 0.0,
+        }
+        if scraped:
+            task["reel_data"] = self._reel_data(rng, now)
+        return task
+
+    def _reel_data(self, rng: random.Random, now: float) -> Dict:
+        comments = [{"text": c["text"], "author": c["owner_username"], "likes": c["likes_count"], "sentiment": c["sentiment"]}
+                    for c in self._comments(rng, now)]
+        counts = {s: sum(1 for c in comments if c["sentiment"] == s) for s in ("positive", "neutral", "negative")}
+        return {
+            "likes": rng.randint(100, 100000),
+            "comments": rng.randint(0, 5000),
+            "views": rng.randint(1000, 2000000),
+            "caption": self._sentence(rng, rng.randint(4, 16)),
+            "hashtags": rng.sample(_WORDS, 3),
+            "mentions": [f"creator_{rng.randint(1, 99)}"],
+            "top_comments": comments,
+            "sentiment_analysis": dict(counts, overall_sentiment=max(counts, key=counts.get) if comments else "neutral"),
+        }
+
+    def _seed_account(self, email: str) -> Dict:
+        rng = self._rng(email)
+        now = time.time()
+        projects, tasks, reel_tasks = {}, {}, {}
+        for p in range(self.options.projects):
+            name = f"Campaign {p + 1}"
+            chats = []
+            for m in range(self.options.chat_messages):
+                role = "user" if m % 2 == 0 else "assistant"
+                chats.append({"role": role, "type": "text", "text": self._sentence(rng, rng.randint(5, 60 if role == "assistant" else 15))})
+            projects[name] = {"chats": chats, "mod_count": self.options.chat_messages}
+            for r in range(self.options.reels):
+                shortcode = uuid.UUID(int=rng.getrandbits(128)).hex[:11]
+                reel = self._reel_task(rng, name, f"https://www.instagram.com/reel/{shortcode}/", 2.0, now, scraped=True)
+                reel_tasks[reel["_id"]] = reel
+        for i in range(self.options.profiles):
+            task = self._profile_task(rng, f"brand_{i + 1}" if i else "my_brand", i > 0, now, scraped=True)
+            tasks[task["_id"]] = task
+        return {"email": email, "password": None, "projects": projects, "tasks": tasks, "reel_tasks": reel_tasks}
+
+    # ---------- Accounts ----------
+    def login(self, email: str, password: str) -> Optional[str]:
+        with self.lock:
+            user = self.users.get(email)
+            if user is None:
+                user = self._seed_account(email)
+                user["password"] = password
+                self.users[email] = user
+            elif user["password"] != password:
+                return None
+            token = uuid.uuid4().hex
+            self.tokens[token] = email
+            return token
+
+    def signup(self, email: str, password: str) -> bool:
+        with self.lock:
+            if email in self.users:
+                return False
+            user = self._seed_account(email)
+            user["password"] = password
+            self.users[email] = user
+            return True
+
+    def user_for(self, token: Optional[str]) -> Optional[Dict]:
+        with self.lock:
+            email = self.tokens.get(token or "")
+            return self.users.get(email) if email else None
+
+    def delete_user(self, user: Dict):
+        with self.lock:
+            self.users.pop(user["email"], None)
+            for token in [t for t, e in self.tokens.items() if e == user["email"]]:
+                del self.tokens[token]
+
+    # ---------- Scraping ----------
+    def start_scrape(self, task: Dict, kind: str):
+        now = time.time()
+        with self.lock:
+            task["processing_until"] = now + self.options.scrape_seconds
+            task["logs"].append({"timestamp": now, "event_type": "scrape_started", "message": f"Started {kind} scrape"})
+
+    def finish_scrape(self, task: Dict, kind: str):
+        rng = self._rng(task["_id"], str(len(task["logs"])))
+        now = time.time()
+        with self.lock:
+            task["processing_until"] = 0.0
+            task["last_scraped"] = now
+            if kind == "reel":
+                task["reel_data"] = self._reel_data(rng, now)
+                task["logs"].append({"timestamp": now, "event_type": "scrape_completed", "message": "Reel scraped"})
+            else:
+                task["scraped_posts"] = self._posts(rng, now)
+                task["next_scrape_due"] = now + task["scrape_interval_days"] * 86400
+                task["logs"].append({"timestamp": now, "event_type": "scrape_completed",
+                                     "message": f"Scraped {len(task['scraped_posts'])} posts",
+                                     "scraped_posts_count": len(task["scraped_posts"])})
+
+    def task_status(self, task: Dict, logs_count: int) -> Dict:
+        now = time.time()
+        with self.lock:
+            is_processing = task["processing_until"] > now
+            logs = list(task["logs"])
+            if is_processing:
+                started = task["processing_until"] - self.options.scrape_seconds
+                progress = min(int((now - started) / max(self.options.scrape_seconds, 0.001) * 100), 99)
+                logs.append({"timestamp": now, "event_type": "scrape_progress", "message": f"Scraping... {progress}%",
+                             "processing_progress": f"{progress}%"})
+        latest = logs[-1] if logs else None
+        return {
+            "task_id": task["_id"],
+            "is_processing": is_processing,
+            "logs": logs[-logs_count:],
+            "logs_count": len(logs),
+            "requested_logs_count": logs_count,
+            "latest_event": latest,
+        }
+
+
+def _public_task(task: Dict, details: bool = False) -> Dict:
+    hidden = {"logs", "processing_until"} if details else {"logs", "processing_until", "scraped_posts"}
+    return {k: v for k, v in task.items() if k not in hidden}
+
+
+def _sentiment_summary(task: Dict) -> Dict:
+    counts = {"positive": 0, "negative": 0, "neutral": 0}
+    for post in task.get("scraped_posts") or []:
+        for comment in post.get("top_comments") or []:
+            counts[comment.get("sentiment", "neutral")] += 1
+    total = sum(counts.values())
+    return {
+        "total_comments": total,
+        "overall_sentiment": max(counts, key=counts.get) if total else "neutral",
+        "sentiment_distribution": counts,
+        "sentiment_percentages": {k: (v / total * 100) if total else 0.0 for k, v in counts.items()},
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_MockHTTPServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    # ---------- Plumbing ----------
+    def _read_json(self) -> Dict:
+        """The request's data object (APIClient wraps it as {"schema_version", "data"})"""
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except ValueError:
+            return {}
+        data = body.get("data") if isinstance(body, dict) else None
+        return data if isinstance(data, dict) else {}
+
+    def _send_json(self, payload: Dict, status: int = 200):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _ok(self, response: Optional[Dict] = None, **extra):
+        self._send_json(dict({"result": True, "response": response or {}}, **extra))
+
+    def _fail(self, message: str, status: int = 200):
+        self._send_json({"result": False, "message": message}, status)
+
+    def _token(self) -> Optional[str]:
+        auth = self.headers.get("Authorization") or ""
+        return auth[7:] if auth.startswith("Bearer ") else None
+
+    def _dispatch(self):
+        options = self.server.state.options
+        delay = options.latency_ms + random.uniform(0, options.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+        url = urlsplit(self.path)
+        body = self._read_json()
+        route = url.path.rstrip("/")
+        if route != "/codvid-ai/ai/respond" and options.error_rate and random.random() < options.error_rate:
+            return self._fail("Injected failure", 503)
+        for method, pattern, handler in _ROUTES:
+            match = pattern.fullmatch(route)
+            if match and method == self.command:
+                if handler.__name__.startswith("auth_"):
+                    return handler(self, body)
+                user = self.server.state.user_for(self._token())
+                if user is None:
+                    return self._fail("Unauthorized", 401)
+                return handler(self, user, body, parse_qs(url.query), *match.groups())
+        self._fail(f"Unknown endpoint {self.command} {url.path}", 404)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+    # ---------- auth / user ----------
+    def auth_login(self, body):
+        token = self.server.state.login(body.get("email", ""), body.get("password", ""))
+        if token is None:
+            return self._fail("Invalid credentials")
+        self._send_json({"result": True, "token": token, "response": {}})
+
+    def auth_signup(self, body):
+        if not self.server.state.signup(body.get("email", ""), body.get("password", "")):
+            return self._fail("Account already exists")
+        self._ok()
+
+    def delete_account(self, user, body, query):
+        self.server.state.delete_user(user)
+        self._ok()
+
+    # ---------- project ----------
+    def project_list(self, user, body, query):
+        with self.server.state.lock:
+            self._ok({"project_list": list(user["projects"])})
+
+    def project_create(self, user, body, query):
+        name = body.get("project_name")
+        with self.server.state.lock:
+            if not name or name in user["projects"]:
+                return self._fail("Project already exists" if name else "project_name is required")
+            user["projects"][name] = {"chats": [], "mod_count": 0}
+        self._ok()
+
+    def project_delete(self, user, body, query):
+        name = body.get("project_name")
+        with self.server.state.lock:
+            if user["projects"].pop(name, None) is None:
+                return self._fail("Project not found")
+            for task_id in [tid for tid, t in user["reel_tasks"].items() if t["project_name"] == name]:
+                del user["reel_tasks"][task_id]
+        self._ok()
+
+    def project_data(self, user, body, query):
+        with self.server.state.lock:
+            project = user["projects"].get(body.get("project_name"))
+            if project is None:
+                return self._fail("Project not found")
+            self._ok({"project_data": json.loads(json.dumps(project))})
+
+    def project_mod_count(self, user, body, query):
+        with self.server.state.lock:
+            project = user["projects"].get(body.get("project_name"))
+            if project is None:
+                return self._fail("Project not found")
+            self._ok({"mod_count": project["mod_count"]})
+
+    # ---------- ai ----------
+    def ai_respond(self, user, body, query):
+        state = self.server.state
+        options = state.options
+        name = body.get("project_name")
+        message = body.get("message") or {}
+        with state.lock:
+            project = user["projects"].get(name)
+        if project is None:
+            return self._fail("Project not found")
+
+        rng = state._rng(name, str(message.get("text")), str(project["mod_count"]))
+        pieces = [state._sentence(rng, rng.randint(3, 12)) + " " for _ in range(max(options.stream_pieces, 1))]
+        reply = "".join(pieces).strip()
+        user_message = {"role": "user", "type": "text", "text": message.get("text", "")}
+        assistant_message = {"role": "assistant", "type": "text", "text": reply}
+        if options.stream_mode == "mods":
+            documents = [{"result": True, "response": {"data_mods": [
+                {"key_path": ["projects", name, "chats"], "mode": "append", "value": user_message},
+                {"key_path": ["projects", name, "chats"], "mode": "append", "value": assistant_message},
+            ]}}]
+        else:
+            documents = [{"result": True, "response": {"text": piece}} for piece in pieces]
+            documents.append({"result": True, "response": {"data_mods": [
+                {"key_path": ["projects", name, "chats"], "mode": "append", "value": user_message},
+            ]}})
+
+        with state.lock:
+            project["chats"].extend([user_message, assistant_message])
+            project["mod_count"] += 1
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for document in documents:
+            data = (json.dumps(document) + "\n").encode("utf-8")
+            self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+            self.wfile.flush()
+            if options.stream_delay_ms:
+                time.sleep(options.stream_delay_ms / 1000)
+        self.wfile.write(b"0\r\n\r\n")
+
+    # ---------- ig-tracking: profiles ----------
+    def _profile(self, user, task_id) -> Optional[Dict]:
+        with self.server.state.lock:
+            return user["tasks"].get(task_id) or user["reel_tasks"].get(task_id)
+
+    def profile_tasks(self, user, body, query):
+        with self.server.state.lock:
+            self._ok({"tasks": [_public_task(t) for t in user["tasks"].values()]})
+
+    def profile_task(self, user, body, query, task_id):
+        with self.server.state.lock:
+            task = user["tasks"].get(task_id)
+            if task is None:
+                return self._fail("Task not found")
+            self._ok({"task": _public_task(task, details=True)})
+
+    def profile_create(self, user, body, query):
+        handle = (body.get("target_profile") or "").strip().lstrip("@")
+        if not handle:
+            return self._fail("target_profile is required")
+        state = self.server.state
+        task = state._profile_task(state._rng(user["email"], handle), handle, bool(body.get("is_competitor")), time.time(), scraped=False)
+        with state.lock:
+            if any(t["target_profile"] == handle for t in user["tasks"].values()):
+                return self._fail("Profile is already tracked")
+            user["tasks"][task["_id"]] = task
+        self._ok({"task_id": task["_id"]})
+
+    def update_interval(self, user, body, query, task_id):
+        task = self._profile(user, task_id)
+        interval = body.get("scrape_interval_days")
+        if task is None:
+            return self._fail("Task not found")
+        if not isinstance(interval, (int, float)) or not 0.5 <= interval <= 30:
+            return self._fail("scrape_interval_days must be between 0.5 and 30")
+        with self.server.state.lock:
+            task["scrape_interval_days"] = interval
+            if "next_scrape_due" in task:
+                task["next_scrape_due"] = (task["last_scraped"] or time.time()) + interval * 86400
+        self._ok()
+
+    def force_scrape(self, user, body, query, task_id, kind="profile"):
+        task = self._profile(user, task_id)
+        if task is None:
+            return self._fail("Task not found")
+        state = self.server.state
+        state.start_scrape(task, kind)
+        time.sleep(state.options.scrape_seconds)
+        state.finish_scrape(task, kind)
+        self._ok()
+
+    def force_scrape_reel(self, user, body, query, task_id):
+        self.force_scrape(user, body, query, task_id, kind="reel")
+
+    def profile_delete(self, user, body, query, task_id):
+        with self.server.state.lock:
+            if user["tasks"].pop(task_id, None) is None:
+                return self._fail("Task not found")
+        self._ok()
+
+    def sentiment(self, user, body, query, task_id):
+        with self.server.state.lock:
+            task = user["tasks"].get(task_id)
+            if task is None:
+                return self._fail("Task not found")
+            self._ok({"sentiment_summary": _sentiment_summary(task)})
+
+    def status(self, user, body, query, task_id):
+        task = self._profile(user, task_id)
+        if task is None:
+            return self._fail("Task not found")
+        try:
+            logs_count = min(max(int(query.get("logs_count", ["10"])[0]), 1), 100)
+        except ValueError:
+            logs_count = 10
+        self._ok(self.server.state.task_status(task, logs_count))
+
+    # ---------- ig-tracking: reels ----------
+    def reel_create(self, user, body, query):
+        name, url = body.get("project_name"), body.get("reel_url")
+        if not name or not url:
+            return self._fail("project_name and reel_url are required")
+        state = self.server.state
+        task = state._reel_task(state._rng(user["email"], url), name, url, body.get("scrape_interval_days", 2), time.time(), scraped=False)
+        with state.lock:
+            if name not in user["projects"]:
+                return self._fail("Project not found")
+            user["reel_tasks"][task["_id"]] = task
+        self._ok({"task_id": task["_id"]})
+
+    def reel_tasks(self, user, body, query):
+        name = body.get("project_name")
+        with self.server.state.lock:
+            self._ok({"tasks": [_public_task(t) for t in user["reel_tasks"].values() if t["project_name"] == name]})
+
+    def reel_delete(self, user, body, query, task_id):
+        with self.server.state.lock:
+            if user["reel_tasks"].pop(task_id, None) is None:
+                return self._fail("Task not found")
+        self._ok()
+
+
+_IG = "/codvid-ai/ig-tracking"
+_ROUTES = [(method, re.compile(path), handler) for method, path, handler in [
+    ("POST", "/codvid-ai/auth/login", _Handler.auth_login),
+    ("POST", "/codvid-ai/auth/signup", _Handler.auth_signup),
+    ("POST", "/codvid-ai/user/delete-account", _Handler.delete_account),
+    ("POST", "/codvid-ai/project/get-project-list", _Handler.project_list),
+    ("POST", "/codvid-ai/project/create-project", _Handler.project_create),
+    ("POST", "/codvid-ai/project/delete-project", _Handler.project_delete),
+    ("POST", "/codvid-ai/project/get-project-data", _Handler.project_data),
+    ("POST", "/codvid-ai/project/get-project-mod-count", _Handler.project_mod_count),
+    ("POST", "/codvid-ai/ai/respond", _Handler.ai_respond),
+    ("GET", f"{_IG}/get_profile_tracking_tasks", _Handler.profile_tasks),
+    ("GET", f"{_IG}/get_profile_tracking_task/([^/]+)", _Handler.profile_task),
+    ("POST", f"{_IG}/create_profile_tracking_task", _Handler.profile_create),
+    ("PUT", f"{_IG}/update_profile_tracking_scrape_interval/([^/]+)", _Handler.update_interval),
+    ("POST", f"{_IG}/force_scrape_profile_tracking_task/([^/]+)", _Handler.force_scrape),
+    ("DELETE", f"{_IG}/delete_profile_tracking_task/([^/]+)", _Handler.profile_delete),
+    ("GET", f"{_IG}/sentiment_summary/([^/]+)", _Handler.sentiment),
+    ("GET", f"{_IG}/profile_tracking_task_status/([^/]+)", _Handler.status),
+    ("POST", f"{_IG}/create_reel_task", _Handler.reel_create),
+    ("POST", f"{_IG}/get_project_reel_tasks", _Handler.reel_tasks),
+    ("POST", f"{_IG}/force_scrape_reel/([^/]+)", _Handler.force_scrape_reel),
+    ("DELETE", f"{_IG}/delete_reel_task/([^/]+)", _Handler.reel_delete),
+]]
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    state: MockState
+
+
+class MockBackend:
+    """The mock backend on a background thread; use as a context manager or call start()/stop()"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, options: Optional[MockOptions] = None):
+        self.httpd = _MockHTTPServer((host, port), _Handler)
+        self.httpd.state = MockState(options or MockOptions())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def state(self) -> MockState:
+        return self.httpd.state
+
+    def start(self) -> str:
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="mock-backend", daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "MockBackend":
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency-ms", type=float, default=0, help="base delay before every response")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="extra uniform random delay per response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of non-streaming requests failing with 503")
+    parser.add_argument("--scrape-seconds", type=float, default=2.0, help="duration of a force scrape")
+    parser.add_argument("--stream-pieces", type=int, default=20, help="documents per ai/respond reply")
+    parser.add_argument("--stream-delay-ms", type=float, default=30, help="delay between streamed documents")
+    parser.add_argument("--stream-mode", choices=["text", "mods"], default="text", help="how the reply is delivered")
+    parser.add_argument("--projects", type=int, default=2, help="fixture projects per new account")
+    parser.add_argument("--chat-messages", type=int, default=20, help="fixture chat messages per project")
+    parser.add_argument("--profiles", type=int, default=3, help="fixture tracked profiles per new account")
+    parser.add_argument("--posts", type=int, default=30, help="scraped posts per profile")
+    parser.add_argument("--comments", type=int, default=8, help="top comments per post or reel")
+    parser.add_argument("--reels", type=int, default=5, help="fixture reel tasks per project")
+    parser.add_argument("--seed", type=int, default=7, help="fixture data seed")
+    args = parser.parse_args()
+
+    options = MockOptions(**{k: v for k, v in vars(args).items() if k not in ("host", "port")})
+    backend = MockBackend(args.host, args.port, options)
+    print(f"Mock backend listening on {backend.base_url} (Ctrl+C to stop)")
+    try:
+        backend.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        backend.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,8 @@ class Config:
     API_BASE_URLS = {
         "development": "https://codvid-ai-backend-development.up.railway.app",
         "production": "https://codvid-ai-backend-production.up.railway.app", 
-        "local": "http://localhost:8080",
+        # Point at benchmarks/mock_backend.py (or a locally running backend)
+        "local": os.getenv("CODVID_LOCAL_API_URL", "http://localhost:8080"),
         # Added to match demo notebooks
         "betamale": "https://codvid-ai-backend-betamale.up.railway.app"
     }
@@ -20,6 +21,118 @@ class Config:
     # Default environment - can be changed via environment variable
     DEFAULT_ENV = "development"
     
+    # HTTP connection pooling (one keep-alive session per environment, shared across reruns)
+    HTTP_POOL_CONFIG = {
+        "pool_connections": 4,
+        "pool_maxsize": 20,
+        "pool_block": False,
+        "keep_alive": True
+    }
+    
+    # Transport resilience: retries for idempotent requests and a circuit breaker per environment
+    RESILIENCE_CONFIG = {
+        "retry": {
+            "max_attempts": 3,
+            "backoff_base_seconds": 0.25,
+            "backoff_max_seconds": 4.0,
+            "retry_statuses": [429, 502, 503, 504],
+            "breaker_statuses": [500, 502, 503, 504],
+            # DELETE is left out: a retried delete that already succeeded would report a failure
+            "idempotent_methods": ["GET", "HEAD", "OPTIONS", "PUT"]
+        },
+        "circuit_breaker": {
+            "enabled": True,
+            "failure_threshold": 5,
+            "reset_timeout_seconds": 30
+        }
+    }
+    
+    # Share one in-flight call between identical concurrent reads (same token, endpoint and payload)
+    SINGLE_FLIGHT_CONFIG = {
+        "enabled": True
+    }
+    
+    # Per-user response cache for read-only endpoints (TTL per endpoint, LRU eviction)
+    RESPONSE_CACHE_CONFIG = {
+        "enabled": True,
+        "max_entries": 256,
+        "ttl_seconds": {
+            "get_project_list": 60,
+            "get_tracking_tasks": 30,
+            "get_project_reel_tasks": 30,
+            "get_task_details": 60,
+            "get_sentiment_summary": 300
+        }
+    }
+    
+    # Bounded worker pools for batched API calls (bulk status, bulk delete, imports)
+    CONCURRENCY_CONFIG = {
+        "max_workers": 8
+    }
+    
+    # Bulk imports of reels and competitor profiles (rows per import, concurrent creates and request rate)
+    BULK_IMPORT_CONFIG = {
+        "max_rows": 500,
+        "max_workers": 4,
+        "requests_per_second": 5.0,
+        "min_interval_days": 0.5,
+        "max_interval_days": 30.0
+    }
+    
+    # On-disk project cache (survives logins and browser refreshes)
+    PROJECT_STORE_CONFIG = {
+        "enabled": True,
+        "path": os.getenv("CODVID_CACHE_PATH", os.path.join(".codvid_cache", "projects.sqlite3"))
+    }
+    
+    # Auto-refresh of task status panels (seconds; idle delays grow by backoff_factor per idle poll)
+    STATUS_POLL_CONFIG = {
+        "enabled": True,
+        "fast_seconds": 3,
+        "idle_seconds": 15,
+        "max_idle_seconds": 120,
+        "backoff_factor": 2
+    }
+    
+    # AI chat streaming (placeholder redraws per second while a reply streams in)
+    STREAMING_CONFIG = {
+        "render_fps": 10
+    }
+    
+    # Always-on per-endpoint API metrics, served on export_host:export_port (/metrics, /metrics.json; port 0 disables)
+    METRICS_CONFIG = {
+        "enabled": True,
+        "latency_buckets_ms": [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000],
+        "max_endpoints": 100,
+        "export_host": os.getenv("CODVID_METRICS_HOST", "127.0.0.1"),
+        "export_port": int(os.getenv("CODVID_METRICS_PORT", "9464"))
+    }
+    
+    # Opt-in per-rerun render profiler (capture: none, cprofile or tracemalloc); slowest reruns go to output_dir
+    PROFILER_CONFIG = {
+        "enabled": os.getenv("CODVID_PROFILE", "0") == "1",
+        "capture": os.getenv("CODVID_PROFILE_CAPTURE", "none"),
+        "keep_slowest": 20,
+        "top_n": 30,
+        "output_dir": os.getenv("CODVID_PROFILE_DIR", os.path.join(".codvid_cache", "profiles"))
+    }
+    
+    # Debug API log ring buffer (per session)
+    API_LOG_CONFIG = {
+        "max_entries": 500,
+        "max_bytes": 5_000_000,
+        "max_body_bytes": 20_000,
+        # Untruncated copies of truncated entries, kept only for the replay corpus export
+        "max_full_bytes": 20_000_000,
+        "viewer_page_size": 25
+    }
+    
+    # Background executor for long-running force-scrape requests
+    BACKGROUND_JOBS_CONFIG = {
+        "max_workers": 4,
+        "max_finished_jobs": 200
+    }
+    
     # Streamlit Configuration
     STREAMLIT_CONFIG = {
         "page_title": "CodVid.AI - Instagram Analytics",
@@ -42,6 +155,18 @@ class Config:
         "showlegend": False
     }
     
+    # Shared cache of built Plotly figures, keyed by a hash of their input data
+    FIGURE_CACHE_CONFIG = {
+        "enabled": True,
+        "max_entries": 128,
+        "max_megabytes": 16
+    }
+    
+    # Columnar post analytics cached per (task ID, last_scraped), shared between sessions
+    POST_ANALYTICS_CONFIG = {
+        "max_entries": 64
+    }
+    
     # Scraping Intervals
     SCRAPE_INTERVALS = {
         "min_days": 0.5,
@@ -102,6 +227,21 @@ class Config:
         return {
             "api_base_url": cls.get_api_url(cls.get_environment()),
             "environment": cls.get_environment(),
+            "http_pool_config": cls.HTTP_POOL_CONFIG,
+            "resilience_config": cls.RESILIENCE_CONFIG,
+            "single_flight_config": cls.SINGLE_FLIGHT_CONFIG,
+            "response_cache_config": cls.RESPONSE_CACHE_CONFIG,
+            "concurrency_config": cls.CONCURRENCY_CONFIG,
+            "background_jobs_config": cls.BACKGROUND_JOBS_CONFIG,
+            "metrics_config": cls.METRICS_CONFIG,
+            "profiler_config": cls.PROFILER_CONFIG,
+            "api_log_config": cls.API_LOG_CONFIG,
+            "streaming_config": cls.STREAMING_CONFIG,
+            "status_poll_config": cls.STATUS_POLL_CONFIG,
+            "figure_cache_config": cls.FIGURE_CACHE_CONFIG,
+            "post_analytics_config": cls.POST_ANALYTICS_CONFIG,
+            "project_store_config": cls.PROJECT_STORE_CONFIG,
+            "bulk_import_config": cls.BULK_IMPORT_CONFIG,
             "streamlit_config": cls.STREAMLIT_CONFIG,
             "mobile_config": cls.MOBILE_CONFIG,
             "chart_config": cls.CHART_CONFIG,
@@ -1,24 +1,37 @@
 import streamlit as st
 import requests
 import json
-import pandas as pd
+import os
 from datetime import datetime
 import time
+import copy
+import sqlite3
 from typing import List, Dict, Optional
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
 # Import pages
 from pages.login import show_login
 from pages.dashboard import show_dashboard
-from pages.profile_details import show_profile_details
 from pages.projects import show_projects_page
 from pages.project_chat import show_project_chat
-from pages.project_tracker import show_project_tracker
 
 # Import configuration
 from config import Config
+from services.transport import get_transport, get_all_transport_metrics
+from services.concurrency import map_concurrently, iter_concurrently, RateLimiter
+from services.response_cache import ResponseCache
+from services.jobs import get_job_registry, FINISHED_STATES
+from services.log_store import LogStore
+from services.stream_decoder import JSONStreamDecoder
+from services.text_stream import TextAccumulator
+from services.project_store import get_project_store, make_user_key
+from services.data_mods import apply_data_mods
+from services.single_flight import get_single_flight
+from services.figure_cache import get_figure_cache
+from services.replay import build_replay_corpus, dump_replay_corpus
+from services.metrics import get_api_metrics, start_metrics_exporter
+from services.render_profiler import (
+    CAPTURE_MODES, get_slow_rerun_store, profile_rerun, profile_section, track_api_call, track_api_iter
+)
 
 # Configure Streamlit page
 st.set_page_config(
@@ -404,11 +417,27 @@ if 'chat_history' not in st.session_state:
     st.session_state.chat_history = []
 if 'debug_mode' not in st.session_state:
     st.session_state.debug_mode = False
+if 'profile_reruns' not in st.session_state:
+    st.session_state.profile_reruns = Config.PROFILER_CONFIG["enabled"]
+    st.session_state.profile_capture = Config.PROFILER_CONFIG["capture"]
 if 'log_raw_streaming' not in st.session_state:
     # Keep raw streaming chunk logging ON by default per user request
     st.session_state.log_raw_streaming = True
 if 'api_logs' not in st.session_state:
-    st.session_state.api_logs = []
+    st.session_state.api_logs = LogStore(
+        max_entries=Config.API_LOG_CONFIG["max_entries"],
+        max_bytes=Config.API_LOG_CONFIG["max_bytes"],
+        max_body_bytes=Config.API_LOG_CONFIG["max_body_bytes"],
+        max_full_bytes=Config.API_LOG_CONFIG["max_full_bytes"],
+    )
+if 'scrape_jobs' not in st.session_state:
+    # task_id -> background force-scrape job started from this session
+    st.session_state.scrape_jobs = {}
+if 'task_processing' not in st.session_state:
+    # task_id -> is_processing from the last status poll (a change to idle refreshes cached task data)
+    st.session_state.task_processing = {}
+if 'api_response_cache' not in st.session_state:
+    st.session_state.api_response_cache = ResponseCache(Config.RESPONSE_CACHE_CONFIG["max_entries"])
 if 'local_user_data' not in st.session_state:
     st.session_state.local_user_data = {
         "global_data": {"ai_memory": {}, "video_reflections": {}},
@@ -426,10 +455,21 @@ class APIClient:
         self.base_url = base_url.rstrip('/')
         self.session_token = None
         self.debug_enabled = False
+        # Shared keep-alive connection pool for this backend environment
+        self.transport = get_transport(self.base_url)
+        # Disabled on detached copies that run off the script thread
+        self.session_state_enabled = True
     
     def set_debug(self, enabled: bool):
         self.debug_enabled = enabled
 
+    def detached(self) -> "APIClient":
+        """Copy of this client that never touches st.session_state (for background jobs)"""
+        clone = copy.copy(self)
+        clone.debug_enabled = False
+        clone.session_state_enabled = False
+        return clone
+
     def set_log_raw_streaming(self, enabled: bool):
         """Enable saving raw streaming chunks into the debug logs."""
         self.log_raw_streaming = enabled
@@ -448,70 +488,112 @@ class APIClient:
         except Exception:
             pass
 
+    # ---------- Response cache helpers (per-user, read-only endpoints) ----------
+    def _get_response_cache(self) -> ResponseCache | None:
+        if not Config.RESPONSE_CACHE_CONFIG["enabled"] or not self.session_state_enabled:
+            return None
+        try:
+            return st.session_state.api_response_cache
+        except Exception:
+            return None
+
+    def _cached_request(self, name: str, args: tuple, loader):
+        """Serve a read-only call from the response cache, caching only successful results"""
+        cache = self._get_response_cache()
+        if cache is None:
+            return loader()
+        # Key by backend too, so switching environments never serves another backend's data
+        key_args = (self.base_url, args)
+        hit, value = cache.get(name, key_args)
+        if hit:
+            return value
+        result = loader()
+        if result and result.get("result"):
+            cache.set(name, key_args, result, Config.RESPONSE_CACHE_CONFIG["ttl_seconds"][name])
+        return result
+
+    def _invalidate_cache(self, *names: str, args: tuple | None = None):
+        """Drop cached responses made stale by a mutating call"""
+        cache = self._get_response_cache()
+        if cache is None:
+            return
+        for name in names:
+            cache.invalidate(name, (self.base_url, args) if args is not None else None)
+
+    def clear_response_cache(self):
+        cache = self._get_response_cache()
+        if cache is not None:
+            cache.clear()
+
     # ---------- Local cache helpers (demo-parity) ----------
     def _get_cache(self) -> dict:
         return st.session_state.local_user_data
 
-    def apply_user_data_mods(self, context_mods: list[dict]):
+    # ---------- Persistent project store helpers (on-disk, per user) ----------
+    def _get_store_user_key(self) -> str | None:
+        if not self.session_state_enabled:
+            return None
+        try:
+            return st.session_state.user_data.get("store_key")
+        except Exception:
+            return None
+
+    def _restore_project_from_store(self, project_name: str) -> bool:
+        """Seed the in-memory cache from disk; the caller still checks the mod_count"""
+        store = get_project_store()
+        user_key = self._get_store_user_key()
+        if store is None or user_key is None:
+            return False
+        try:
+            proj = store.load(user_key, project_name)
+        except sqlite3.Error as e:
+            # An unreadable store only costs a download from the server
+            print(f"Failed to restore project '{project_name}' from disk: {e}")
+            return False
+        if proj is None:
+            return False
+        self._get_cache().setdefault("projects", {})[project_name] = proj
+        return True
+
+    def persist_project(self, project_name: str):
+        """Write the in-memory copy of a project to disk, keyed by its mod_count"""
+        store = get_project_store()
+        user_key = self._get_store_user_key()
+        if store is None or user_key is None:
+            return
+        proj = self._get_cache().get("projects", {}).get(project_name)
+        if proj is None:
+            return
+        try:
+            store.save(user_key, project_name, proj)
+        except Exception as e:
+            print(f"Failed to persist project '{project_name}': {e}")
+
+    def _purge_deleted_projects(self, project_names: List[str]):
+        """Drop every trace of deleted projects from the response cache, local_user_data and disk"""
+        self._invalidate_cache("get_project_list")
+        for project_name in project_names:
+            self._invalidate_cache("get_project_reel_tasks", args=(project_name,))
+        if not self.session_state_enabled:
+            return
         cache = self._get_cache()
-        modified_projects: set[str] = set()
-        for mod in context_mods or []:
-            key_path = mod.get("key_path")
-            mode = mod.get("mode")
-            value = mod.get("value")
-            if not isinstance(key_path, list) or mode not in {"create", "edit", "del", "append"}:
-                continue
-            if len(key_path) >= 2 and key_path[0] == "projects" and isinstance(key_path[1], str):
-                if not (len(key_path) == 3 and key_path[2] == "mod_count"):
-                    modified_projects.add(key_path[1])
-            # Traverse to parent
-            target = cache
+        removed = set(project_names)
+        cache["projects"] = {name: proj for name, proj in cache.get("projects", {}).items() if name not in removed}
+        store = get_project_store()
+        user_key = self._get_store_user_key()
+        if store is not None and user_key is not None:
             try:
-                for key in key_path[:-1]:
-                    if isinstance(target, dict):
-                        if key not in target:
-                            if mode == "create":
-                                target[key] = {}
-                            else:
-                                raise KeyError
-                        target = target[key]
-                    elif isinstance(target, list) and isinstance(key, int):
-                        target = target[key]
-                    else:
-                        raise TypeError
-                last_key = key_path[-1]
-                if mode == "create":
-                    if isinstance(target, dict):
-                        target[last_key] = value
-                    elif isinstance(target, list) and isinstance(last_key, int):
-                        if last_key == len(target):
-                            target.append(value)
-                        elif last_key < len(target):
-                            target[last_key] = value
-                elif mode == "edit":
-                    if isinstance(target, dict):
-                        target[last_key] = value
-                    elif isinstance(target, list) and isinstance(last_key, int):
-                        target[last_key] = value
-                elif mode == "del":
-                    if isinstance(target, dict):
-                        if last_key in target:
-                            del target[last_key]
-                    elif isinstance(target, list) and isinstance(last_key, int):
-                        if last_key < len(target):
-                            target.pop(last_key)
-                elif mode == "append":
-                    if isinstance(target, dict):
-                        if last_key not in target or not isinstance(target[last_key], list):
-                            target[last_key] = []
-                        target[last_key].append(value)
-                    elif isinstance(target, list) and isinstance(last_key, int):
-                        if last_key < len(target):
-                            if not isinstance(target[last_key], list):
-                                target[last_key] = []
-                            target[last_key].append(value)
-            except Exception:
-                continue
+                store.delete_many(user_key, project_names)
+            except sqlite3.Error as e:
+                print(f"Failed to remove deleted projects from disk: {e}")
+
+    def apply_user_data_mods(self, context_mods: list[dict]) -> dict:
+        """Apply backend data_mods to the local cache; returns applied/rejected counts"""
+        cache = self._get_cache()
+        report = apply_data_mods(cache, context_mods)
+        modified_projects = report["modified_projects"]
+        if report["rejected"] and self.debug_enabled:
+            print(f"DEBUG: Rejected {report['rejected']} of {report['applied'] + report['rejected']} data mods")
         # Increment mod_count
         for project_name in modified_projects:
             try:
@@ -520,27 +602,47 @@ class APIClient:
                     proj["mod_count"] = int(proj.get("mod_count", 0)) + 1
             except Exception:
                 continue
+        return report
 
     def get_project_mod_count(self, project_name: str) -> int | None:
         payload = {"project_name": project_name}
-        result = self._make_request("/codvid-ai/project/get-project-mod-count", method="POST", data=payload)
+        result = self._make_request("/codvid-ai/project/get-project-mod-count", method="POST", data=payload, idempotent=True)
         if result and result.get("result"):
             return result.get("response", {}).get("mod_count")
         return None
 
+    def sync_project_mod_count(self, project_name: str):
+        """Adopt the server's mod_count after changes made outside data_mods (e.g. a sent chat message)
+
+        The local copy already holds those changes, so only the count is
+        fetched instead of the whole project. If it cannot be fetched, the
+        count is cleared so the next check downloads the project.
+        """
+        proj = self._get_cache().get("projects", {}).get(project_name)
+        if not isinstance(proj, dict):
+            return
+        proj["mod_count"] = self.get_project_mod_count(project_name)
+        if proj["mod_count"] is not None:
+            self.persist_project(project_name)
+
     def load_project_into_cache(self, project_name: str) -> bool:
         data = {"project_name": project_name}
-        res = self._make_request("/codvid-ai/project/get-project-data", method="POST", data=data)
+        res = self._make_request("/codvid-ai/project/get-project-data", method="POST", data=data, idempotent=True)
         if res and res.get("result"):
             proj = res.get("response", {}).get("project_data")
             if proj is not None:
                 cache = self._get_cache()
                 cache.setdefault("projects", {})[project_name] = proj
+                self.persist_project(project_name)
                 return True
         return False
 
     def check_and_reload_project_data(self, project_name: str) -> bool:
+        """Download the project only when the server's mod_count differs from ours"""
         cache = self._get_cache()
+        # Pages may have seeded an empty placeholder; only a real download carries a mod_count
+        if "mod_count" not in cache.get("projects", {}).get(project_name, {}):
+            self._restore_project_from_store(project_name)
         server_mod = self.get_project_mod_count(project_name)
         local_mod = cache.get("projects", {}).get(project_name, {}).get("mod_count")
         if server_mod is None:
@@ -553,10 +655,39 @@ class APIClient:
         cache = self._get_cache()
         if project_name in cache.get("projects", {}):
             return True
+        if self._restore_project_from_store(project_name):
+            return self.check_and_reload_project_data(project_name)
         return self.load_project_into_cache(project_name)
     
-    def _make_request(self, endpoint: str, method: str = "POST", data: dict | None = None, stream: bool = False, timeout_seconds: int = 300):
-        """Make HTTP request to the API (supports streaming)"""
+    @staticmethod
+    def _can_coalesce(method: str, idempotent: bool | None) -> bool:
+        """Only reads are shared between identical in-flight calls"""
+        if not Config.SINGLE_FLIGHT_CONFIG["enabled"]:
+            return False
+        return idempotent if idempotent is not None else method.upper() == "GET"
+
+    @staticmethod
+    def _record_metrics(method: str, endpoint: str, sent_at: float, status_code: int | None,
+                        request_bytes: int, response_bytes: int = 0):
+        """Record one backend call in the process-wide API metrics (status_code None: no response)"""
+        if not Config.METRICS_CONFIG["enabled"]:
+            return
+        if status_code is None:
+            error = "exception"
+        elif status_code not in (200, 201):
+            error = str(status_code)
+        else:
+            error = None
+        get_api_metrics().observe(method, endpoint, (time.perf_counter() - sent_at) * 1000, status_code,
+                                  request_bytes, response_bytes, error)
+    
+    def _make_request(self, endpoint: str, method: str = "POST", data: dict | None = None, stream: bool = False,
+                      timeout_seconds: int = 300, idempotent: bool | None = None):
+        """Make HTTP request to the API (supports streaming)
+        
+        idempotent marks POST endpoints that only read data as safe to retry; by default
+        only the idempotent HTTP methods in Config.RESILIENCE_CONFIG are retried.
+        """
         url = f"{self.base_url}{endpoint}"
         headers = {
             "Accept": "application/json"
@@ -577,53 +708,86 @@ class APIClient:
         start_time = _time.time()
         req_payload = payload
         req_headers = self._sanitize_headers(headers)
+        request_bytes = len(json.dumps(payload)) if payload is not None else 0
         
         try:
             if stream:
-                response = requests.request(
-                    method=method.upper(),
-                    url=url,
-                    headers=headers,
-                    json=payload,
-                    timeout=timeout_seconds,
-                    stream=True,
-                )
+                sent_at = _time.perf_counter()
+                try:
+                    with track_api_call():
+                        response = self.transport.request(
+                            method=method.upper(),
+                            url=url,
+                            headers=headers,
+                            json=payload,
+                            timeout=timeout_seconds,
+                            stream=True,
+                        )
+                except requests.exceptions.RequestException:
+                    self._record_metrics(method, endpoint, sent_at, None, request_bytes)
+                    raise
+                # Time to response headers; the streamed body size is added in process_streaming_response
+                self._record_metrics(method, endpoint, sent_at, response.status_code, request_bytes)
                 # Do not append any client-generated summary for streaming responses here.
                 # Raw server-sent JSON chunks will be logged verbatim in
                 # `process_streaming_response` when `debug_enabled` and
                 # `log_raw_streaming` are enabled.
                 return response
             else:
-                response = requests.request(
-                    method=method.upper(),
-                    url=url,
-                    headers=headers,
-                    json=payload,
-                    timeout=timeout_seconds,
-                )
-                if response.status_code in [200, 201]:
-                    res_json = response.json()
+                def send():
+                    # Metrics are recorded here so calls coalesced onto this one are not counted twice
+                    sent_at = _time.perf_counter()
+                    try:
+                        with track_api_call():
+                            response = self.transport.request(
+                                method=method.upper(),
+                                url=url,
+                                headers=headers,
+                                json=payload,
+                                timeout=timeout_seconds,
+                                idempotent=idempotent,
+                            )
+                    except requests.exceptions.RequestException:
+                        self._record_metrics(method, endpoint, sent_at, None, request_bytes)
+                        raise
+                    self._record_metrics(method, endpoint, sent_at, response.status_code, request_bytes,
+                                         len(response.content))
+                    if response.status_code in [200, 201]:
+                        return response.status_code, response.json()
+                    return response.status_code, response.text
+
+                coalesced = False
+                if self._can_coalesce(method, idempotent):
+                    # Identical reads already in flight (other tabs/sessions of this user) share one call
+                    flight_key = (self.session_token, method.upper(), url, json.dumps(payload, sort_keys=True, default=str))
+                    (status_code, body), coalesced = get_single_flight().do(flight_key, send)
+                else:
+                    status_code, body = send()
+
+                if status_code in [200, 201]:
                     if self.debug_enabled:
                         self._append_log({
                             'timestamp': datetime.now().isoformat(),
                             'endpoint': endpoint,
                             'method': method.upper(),
                             'stream': False,
+                            'coalesced': coalesced,
                             'request': {'url': url, 'headers': req_headers, 'body': req_payload},
-                            'response': {'status_code': response.status_code, 'body': res_json},
+                            'response': {'status_code': status_code, 'body': body},
                             'duration_ms': int((_time.time() - start_time) * 1000),
                         })
-                    return res_json
+                    return body
                 else:
-                    print(f"API Error: {response.status_code} - {response.text}")
+                    print(f"API Error: {status_code} - {body}")
                     if self.debug_enabled:
                         self._append_log({
                             'timestamp': datetime.now().isoformat(),
                             'endpoint': endpoint,
                             'method': method.upper(),
                             'stream': False,
+                            'coalesced': coalesced,
                             'request': {'url': url, 'headers': req_headers, 'body': req_payload},
-                            'response': {'status_code': response.status_code, 'body': response.text},
+                            'response': {'status_code': status_code, 'body': body},
                             'duration_ms': int((_time.time() - start_time) * 1000),
                         })
                     return None
@@ -647,6 +811,12 @@ class APIClient:
         result = self._make_request("/codvid-ai/auth/login", data=data)
         if result and result.get("result"):
             self.session_token = result.get("token")
+            # Never serve one account's cached responses to another
+            self.clear_response_cache()
+            if self.session_state_enabled:
+                # Projects are restored from disk per account, so drop any other account's copies
+                st.session_state.user_data["store_key"] = make_user_key(self.base_url, email)
+                st.session_state.local_user_data["projects"] = {}
             return True
         return False
     
@@ -661,12 +831,20 @@ class APIClient:
         result = self._make_request("/codvid-ai/user/delete-account", data={})
         if result and result.get("result"):
             self.session_token = None
+            self.clear_response_cache()
+            store = get_project_store()
+            user_key = self._get_store_user_key()
+            if store is not None and user_key is not None:
+                store.delete_user(user_key)
             return True
         return False
     
     def get_project_list(self) -> List[str]:
         """Get list of user projects"""
-        result = self._make_request("/codvid-ai/project/get-project-list", data={})
+        result = self._cached_request(
+            "get_project_list", (),
+            lambda: self._make_request("/codvid-ai/project/get-project-list", data={}, idempotent=True),
+        )
         if result and result.get("result"):
             return result.get("response", {}).get("project_list", [])
         return []
@@ -675,6 +853,8 @@ class APIClient:
         """Create a new project"""
         data = {"project_name": project_name}
         result = self._make_request("/codvid-ai/project/create-project", data=data)
+        if result and result.get("result"):
+            self._invalidate_cache("get_project_list")
         return result and result.get("result")
     
     def delete_project(self, project_name: str) -> bool:
@@ -687,6 +867,8 @@ class APIClient:
             print(f"DEBUG: Request data: {data}")
         
         result = self._make_request("/codvid-ai/project/delete-project", data=data)
+        if result and result.get("result"):
+            self._purge_deleted_projects([project_name])
         
         # Add debug logging for result
         if self.debug_enabled:
@@ -698,10 +880,41 @@ class APIClient:
         
         return result and result.get("result")
     
+    def delete_projects(self, project_names: List[str], max_workers: int | None = None) -> Dict[str, Dict]:
+        """Delete many projects concurrently
+        
+        Args:
+            project_names: Projects to delete (duplicates are sent once)
+            max_workers: Size of the worker pool (default: Config.CONCURRENCY_CONFIG)
+        
+        Returns a dict mapping each project name to {"deleted": bool, "error": str | None}.
+        Local data for all deleted projects is purged in one step after the requests finish.
+        """
+        unique_names = list(dict.fromkeys(name for name in project_names if name))
+        results = map_concurrently(
+            lambda name: self._make_request("/codvid-ai/project/delete-project", data={"project_name": name}),
+            unique_names,
+            max_workers=max_workers,
+        )
+        report = {}
+        for name, result in zip(unique_names, results):
+            if result and result.get("result"):
+                report[name] = {"deleted": True, "error": None}
+            elif result is None:
+                report[name] = {"deleted": False, "error": "No response from server"}
+            else:
+                report[name] = {"deleted": False, "error": result.get("message") or "Server rejected the request"}
+        deleted = [name for name, outcome in report.items() if outcome["deleted"]]
+        if deleted:
+            self._purge_deleted_projects(deleted)
+        if self.debug_enabled:
+            print(f"DEBUG: Bulk delete removed {len(deleted)} of {len(unique_names)} project(s)")
+        return report
+    
     def get_project_data(self, project_name: str) -> Optional[Dict]:
         """Get project data"""
         data = {"project_name": project_name}
-        result = self._make_request("/codvid-ai/project/get-project-data", data=data)
+        result = self._make_request("/codvid-ai/project/get-project-data", data=data, idempotent=True)
         if result and result.get("result"):
             return result.get("response", {}).get("project_data")
         return None
@@ -728,56 +941,58 @@ class APIClient:
         # Return the streaming response object for real-time processing
         return response
     
+    def _iter_stream_documents(self, response, project_name: str, stream_stats: dict):
+        """Yield every JSON document in a streaming response, however the chunks split them"""
+        decoder = JSONStreamDecoder()
+        # Waiting for the next chunk is backend time when the rerun is profiled
+        for chunk in track_api_iter(response.iter_content(chunk_size=None, decode_unicode=True)):
+            if not chunk:
+                continue
+            # Count raw chunks for the end-of-stream summary (chunks themselves are logged below)
+            stream_stats['raw_chunks_count'] += 1
+            stream_stats['raw_chunks_bytes'] += len(chunk)
+            documents = decoder.feed(chunk)
+
+            # Log each raw chunk immediately if enabled
+            try:
+                if getattr(self, 'debug_enabled', False) and getattr(self, 'log_raw_streaming', False):
+                    entry = {
+                        'timestamp': datetime.now().isoformat(),
+                        'endpoint': '/codvid-ai/ai/respond',
+                        'method': 'POST',
+                        'stream': True,
+                        'project': project_name,
+                        'chunk_bytes': len(chunk.encode('utf-8')) if isinstance(chunk, str) else len(chunk),
+                    }
+                    # Log the documents this chunk completed for clearer logs; otherwise store raw.
+                    if len(documents) == 1:
+                        entry['response'] = documents[0]
+                    elif documents:
+                        entry['response'] = {'documents': documents}
+                    else:
+                        entry['response'] = {'raw': chunk if isinstance(chunk, str) else chunk.decode('utf-8', 'replace')}
+                    self._append_log(entry)
+            except Exception:
+                pass
+
+            yield from documents
+        yield from decoder.finish()
+        stream_stats['malformed_documents'] = decoder.frames_malformed
+
     def process_streaming_response(self, response, project_name: str):
         """Process streaming response and yield text chunks in real-time.
         
         This method yields (text_chunk, is_final, data_mods) tuples.
         """
-        aggregated_text = ""
+        aggregated_text = TextAccumulator()
         chunks_collected = []
-        raw_chunks = []
+        stream_stats = {'raw_chunks_count': 0, 'raw_chunks_bytes': 0, 'malformed_documents': 0,
+                        'data_mods_applied': 0, 'data_mods_rejected': 0}
         assistant_message_added_via_mods = False
         
         try:
-            for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
-                if not chunk:
-                    continue
-                # Save raw chunk if enabled for later logging
-                try:
-                    raw_chunks.append(chunk)
-                except Exception:
-                    pass
-
-                # Log each raw chunk immediately if enabled
-                try:
-                    if getattr(self, 'debug_enabled', False) and getattr(self, 'log_raw_streaming', False):
-                        # Try to parse chunk as JSON for clearer logs; otherwise store raw.
-                        parsed = None
-                        try:
-                            parsed = json.loads(chunk)
-                        except Exception:
-                            parsed = None
-
-                        entry = {
-                            'timestamp': datetime.now().isoformat(),
-                            'endpoint': '/codvid-ai/ai/respond',
-                            'method': 'POST',
-                            'stream': True,
-                            'project': project_name,
-                        }
-                        if parsed is not None:
-                            entry['response'] = parsed
-                        else:
-                            entry['response'] = {'raw': chunk}
-
-                        self._append_log(entry)
-                except Exception:
-                    pass
-
-                try:
-                    chunk_data = json.loads(chunk)
-                except Exception:
-                    # Skip non-json chunks but continue collecting raw data
+            for chunk_data in self._iter_stream_documents(response, project_name, stream_stats):
+                if not isinstance(chunk_data, dict):
                     continue
                 
                 if chunk_data.get("result"):
@@ -787,7 +1002,7 @@ class APIClient:
                     # Collect assistant text if provided
                     text_piece = resp.get("text") or resp.get("message", {}).get("text")
                     if text_piece:
-                        aggregated_text += text_piece
+                        aggregated_text.append(text_piece)
                         # Yield the text chunk for real-time display
                         yield text_piece, False, None
 
@@ -795,7 +1010,9 @@ class APIClient:
                     data_mods = resp.get("data_mods") or []
                     if isinstance(data_mods, list):
                         # Apply to local cache
-                        self.apply_user_data_mods(data_mods)
+                        mods_report = self.apply_user_data_mods(data_mods)
+                        stream_stats['data_mods_applied'] += mods_report['applied']
+                        stream_stats['data_mods_rejected'] += mods_report['rejected']
                         for mod in data_mods:
                             try:
                                 key_path = mod.get("key_path")
@@ -815,7 +1032,7 @@ class APIClient:
                                             assistant_message_added_via_mods = True
                                             txt = m.get("text")
                                             if txt:
-                                                aggregated_text += txt
+                                                aggregated_text.append(txt)
                                                 # Yield the text chunk for real-time display
                                                 yield txt, False, None
                             except Exception:
@@ -824,8 +1041,18 @@ class APIClient:
             # Yield error information
             yield f"Error processing response: {str(e)}", True, None
             return
+        finally:
+            # Hand the keep-alive connection back to the shared pool
+            try:
+                response.close()
+            except Exception:
+                pass
+            # Keep the on-disk copy in step with the mods applied during the stream
+            self.persist_project(project_name)
+            if Config.METRICS_CONFIG["enabled"]:
+                get_api_metrics().add_response_bytes("POST", "/codvid-ai/ai/respond", stream_stats['raw_chunks_bytes'])
         
-        # Optionally log raw streaming chunks for debugging/audit
+        # Optionally log a summary of the raw stream; each chunk was already logged individually
         try:
             if getattr(self, 'debug_enabled', False) and getattr(self, 'log_raw_streaming', False):
                 self._append_log({
@@ -834,14 +1061,17 @@ class APIClient:
                     'method': 'POST',
                     'stream': True,
                     'project': project_name,
-                    'raw_streaming_chunks': raw_chunks,
-                    'raw_chunks_count': len(raw_chunks),
+                    'raw_chunks_count': stream_stats['raw_chunks_count'],
+                    'raw_chunks_bytes': stream_stats['raw_chunks_bytes'],
+                    'malformed_documents': stream_stats['malformed_documents'],
+                    'data_mods_applied': stream_stats['data_mods_applied'],
+                    'data_mods_rejected': stream_stats['data_mods_rejected'],
                 })
         except Exception:
             pass
 
         # Yield final result
-        yield aggregated_text, True, data_mods if 'data_mods' in locals() else []
+        yield aggregated_text.text, True, data_mods if 'data_mods' in locals() else []
     
     # Instagram Profile Tracking Methods
     def create_tracking_task(self, target_profile: str, is_competitor: bool = False) -> Optional[str]:
@@ -849,19 +1079,65 @@ class APIClient:
         data = {"target_profile": target_profile, "is_competitor": is_competitor}
         result = self._make_request("/codvid-ai/ig-tracking/create_profile_tracking_task", data=data)
         if result and result.get("result"):
+            self._invalidate_cache("get_tracking_tasks")
             return result.get("response", {}).get("task_id")
         return None
     
+    def create_tracking_tasks(self, target_profiles: List[str], is_competitor: bool = True,
+                              interval_days: float | None = None, max_workers: int | None = None):
+        """Onboard many profiles concurrently, rate limited per Config.BULK_IMPORT_CONFIG
+        
+        Each worker creates a task and immediately sets its scrape interval, so the
+        create and update calls of different profiles overlap.
+        
+        Args:
+            target_profiles: Instagram handles to track (already de-duplicated)
+            is_competitor: Track as competitor profiles
+            interval_days: Scrape interval to set after creation (None keeps the default)
+            max_workers: Size of the worker pool (default: Config.BULK_IMPORT_CONFIG)
+        
+        Yields (handle, {"task_id": str | None, "interval_set": bool}) as each profile completes.
+        """
+        import_config = Config.BULK_IMPORT_CONFIG
+        limiter = RateLimiter(import_config["requests_per_second"])
+
+        def onboard(handle):
+            data = {"target_profile": handle, "is_competitor": is_competitor}
+            result = self._make_request("/codvid-ai/ig-tracking/create_profile_tracking_task", data=data)
+            task_id = result.get("response", {}).get("task_id") if result and result.get("result") else None
+            interval_set = False
+            if task_id and interval_days is not None:
+                limiter.acquire()
+                update = self._make_request(
+                    f"/codvid-ai/ig-tracking/update_profile_tracking_scrape_interval/{task_id}",
+                    method="PUT",
+                    data={"scrape_interval_days": interval_days},
+                )
+                interval_set = bool(update and update.get("result"))
+            return {"task_id": task_id, "interval_set": interval_set}
+
+        try:
+            for handle, outcome in iter_concurrently(onboard, target_profiles, max_workers=max_workers or import_config["max_workers"], rate_limiter=limiter):
+                yield handle, outcome or {"task_id": None, "interval_set": False}
+        finally:
+            self._invalidate_cache("get_tracking_tasks")
+    
     def get_tracking_tasks(self) -> List[Dict]:
         """Get all tracking tasks"""
-        result = self._make_request("/codvid-ai/ig-tracking/get_profile_tracking_tasks", method="GET")
+        result = self._cached_request(
+            "get_tracking_tasks", (),
+            lambda: self._make_request("/codvid-ai/ig-tracking/get_profile_tracking_tasks", method="GET"),
+        )
         if result and result.get("result"):
             return result.get("response", {}).get("tasks", [])
         return []
     
     def get_task_details(self, task_id: str) -> Optional[Dict]:
         """Get detailed task information"""
-        result = self._make_request(f"/codvid-ai/ig-tracking/get_profile_tracking_task/{task_id}", method="GET")
+        result = self._cached_request(
+            "get_task_details", (task_id,),
+            lambda: self._make_request(f"/codvid-ai/ig-tracking/get_profile_tracking_task/{task_id}", method="GET"),
+        )
         if result and result.get("result"):
             return result.get("response", {}).get("task")
         return None
@@ -874,22 +1150,35 @@ class APIClient:
             method="POST",
             timeout_seconds=900,
         )
+        if result and result.get("result"):
+            self._invalidate_cache("get_tracking_tasks")
+            self._invalidate_cache("get_task_details", "get_sentiment_summary", args=(task_id,))
         return result and result.get("result")
     
     def delete_tracking_task(self, task_id: str) -> bool:
         """Delete a tracking task"""
         result = self._make_request(f"/codvid-ai/ig-tracking/delete_profile_tracking_task/{task_id}", method="DELETE")
+        if result and result.get("result"):
+            self._invalidate_cache("get_tracking_tasks")
+            self._invalidate_cache("get_task_details", "get_sentiment_summary", args=(task_id,))
         return result and result.get("result")
     
     def update_scrape_interval(self, task_id: str, interval_days: float) -> bool:
         """Update scrape interval for a task"""
         data = {"scrape_interval_days": interval_days}
         result = self._make_request(f"/codvid-ai/ig-tracking/update_profile_tracking_scrape_interval/{task_id}", method="PUT", data=data)
+        if result and result.get("result"):
+            # Also used for reel tasks, whose project is not known here
+            self._invalidate_cache("get_tracking_tasks", "get_project_reel_tasks")
+            self._invalidate_cache("get_task_details", args=(task_id,))
         return result and result.get("result")
     
     def get_sentiment_summary(self, task_id: str) -> Optional[Dict]:
         """Get sentiment analysis summary"""
-        result = self._make_request(f"/codvid-ai/ig-tracking/sentiment_summary/{task_id}", method="GET")
+        result = self._cached_request(
+            "get_sentiment_summary", (task_id,),
+            lambda: self._make_request(f"/codvid-ai/ig-tracking/sentiment_summary/{task_id}", method="GET"),
+        )
         if result and result.get("result"):
             return result.get("response", {}).get("sentiment_summary")
         return None
@@ -900,13 +1189,42 @@ class APIClient:
         data = {"project_name": project_name, "reel_url": reel_url, "scrape_interval_days": scrape_interval_days}
         result = self._make_request("/codvid-ai/ig-tracking/create_reel_task", data=data)
         if result and result.get("result"):
+            self._invalidate_cache("get_project_reel_tasks", args=(project_name,))
             return result.get("response", {}).get("task_id")
         return None
     
+    def create_reel_tracking_tasks(self, project_name: str, reels: List[Dict], max_workers: int | None = None):
+        """Create many reel tracking tasks concurrently, rate limited per Config.BULK_IMPORT_CONFIG
+        
+        Args:
+            project_name: Project the reels belong to
+            reels: Dicts with "url" and "interval" keys (see services.reel_import)
+            max_workers: Size of the worker pool (default: Config.BULK_IMPORT_CONFIG)
+        
+        Yields (reel, task_id or None) as each request completes, so callers can show progress.
+        """
+        import_config = Config.BULK_IMPORT_CONFIG
+        limiter = RateLimiter(import_config["requests_per_second"])
+
+        def create(reel):
+            data = {"project_name": project_name, "reel_url": reel["url"], "scrape_interval_days": reel["interval"]}
+            result = self._make_request("/codvid-ai/ig-tracking/create_reel_task", data=data)
+            if result and result.get("result"):
+                return result.get("response", {}).get("task_id")
+            return None
+
+        try:
+            yield from iter_concurrently(create, reels, max_workers=max_workers or import_config["max_workers"], rate_limiter=limiter)
+        finally:
+            self._invalidate_cache("get_project_reel_tasks", args=(project_name,))
+    
     def get_project_reel_tasks(self, project_name: str) -> List[Dict]:
         """Get reel tracking tasks for a project"""
         data = {"project_name": project_name}
-        result = self._make_request("/codvid-ai/ig-tracking/get_project_reel_tasks", data=data)
+        result = self._cached_request(
+            "get_project_reel_tasks", (project_name,),
+            lambda: self._make_request("/codvid-ai/ig-tracking/get_project_reel_tasks", data=data, idempotent=True),
+        )
         if result and result.get("result"):
             return result.get("response", {}).get("tasks", [])
         return []
@@ -919,11 +1237,50 @@ class APIClient:
             method="POST",
             timeout_seconds=900,
         )
+        if result and result.get("result"):
+            self._invalidate_cache("get_project_reel_tasks")
         return result and result.get("result")
 
+    # Background force-scrape jobs (non-blocking)
+    def _start_scrape_job(self, kind: str, task_id: str, scrape_fn) -> str:
+        job_id = get_job_registry().submit(kind, task_id, scrape_fn)
+        st.session_state.scrape_jobs[task_id] = {"job_id": job_id, "kind": kind, "finished_seen": False}
+        return job_id
+
+    def start_force_scrape_task(self, task_id: str) -> str:
+        """Start a profile force scrape on the background executor and return its job ID"""
+        client = self.detached()
+        return self._start_scrape_job("profile_scrape", task_id, lambda: client.force_scrape_task(task_id))
+
+    def start_force_scrape_reel_task(self, task_id: str) -> str:
+        """Start a reel force scrape on the background executor and return its job ID"""
+        client = self.detached()
+        return self._start_scrape_job("reel_scrape", task_id, lambda: client.force_scrape_reel_task(task_id))
+
+    def get_scrape_job(self, task_id: str) -> Optional[Dict]:
+        """Get the background force-scrape job started from this session for a task, if any"""
+        entry = st.session_state.scrape_jobs.get(task_id)
+        if not entry:
+            return None
+        job = get_job_registry().get(entry["job_id"])
+        if job is None:
+            del st.session_state.scrape_jobs[task_id]
+            return None
+        if job["status"] in FINISHED_STATES and not entry["finished_seen"]:
+            # The job ran without session access, so drop the responses it made stale now
+            entry["finished_seen"] = True
+            if entry["kind"] == "reel_scrape":
+                self._invalidate_cache("get_project_reel_tasks")
+            else:
+                self._invalidate_cache("get_tracking_tasks")
+                self._invalidate_cache("get_task_details", "get_sentiment_summary", args=(task_id,))
+        return job
+
     def delete_reel_task(self, task_id: str) -> bool:
         """Delete a reel tracking task"""
         result = self._make_request(f"/codvid-ai/ig-tracking/delete_reel_task/{task_id}", method="DELETE")
+        if result and result.get("result"):
+            self._invalidate_cache("get_project_reel_tasks")
         return result and result.get("result")
 
     def get_task_status(self, task_id: str, logs_count: int = 10) -> Optional[Dict]:
@@ -946,17 +1303,62 @@ class APIClient:
             
         result = self._make_request(url, method="GET")
         if result and result.get("result"):
-            return result.get("response")
+            status = result.get("response")
+            self._note_task_processing(task_id, status)
+            return status
         return None
 
+    def _note_task_processing(self, task_id: str, status: Optional[Dict]):
+        """Drop cached task data when a polled task finishes processing, so its new scrape shows up"""
+        if not self.session_state_enabled or not isinstance(status, dict):
+            return
+        was_processing = st.session_state.task_processing.get(task_id)
+        st.session_state.task_processing[task_id] = bool(status.get('is_processing'))
+        if was_processing and not status.get('is_processing'):
+            self._invalidate_cache("get_tracking_tasks", "get_project_reel_tasks")
+            self._invalidate_cache("get_task_details", "get_sentiment_summary", args=(task_id,))
+
+    def get_task_statuses(self, task_ids: List[str], logs_count: int = 10, max_workers: int | None = None) -> Dict[str, Optional[Dict]]:
+        """Get processing status for many tasks in one concurrent pass
+        
+        Args:
+            task_ids: IDs of the tasks to check (duplicates are fetched once)
+            logs_count: Number of latest logs to return per task (1-100, default: 10)
+            max_workers: Size of the worker pool (default: Config.CONCURRENCY_CONFIG)
+        
+        Returns a dict mapping each task ID to its status, or None if it could not be fetched.
+        """
+        unique_ids = list(dict.fromkeys(tid for tid in task_ids if tid))
+        statuses = map_concurrently(
+            lambda tid: self.get_task_status(tid, logs_count=logs_count),
+            unique_ids,
+            max_workers=max_workers,
+        )
+        return dict(zip(unique_ids, statuses))
+
+def run_page(page_fn, api_client):
+    """Render a page, timed as its own section when the rerun is profiled"""
+    with profile_section(page_fn.__name__):
+        page_fn(api_client)
+
 def main():
-    """Main application"""
+    """Main application, profiled per rerun when the render profiler is on"""
+    # The sidebar shows the previous rerun's profile; this one is only complete once the script ends
+    st.session_state.last_rerun_profile = st.session_state.get('rerun_profile')
+    with profile_rerun(st.session_state.profile_reruns, page=st.session_state.current_page,
+                       capture=st.session_state.profile_capture) as profile:
+        st.session_state.rerun_profile = profile
+        render_app()
+
+def render_app():
+    """Render the debug sidebar and route to the current page"""
     # Check session timeout
     check_session_timeout()
     
     # Get API configuration
     api_url = Config.get_api_url()
     api_client = APIClient(api_url)
+    metrics_url = start_metrics_exporter()
     
     # Set session token if available
     if st.session_state.session_token:
@@ -968,50 +1370,200 @@ def main():
         st.subheader("Debug")
         st.session_state.debug_mode = st.checkbox("Enable debug mode", value=st.session_state.debug_mode)
         if st.button("Clear API logs"):
-            st.session_state.api_logs = []
+            st.session_state.api_logs.clear()
             st.success("Cleared logs")
+        if st.session_state.debug_mode:
+            with st.expander("Response Cache"):
+                cache_stats = st.session_state.api_response_cache.get_stats()
+                st.caption(
+                    f"Hits: {cache_stats['hits']}, misses: {cache_stats['misses']} "
+                    f"({cache_stats['hit_ratio']:.0%} hit rate)"
+                )
+                st.caption(
+                    f"Entries: {cache_stats['entries']}/{cache_stats['max_entries']}, "
+                    f"evictions: {cache_stats['evictions']}"
+                )
+                for name, counts in cache_stats['per_endpoint'].items():
+                    st.caption(f"{name}: {counts['hits']} hits / {counts['misses']} misses")
+                if st.button("Clear response cache"):
+                    st.session_state.api_response_cache.clear()
+                    st.success("Cleared response cache")
+            with st.expander("Figure Cache"):
+                figure_stats = get_figure_cache().get_stats()
+                st.caption(
+                    f"Hits: {figure_stats['hits']}, misses: {figure_stats['misses']} "
+                    f"({figure_stats['hit_ratio']:.0%} hit rate)"
+                )
+                st.caption(
+                    f"Entries: {figure_stats['entries']}/{figure_stats['max_entries']}, "
+                    f"{figure_stats['bytes'] / 1024:.0f}/{figure_stats['max_bytes'] / 1024:.0f} KB, "
+                    f"evictions: {figure_stats['evictions']}"
+                )
+                if st.button("Clear figure cache"):
+                    get_figure_cache().clear()
+                    st.success("Cleared figure cache")
+            with st.expander("Connection Pool"):
+                for metrics in get_all_transport_metrics():
+                    st.markdown(f"**{metrics['base_url']}**")
+                    st.caption(
+                        f"Requests: {metrics['requests_sent']} "
+                        f"(failed {metrics['requests_failed']}, in flight {metrics['in_flight']})"
+                    )
+                    st.caption(
+                        f"Connections opened: {metrics['connections_opened']}, "
+                        f"reused: {metrics['connections_reused']} ({metrics['reuse_ratio']:.0%})"
+                    )
+                    st.caption(f"Retries: {metrics['retries']} (recovered {metrics['retries_succeeded']})")
+                    circuit = metrics['circuit']
+                    if circuit:
+                        st.caption(
+                            f"Circuit: {circuit['state']} "
+                            f"(failures in a row {circuit['consecutive_failures']}, "
+                            f"opened {circuit['times_opened']}x, fast-failed {circuit['short_circuited']})"
+                        )
+                flight_stats = get_single_flight().get_stats()
+                st.caption(
+                    f"Coalesced requests: {flight_stats['coalesced']} of "
+                    f"{flight_stats['executed'] + flight_stats['coalesced']} ({flight_stats['coalesced_ratio']:.0%})"
+                )
+            with st.expander("API Metrics"):
+                metrics_snapshot = get_api_metrics().snapshot()
+                if metrics_url:
+                    st.caption(f"Exported at {metrics_url}/metrics (Prometheus) and {metrics_url}/metrics.json")
+                if not metrics_snapshot['endpoints']:
+                    st.caption("No backend calls recorded yet")
+                else:
+                    # Slowest p95 first, aggregated over every session in this process
+                    rows = ["| Endpoint | Calls | Errors | p50 ms | p95 ms | Max ms | Avg KB in |", "|---|---:|---:|---:|---:|---:|---:|"]
+                    for e in metrics_snapshot['endpoints']:
+                        rows.append(
+                            f"| {e['method']} {e['endpoint'].replace('/codvid-ai', '')} | {e['count']} | {e['error_count']} "
+                            f"| {e['p50_ms']:.0f} | {e['p95_ms']:.0f} | {e['max_ms']:.0f} "
+                            f"| {e['response_bytes'] / max(e['count'], 1) / 1024:.1f} |"
+                        )
+                    st.markdown("\n".join(rows))
+                    st.download_button(
+                        "Download metrics (JSON)",
+                        data=json.dumps(metrics_snapshot, indent=2),
+                        file_name="api_metrics.json",
+                        mime="application/json",
+                    )
+                if st.button("Reset API metrics"):
+                    get_api_metrics().reset()
+                    st.success("Reset API metrics")
+            with st.expander("Render Profiler"):
+                st.session_state.profile_reruns = st.checkbox("Profile reruns", value=st.session_state.profile_reruns)
+                st.session_state.profile_capture = st.selectbox(
+                    "Capture",
+                    CAPTURE_MODES,
+                    index=CAPTURE_MODES.index(st.session_state.profile_capture)
+                    if st.session_state.profile_capture in CAPTURE_MODES else 0,
+                    help="cProfile covers the script thread only; tracemalloc is process-wide",
+                )
+                last_profile = st.session_state.last_rerun_profile
+                if last_profile is not None and last_profile.record:
+                    record = last_profile.record
+                    st.caption(
+                        f"Last rerun ({record['page']}): {record['total_seconds'] * 1000:.0f} ms, "
+                        f"API {record['api_seconds'] * 1000:.0f} ms over {record['api_calls']} calls, "
+                        f"compute {record['compute_seconds'] * 1000:.0f} ms"
+                    )
+                    for section in record['sections']:
+                        st.caption(
+                            f"{section['name']}: {section['seconds'] * 1000:.0f} ms "
+                            f"(API {section['api_seconds'] * 1000:.0f}, compute {section['compute_seconds'] * 1000:.0f})"
+                        )
+                slowest = get_slow_rerun_store().slowest() if st.session_state.profile_reruns else []
+                if slowest:
+                    st.caption(f"Slowest reruns in {Config.PROFILER_CONFIG['output_dir']}:")
+                    for rerun in slowest[:5]:
+                        st.caption(f"{rerun['total_seconds'] * 1000:.0f} ms: {os.path.basename(rerun['path'])}")
     # Apply debug and raw-streaming flags to client
     api_client.set_debug(st.session_state.debug_mode)
     api_client.set_log_raw_streaming(st.session_state.log_raw_streaming)
 
     # Page routing
     if not st.session_state.authenticated:
-        show_login(api_client)
+        run_page(show_login, api_client)
     else:
         # Update session token
         st.session_state.session_token = api_client.session_token
         
         # Route to appropriate page
         if st.session_state.current_page == 'dashboard':
-            show_dashboard(api_client)
+            run_page(show_dashboard, api_client)
         elif st.session_state.current_page == 'profile_details':
-            show_profile_details(api_client)
+            # Analytics pages pull in pandas/plotly, so they are imported on first render
+            from pages.profile_details import show_profile_details
+            run_page(show_profile_details, api_client)
         elif st.session_state.current_page == 'projects':
-            show_projects_page(api_client)
+            run_page(show_projects_page, api_client)
         elif st.session_state.current_page == 'project_chat':
-            show_project_chat(api_client)
+            run_page(show_project_chat, api_client)
         elif st.session_state.current_page == 'project_tracker':
-            show_project_tracker(api_client)
+            from pages.project_tracker import show_project_tracker
+            run_page(show_project_tracker, api_client)
         else:
             st.session_state.current_page = 'dashboard'
-            show_dashboard(api_client)
+            run_page(show_dashboard, api_client)
 
     # Debug log viewer in sidebar (below controls)
     if st.session_state.debug_mode and st.session_state.api_logs:
         with st.sidebar:
             st.markdown("---")
             st.subheader("API Logs")
-            # Show latest first
-            for i, entry in enumerate(reversed(st.session_state.api_logs)):
-                title = f"{entry.get('method')} {entry.get('endpoint')} ({entry.get('response',{}).get('status_code', entry.get('response',{}).get('error', 'stream'))})"
-                with st.expander(title):
-                    st.markdown(f"**Timestamp:** {entry.get('timestamp')}")
-                    st.markdown(f"**Duration:** {entry.get('duration_ms')} ms")
-                    st.markdown(f"**Stream:** {entry.get('stream')}")
-                    st.markdown("**Request:**")
-                    st.json(entry.get('request', {}))
-                    st.markdown("**Response:**")
-                    st.json(entry.get('response', {}))
+            log_stats = st.session_state.api_logs.get_stats()
+            st.caption(
+                f"{log_stats['entries']}/{log_stats['max_entries']} entries, "
+                f"{log_stats['bytes'] / 1024:.0f} KB (evicted {log_stats['evicted']}, truncated {log_stats['truncated']}; "
+                f"{log_stats['full_bytes'] / 1024:.0f} KB of full bodies kept for export)"
+            )
+            # Replay corpus for benchmarks/bench_replay.py (secrets redacted); built on demand only
+            if st.button("Export replay corpus", help="Streams are included only while 'Log raw streaming' is on"):
+                st.session_state.replay_corpus = dump_replay_corpus(
+                    build_replay_corpus(st.session_state.api_logs.full_entries(), api_client.base_url)
+                )
+            if st.session_state.get('replay_corpus'):
+                st.download_button(
+                    "Download replay_corpus.json",
+                    data=st.session_state.replay_corpus,
+                    file_name="replay_corpus.json",
+                    mime="application/json",
+                )
+            # Only titles are listed; the body of the selected entry is rendered on demand
+            page_size = Config.API_LOG_CONFIG["viewer_page_size"]
+            page_count = max((log_stats['entries'] - 1) // page_size + 1, 1)
+            page = st.number_input("Log page (latest first)", min_value=1, max_value=page_count, value=1, step=1)
+            entries = st.session_state.api_logs.latest(page * page_size)[(page - 1) * page_size:]
+            entries_by_seq = {entry['seq']: entry for entry in entries}
+            titles = {}
+            for seq, entry in entries_by_seq.items():
+                response = entry.get('response', {})
+                if not isinstance(response, dict):
+                    response = {}
+                titles[seq] = (
+                    f"{entry.get('timestamp', '')[11:19]} {entry.get('method')} {entry.get('endpoint')} "
+                    f"({response.get('status_code', response.get('error', 'stream'))})"
+                )
+            selected = st.selectbox(
+                "Inspect entry:",
+                options=list(entries_by_seq.keys()),
+                format_func=lambda seq: titles[seq],
+                index=None,
+                placeholder="Choose a log entry...",
+                key="api_log_selected_seq",
+            )
+            if selected is not None and selected in entries_by_seq:
+                entry = entries_by_seq[selected]
+                st.markdown(f"**Timestamp:** {entry.get('timestamp')}")
+                st.markdown(f"**Duration:** {entry.get('duration_ms')} ms")
+                st.markdown(f"**Stream:** {entry.get('stream')}")
+                st.markdown("**Request:**")
+                st.json(entry.get('request', {}))
+                st.markdown("**Response:**")
+                st.json(entry.get('response', {}))
+                if 'raw_chunks_count' in entry:
+                    st.markdown(f"**Raw chunks:** {entry['raw_chunks_count']} ({entry.get('raw_chunks_bytes', 0)} bytes)")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,6 +1,8 @@
 import streamlit as st
 from datetime import datetime
 import time
+from services.profile_import import parse_profile_handles, tracked_handles
+from services.status_poller import schedule_auto_refresh
 
 def smart_task_selector(api_client, auto_select_first=False):
     """
@@ -194,7 +196,67 @@ def show_dashboard(api_client):
                         st.error("Failed to create tracking task")
                 else:
                     st.error("Please enter a profile name")
-    
+
+        # Onboard a whole competitive set in one go
+        with st.expander("Bulk Add Competitors", expanded=False):
+            onboarding_summary = st.session_state.get('competitor_import_summary')
+            if onboarding_summary:
+                st.success(f"Last import: tracking {onboarding_summary['created']} new competitor(s), {onboarding_summary['failed']} failed, {onboarding_summary['skipped']} skipped")
+                if onboarding_summary['interval_failed']:
+                    st.caption(f"{onboarding_summary['interval_failed']} profile(s) kept the default scrape interval")
+                for failed_handle in onboarding_summary['failed_handles'][:20]:
+                    st.caption(f"Failed: @{failed_handle}")
+                for row in onboarding_summary.get('skipped_rows', []):
+                    st.caption(f"Skipped {row['value']} ({row['reason']})")
+
+            with st.form("bulk_competitor_form", clear_on_submit=True):
+                handles_text = st.text_area(
+                    "Instagram Usernames",
+                    placeholder="@foodxtaste\nhttps://www.instagram.com/another_brand/\nthird.brand",
+                    help="Separate handles with new lines, commas or spaces"
+                )
+                bulk_interval = st.number_input(
+                    "Scrape Interval (days)",
+                    min_value=0.5,
+                    max_value=30.0,
+                    value=2.0,
+                    step=0.5,
+                    key="bulk_competitor_interval"
+                )
+                bulk_submit = st.form_submit_button("Add Competitors", use_container_width=True)
+
+            if bulk_submit:
+                # Skip anything already tracked, judged against the single task snapshot loaded above
+                parsed = parse_profile_handles(handles_text, tracked_handles(tasks))
+                handles, skipped = parsed["handles"], parsed["invalid"] + parsed["duplicates"]
+
+                if not handles:
+                    st.warning("No new profiles to add.")
+                    for row in skipped:
+                        st.caption(f"Skipped {row['value']} ({row['reason']})")
+                else:
+                    progress = st.progress(0.0, text=f"Adding {len(handles)} competitor(s)...")
+                    created, interval_failed, failed_handles = 0, 0, []
+                    for done, (handle, outcome) in enumerate(api_client.create_tracking_tasks(handles, is_competitor=True, interval_days=bulk_interval), start=1):
+                        if outcome["task_id"]:
+                            created += 1
+                            if not outcome["interval_set"]:
+                                interval_failed += 1
+                        else:
+                            failed_handles.append(handle)
+                        progress.progress(done / len(handles), text=f"Added {done} of {len(handles)}: @{handle}")
+
+                    st.session_state.competitor_import_summary = {
+                        'created': created,
+                        'failed': len(failed_handles),
+                        'failed_handles': failed_handles,
+                        'interval_failed': interval_failed,
+                        'skipped': len(skipped),
+                        # Shown with the summary, since the rerun below would clear captions drawn now
+                        'skipped_rows': skipped,
+                    }
+                    st.rerun()
+
     st.markdown("---")
     
     # Environment selector (based on notebooks)
@@ -297,270 +359,289 @@ def show_dashboard(api_client):
                     selected_profile_task_id = tid
                     break
             
-            # Show enhanced status with logs
-            st.subheader("📊 Task Processing Status")
-            
-            # Add logs count selector
-            col1, col2 = st.columns([1, 3])
-            with col1:
-                logs_to_show = st.selectbox(
-                    "Logs to show:",
-                    options=[5, 10, 20, 50, 100],
-                    index=1,  # Default to 10
-                    key=f"logs_count_{selected_profile_task_id}"
-                )
-            with col2:
-                if st.button("🔄 Refresh Status", key=f"refresh_status_{selected_profile_task_id}", type="primary"):
-                    st.rerun()
-            
-            # Get enhanced status with selected logs count
-            status = api_client.get_task_status(selected_profile_task_id, logs_count=logs_to_show)
-            
-            if status:
-                # Show task summary at the top
-                st.markdown('<h4 class="main-header">Task Summary</h4>', unsafe_allow_html=True)
+            # Status panel reruns on its own (auto-refresh, log count, refresh button) without the rest of the page
+            @st.fragment
+            def task_status_panel(selected_profile_task_id):
+                # Show enhanced status with logs
+                st.subheader("📊 Task Processing Status")
                 
-                # Get task details for display
-                task_details = None
-                for task in tasks:
-                    if task['_id'] == selected_profile_task_id:
-                        task_details = task
-                        break
+                # Add logs count selector
+                col1, col2 = st.columns([1, 3])
+                with col1:
+                    logs_to_show = st.selectbox(
+                        "Logs to show:",
+                        options=[5, 10, 20, 50, 100],
+                        index=1,  # Default to 10
+                        key=f"logs_count_{selected_profile_task_id}"
+                    )
+                with col2:
+                    # Clicking reruns only this panel (the auto-refresh clicks it too)
+                    st.button("🔄 Refresh Status", key=f"refresh_status_{selected_profile_task_id}", type="primary")
                 
-                if task_details:
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.markdown(f"**Profile:** @{task_details.get('target_profile', 'Unknown')}")
-                    with col2:
-                        task_type = '🏢 Competitor' if task_details.get('is_competitor') else '👤 Own Profile'
-                        st.markdown(f"**Type:** {task_type}")
-                    with col3:
-                        status_text = "⏳ Processing" if status.get('is_processing') else "✅ Idle/Completed"
-                        st.markdown(f"**Status:** {status_text}")
+                # Get enhanced status with selected logs count
+                status = api_client.get_task_status(selected_profile_task_id, logs_count=logs_to_show)
+                
+                # Background force-scrape job started from this session, if any
+                scrape_job = api_client.get_scrape_job(selected_profile_task_id)
+                if scrape_job:
+                    if scrape_job['status'] in ('queued', 'running'):
+                        st.caption(f"⏳ Background scrape request {scrape_job['status']} ({int(time.time() - scrape_job['submitted_at'])}s)")
+                    elif scrape_job['status'] == 'failed':
+                        st.error(f"❌ Background scrape failed: {scrape_job.get('error')}")
+                
+                if status:
+                    # Show task summary at the top
+                    st.markdown('<h4 class="main-header">Task Summary</h4>', unsafe_allow_html=True)
                     
-                    # Show additional task information
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        if task_details.get('last_scraped'):
-                            last_scraped = datetime.fromtimestamp(task_details['last_scraped'])
-                            st.markdown(f"**Last Scraped:** {last_scraped.strftime('%Y-%m-%d %H:%M')}")
-                        else:
-                            st.markdown("**Last Scraped:** Never")
-                        
-                        # Show scrape interval
-                        interval = task_details.get('scrape_interval_days', 2)
-                        interval_text = f"Every {interval} days"
-                        if interval == 1:
-                            interval_text = "Daily"
-                        elif interval == 0.5:
-                            interval_text = "Every 12 hours"
-                        elif interval == 7:
-                            interval_text = "Weekly"
-                        st.markdown(f"**Scrape Interval:** {interval_text}")
+                    # Task details come from a fresh (cached) task list on every panel rerun: the page's own
+                    # list is from its last full run and goes stale while the panel keeps polling
+                    task_details = None
+                    for task in api_client.get_tracking_tasks():
+                        if task['_id'] == selected_profile_task_id:
+                            task_details = task
+                            break
                     
-                    with col2:
-                        # Calculate next scrape time
-                        if task_details.get('last_scraped'):
-                            next_scrape = task_details['last_scraped'] + (interval * 24 * 3600)
-                            next_scrape_dt = datetime.fromtimestamp(next_scrape)
-                            now = datetime.now()
+                    if task_details:
+                        col1, col2, col3 = st.columns(3)
+                        with col1:
+                            st.markdown(f"**Profile:** @{task_details.get('target_profile', 'Unknown')}")
+                        with col2:
+                            task_type = '🏢 Competitor' if task_details.get('is_competitor') else '👤 Own Profile'
+                            st.markdown(f"**Type:** {task_type}")
+                        with col3:
+                            status_text = "⏳ Processing" if status.get('is_processing') else "✅ Idle/Completed"
+                            st.markdown(f"**Status:** {status_text}")
+                        
+                        # Show additional task information
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            last_scraped_ts = status.get('last_scraped', task_details.get('last_scraped'))
+                            if last_scraped_ts:
+                                last_scraped = datetime.fromtimestamp(last_scraped_ts)
+                                st.markdown(f"**Last Scraped:** {last_scraped.strftime('%Y-%m-%d %H:%M')}")
+                            else:
+                                st.markdown("**Last Scraped:** Never")
                             
-                            if next_scrape_dt > now:
-                                time_until = next_scrape_dt - now
-                                if time_until.days > 0:
-                                    st.markdown(f"**Next Scrape:** {next_scrape_dt.strftime('%Y-%m-%d %H:%M')} (in {time_until.days} days)")
+                            # Show scrape interval
+                            interval = task_details.get('scrape_interval_days', 2)
+                            interval_text = f"Every {interval} days"
+                            if interval == 1:
+                                interval_text = "Daily"
+                            elif interval == 0.5:
+                                interval_text = "Every 12 hours"
+                            elif interval == 7:
+                                interval_text = "Weekly"
+                            st.markdown(f"**Scrape Interval:** {interval_text}")
+                        
+                        with col2:
+                            # Calculate next scrape time
+                            if last_scraped_ts:
+                                next_scrape = last_scraped_ts + (interval * 24 * 3600)
+                                next_scrape_dt = datetime.fromtimestamp(next_scrape)
+                                now = datetime.now()
+                                
+                                if next_scrape_dt > now:
+                                    time_until = next_scrape_dt - now
+                                    if time_until.days > 0:
+                                        st.markdown(f"**Next Scrape:** {next_scrape_dt.strftime('%Y-%m-%d %H:%M')} (in {time_until.days} days)")
+                                    else:
+                                        hours = time_until.seconds // 3600
+                                        st.markdown(f"**Next Scrape:** {next_scrape_dt.strftime('%Y-%m-%d %H:%M')} (in {hours} hours)")
                                 else:
-                                    hours = time_until.seconds // 3600
-                                    st.markdown(f"**Next Scrape:** {next_scrape_dt.strftime('%Y-%m-%d %H:%M')} (in {hours} hours)")
+                                    st.warning("⚠️ **Next Scrape:** Overdue!")
                             else:
-                                st.warning("⚠️ **Next Scrape:** Overdue!")
-                        else:
-                            st.info("ℹ️ **Next Scrape:** Will be scheduled after first scrape")
-                
-                st.markdown("---")
-                
-                if status.get('is_processing'):
-                    st.info("⏳ Task is processing...")
+                                st.info("ℹ️ **Next Scrape:** Will be scheduled after first scrape")
                     
-                    # Display enhanced logs array
-                    if status.get('logs'):
-                        logs = status['logs']
-                        st.success(f"📊 Showing {len(logs)} latest logs (Total available: {status.get('logs_count', 0)})")
+                    st.markdown("---")
+                    
+                    if status.get('is_processing'):
+                        st.info("⏳ Task is processing...")
                         
-                        # Display logs in a nice format
-                        for i, log in enumerate(reversed(logs)):  # Show newest first
-                            timestamp = datetime.fromtimestamp(log.get('timestamp', 0)).strftime('%H:%M:%S')
-                            message = log.get('message', 'No message')
+                        # Display enhanced logs array
+                        if status.get('logs'):
+                            logs = status['logs']
+                            st.success(f"📊 Showing {len(logs)} latest logs (Total available: {status.get('logs_count', 0)})")
                             
-                            # Create a nice log entry display
-                            with st.container():
-                                col1, col2 = st.columns([1, 4])
+                            # Display logs in a nice format
+                            for i, log in enumerate(reversed(logs)):  # Show newest first
+                                timestamp = datetime.fromtimestamp(log.get('timestamp', 0)).strftime('%H:%M:%S')
+                                message = log.get('message', 'No message')
+                                
+                                # Create a nice log entry display
+                                with st.container():
+                                    col1, col2 = st.columns([1, 4])
+                                    with col1:
+                                        st.markdown(f"**{timestamp}**")
+                                    with col2:
+                                        st.markdown(message)
+                                
+                                # Add separator between logs (except for last one)
+                                if i < len(logs) - 1:
+                                    st.markdown("---")
+                            
+                            # Show latest event summary
+                            latest_event = status.get('latest_event')
+                            if latest_event:
+                                st.markdown("---")
+                                st.markdown('<h4 class="main-header">Latest Event Summary</h4>', unsafe_allow_html=True)
+                                
+                                # Show current processing stage with visual indicator
+                                event_type = latest_event.get('event_type', 'Unknown')
+                                stage_emoji = {
+                                    'scrape_started': '🚀',
+                                    'account_fetched': '👤',
+                                    'reels_filtered': '🎬',
+                                    'processing_reels': '⚙️',
+                                    'reels_processed': '✅',
+                                    'profile_data_updated': '💾'
+                                }.get(event_type, '📊')
+                                
+                                st.markdown(f"**Current Stage:** {stage_emoji} {event_type.replace('_', ' ').title()}")
+                                
+                                # Create columns for better layout
+                                col1, col2 = st.columns(2)
+                                
                                 with col1:
-                                    st.markdown(f"**{timestamp}**")
+                                    st.markdown(f"**Event Type:** {latest_event.get('event_type', 'Unknown')}")
+                                    st.markdown(f"**Timestamp:** {datetime.fromtimestamp(latest_event.get('timestamp', 0)).strftime('%Y-%m-%d %H:%M:%S')}")
+                                    
+                                    # Show processing stats if available
+                                    if 'started_at' in status:
+                                        started_time = datetime.fromtimestamp(status['started_at'])
+                                        st.markdown(f"**Started:** {started_time.strftime('%Y-%m-%d %H:%M:%S')}")
+                                    
+                                    if 'updated_at' in status:
+                                        updated_time = datetime.fromtimestamp(status['updated_at'])
+                                        st.markdown(f"**Last Updated:** {updated_time.strftime('%Y-%m-%d %H:%M:%S')}")
+                                
                                 with col2:
-                                    st.markdown(message)
+                                    if 'logs_count' in status:
+                                        st.markdown(f"**Total Log Entries:** {status['logs_count']}")
+                                    if 'requested_logs_count' in status:
+                                        st.markdown(f"**Showing:** {status['requested_logs_count']} logs")
+                                    
+                                    # Show specific event data based on event type
+                                    event_type = latest_event.get('event_type', '')
+                                    if 'scraped_posts_count' in latest_event:
+                                        st.markdown(f"**Posts Scraped:** {latest_event['scraped_posts_count']}")
+                                    if 'reels_count' in latest_event:
+                                        st.markdown(f"**Reels Found:** {latest_event['reels_count']}")
+                                    if 'processing_progress' in latest_event:
+                                        st.markdown(f"**Progress:** {latest_event['processing_progress']}")
+                                    
+                                    # Show event-specific information based on event type
+                                    if event_type == 'scrape_started':
+                                        st.success("🚀 Scraping process initiated")
+                                    elif event_type == 'account_fetched':
+                                        st.success("👤 Instagram account data retrieved")
+                                    elif event_type == 'reels_filtered':
+                                        st.success("🎬 Reels filtered from posts")
+                                    elif event_type == 'processing_reels':
+                                        st.success("⚙️ Processing reels data")
+                                    elif event_type == 'reels_processed':
+                                        st.success("✅ Reel processing completed")
+                                    elif event_type == 'profile_data_updated':
+                                        st.success("💾 Profile data updated in database")
+                                    elif event_type:
+                                        st.info(f"📊 Event: {event_type}")
+                                
+                                # Show all event data in an expandable section
+                                with st.expander("🔍 View All Event Data", expanded=False):
+                                    st.json(latest_event)
+                        else:
+                            st.info("📝 No processing logs available yet")
                             
-                            # Add separator between logs (except for last one)
-                            if i < len(logs) - 1:
-                                st.markdown("---")
+                            # Fallback to basic status display
+                            latest_event = status.get('latest_event')
+                            if latest_event:
+                                st.markdown('<h4 class="main-header">Latest Event Details</h4>', unsafe_allow_html=True)
+                                st.markdown(f"**Event:** {latest_event.get('event_type', 'Unknown')}")
+                                st.markdown(f"**Time:** {datetime.fromtimestamp(latest_event.get('timestamp', 0)).strftime('%Y-%m-%d %H:%M:%S')}")
+                                st.markdown(f"**Message:** {latest_event.get('message', 'No message')}")
                         
-                        # Show latest event summary
-                        latest_event = status.get('latest_event')
-                        if latest_event:
+                        # Show processing history summary
+                        if 'logs_count' in status and status['logs_count'] > 0:
                             st.markdown("---")
-                            st.markdown('<h4 class="main-header">Latest Event Summary</h4>', unsafe_allow_html=True)
+                            st.markdown('<h4 class="main-header">Processing Summary</h4>', unsafe_allow_html=True)
+                            st.info(f"📊 Total log entries: {status['logs_count']}")
                             
-                            # Show current processing stage with visual indicator
-                            event_type = latest_event.get('event_type', 'Unknown')
-                            stage_emoji = {
-                                'scrape_started': '🚀',
-                                'account_fetched': '👤',
-                                'reels_filtered': '🎬',
-                                'processing_reels': '⚙️',
-                                'reels_processed': '✅',
-                                'profile_data_updated': '💾'
-                            }.get(event_type, '📊')
+                            # Note: Full logs would require additional API endpoint
+                            # For now, show what we can from the current status
+                            if 'started_at' in status and 'updated_at' in status:
+                                duration = status['updated_at'] - status['started_at']
+                                st.caption(f"⏱️ Processing duration: {duration:.1f} seconds")
+                                st.caption("ℹ️ This shows how long the task has been running since it started")
                             
-                            st.markdown(f"**Current Stage:** {stage_emoji} {event_type.replace('_', ' ').title()}")
+                            st.caption("💡 Use the logs selector above to see detailed processing history")
                             
-                            # Create columns for better layout
-                            col1, col2 = st.columns(2)
+                            # Add information about what's available and what isn't
+                            st.info("ℹ️ **Information Available:**")
+                            st.caption("• Current processing stage and event type")
+                            st.caption("• Timestamp of latest event")
+                            st.caption("• Processing duration and log count")
+                            st.caption("• Event-specific data (posts scraped, reels found, etc.)")
                             
-                            with col1:
-                                st.markdown(f"**Event Type:** {latest_event.get('event_type', 'Unknown')}")
-                                st.markdown(f"**Timestamp:** {datetime.fromtimestamp(latest_event.get('timestamp', 0)).strftime('%Y-%m-%d %H:%M:%S')}")
-                                
-                                # Show processing stats if available
-                                if 'started_at' in status:
-                                    started_time = datetime.fromtimestamp(status['started_at'])
-                                    st.markdown(f"**Started:** {started_time.strftime('%Y-%m-%d %H:%M:%S')}")
-                                
-                                if 'updated_at' in status:
-                                    updated_time = datetime.fromtimestamp(status['updated_at'])
-                                    st.markdown(f"**Last Updated:** {updated_time.strftime('%Y-%m-%d %H:%M:%S')}")
+                            st.warning("⚠️ **Limitations:**")
+                            st.caption("• No estimated completion time (varies by profile size and network)")
+                            st.caption("• No progress percentage (depends on Instagram's response time)")
+                            st.caption("• Updates arrive with the next auto-refresh or a manual refresh")
                             
-                            with col2:
-                                if 'logs_count' in status:
-                                    st.markdown(f"**Total Log Entries:** {status['logs_count']}")
-                                if 'requested_logs_count' in status:
-                                    st.markdown(f"**Showing:** {status['requested_logs_count']} logs")
-                                
-                                # Show specific event data based on event type
-                                event_type = latest_event.get('event_type', '')
-                                if 'scraped_posts_count' in latest_event:
-                                    st.markdown(f"**Posts Scraped:** {latest_event['scraped_posts_count']}")
-                                if 'reels_count' in latest_event:
-                                    st.markdown(f"**Reels Found:** {latest_event['reels_count']}")
-                                if 'processing_progress' in latest_event:
-                                    st.markdown(f"**Progress:** {latest_event['processing_progress']}")
-                                
-                                # Show event-specific information based on event type
-                                if event_type == 'scrape_started':
-                                    st.success("🚀 Scraping process initiated")
-                                elif event_type == 'account_fetched':
-                                    st.success("👤 Instagram account data retrieved")
-                                elif event_type == 'reels_filtered':
-                                    st.success("🎬 Reels filtered from posts")
-                                elif event_type == 'processing_reels':
-                                    st.success("⚙️ Processing reels data")
-                                elif event_type == 'reels_processed':
-                                    st.success("✅ Reel processing completed")
-                                elif event_type == 'profile_data_updated':
-                                    st.success("💾 Profile data updated in database")
-                                elif event_type:
-                                    st.info(f"📊 Event: {event_type}")
-                            
-                            # Show all event data in an expandable section
-                            with st.expander("🔍 View All Event Data", expanded=False):
-                                st.json(latest_event)
                     else:
-                        st.info("📝 No processing logs available yet")
+                        st.success("✅ Task is idle/completed")
                         
-                        # Fallback to basic status display
+                        # Show last event if available (for completed tasks)
                         latest_event = status.get('latest_event')
                         if latest_event:
-                            st.markdown('<h4 class="main-header">Latest Event Details</h4>', unsafe_allow_html=True)
-                            st.markdown(f"**Event:** {latest_event.get('event_type', 'Unknown')}")
-                            st.markdown(f"**Time:** {datetime.fromtimestamp(latest_event.get('timestamp', 0)).strftime('%Y-%m-%d %H:%M:%S')}")
-                            st.markdown(f"**Message:** {latest_event.get('message', 'No message')}")
-                    
-                    # Show processing history summary
-                    if 'logs_count' in status and status['logs_count'] > 0:
-                        st.markdown("---")
-                        st.markdown('<h4 class="main-header">Processing Summary</h4>', unsafe_allow_html=True)
-                        st.info(f"📊 Total log entries: {status['logs_count']}")
-                        
-                        # Note: Full logs would require additional API endpoint
-                        # For now, show what we can from the current status
-                        if 'started_at' in status and 'updated_at' in status:
-                            duration = status['updated_at'] - status['started_at']
-                            st.caption(f"⏱️ Processing duration: {duration:.1f} seconds")
-                            st.caption("ℹ️ This shows how long the task has been running since it started")
-                        
-                        st.caption("💡 Use the logs selector above to see detailed processing history")
-                        
-                        # Add information about what's available and what isn't
-                        st.info("ℹ️ **Information Available:**")
-                        st.caption("• Current processing stage and event type")
-                        st.caption("• Timestamp of latest event")
-                        st.caption("• Processing duration and log count")
-                        st.caption("• Event-specific data (posts scraped, reels found, etc.)")
-                        
-                        st.warning("⚠️ **Limitations:**")
-                        st.caption("• No estimated completion time (varies by profile size and network)")
-                        st.caption("• No progress percentage (depends on Instagram's response time)")
-                        st.caption("• Refresh manually to see updates (no auto-refresh)")
+                            st.info("📋 Last Processing Event:")
+                            st.caption(f"{latest_event.get('event_type', 'event')} at {datetime.fromtimestamp(latest_event.get('timestamp', 0)).strftime('%Y-%m-%d %H:%M:%S')}")
+                            
+                            # Show completion summary
+                            if 'scraped_posts_count' in latest_event:
+                                st.success(f"✅ Successfully scraped {latest_event['scraped_posts_count']} posts")
+                            if 'reels_count' in latest_event:
+                                st.success(f"🎬 Found {latest_event['reels_count']} reels")
                         
-                else:
-                    st.success("✅ Task is idle/completed")
-                    
-                    # Show last event if available (for completed tasks)
-                    latest_event = status.get('latest_event')
-                    if latest_event:
-                        st.info("📋 Last Processing Event:")
-                        st.caption(f"{latest_event.get('event_type', 'event')} at {datetime.fromtimestamp(latest_event.get('timestamp', 0)).strftime('%Y-%m-%d %H:%M:%S')}")
+                        # Show next steps for completed tasks
+                        st.markdown('<h4 class="main-header">Next Steps</h4>', unsafe_allow_html=True)
+                        col1, col2 = st.columns(2)
                         
-                        # Show completion summary
-                        if 'scraped_posts_count' in latest_event:
-                            st.success(f"✅ Successfully scraped {latest_event['scraped_posts_count']} posts")
-                        if 'reels_count' in latest_event:
-                            st.success(f"🎬 Found {latest_event['reels_count']} reels")
-                    
-                    # Show next steps for completed tasks
-                    st.markdown('<h4 class="main-header">Next Steps</h4>', unsafe_allow_html=True)
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        if st.button("📊 View Profile Details", key=f"view_details_completed_{selected_profile_task_id}"):
-                            # Find the task in the list
-                            selected_task = None
-                            for task in tasks:
-                                if task['_id'] == selected_profile_task_id:
-                                    selected_task = task
-                                    break
+                        with col1:
+                            if st.button("📊 View Profile Details", key=f"view_details_completed_{selected_profile_task_id}"):
+                                # Find the task in the list
+                                selected_task = None
+                                for task in api_client.get_tracking_tasks():
+                                    if task['_id'] == selected_profile_task_id:
+                                        selected_task = task
+                                        break
+                                
+                                if selected_task:
+                                    st.session_state.current_profile = selected_task
+                                    st.session_state.current_page = 'profile_details'
+                                    st.rerun()
                             
-                            if selected_task:
-                                st.session_state.current_profile = selected_task
-                                st.session_state.current_page = 'profile_details'
+                            if st.button("🔄 Force New Scrape", key=f"force_scrape_completed_{selected_profile_task_id}"):
+                                api_client.start_force_scrape_task(selected_profile_task_id)
+                                st.success("✅ New scraping started in the background!")
+                                st.session_state.monitor_profile_task_id = selected_profile_task_id
                                 st.rerun()
                         
-                        if st.button("🔄 Force New Scrape", key=f"force_scrape_completed_{selected_profile_task_id}"):
-                            with st.spinner("Initiating new scrape..."):
-                                if api_client.force_scrape_task(selected_profile_task_id):
-                                    st.success("✅ New scraping initiated!")
-                                    st.session_state.monitor_profile_task_id = selected_profile_task_id
-                                    st.rerun()
-                                else:
-                                    st.error("❌ Failed to initiate scraping")
-                    
-                    with col2:
-                        st.info("💡 **Available Actions:**")
-                        st.caption("• View detailed profile analytics")
-                        st.caption("• Force immediate re-scraping")
-                        st.caption("• Update scraping interval")
-                        st.caption("• Monitor competitor performance")
-            else:
-                st.warning("⚠️ Unable to fetch task status.")
+                        with col2:
+                            st.info("💡 **Available Actions:**")
+                            st.caption("• View detailed profile analytics")
+                            st.caption("• Force immediate re-scraping")
+                            st.caption("• Update scraping interval")
+                            st.caption("• Monitor competitor performance")
+                else:
+                    st.warning("⚠️ Unable to fetch task status.")
+                
+                # Poll again soon while processing, back off while idle
+                schedule_auto_refresh(
+                    f"dashboard_status_{selected_profile_task_id}",
+                    f"refresh_status_{selected_profile_task_id}",
+                    status.get('is_processing') if status else None,
+                )
+
+            task_status_panel(selected_profile_task_id)
         
         # Smart task selector section
         st.markdown('<h3 class="main-header">Quick Task Actions</h3>', unsafe_allow_html=True)
@@ -572,13 +653,10 @@ def show_dashboard(api_client):
             col1, col2, col3, col4 = st.columns(4)
             with col1:
                 if st.button("🔄 Force Scrape", key=f"force_scrape_{selected_task_id}"):
-                    with st.spinner("Scraping profile data..."):
-                        if api_client.force_scrape_task(selected_task_id):
-                            st.success("Scraping initiated successfully!")
-                            st.session_state.monitor_profile_task_id = selected_task_id
-                            st.rerun()
-                        else:
-                            st.error("Failed to initiate scraping")
+                    api_client.start_force_scrape_task(selected_task_id)
+                    st.success("Scraping started in the background!")
+                    st.session_state.monitor_profile_task_id = selected_task_id
+                    st.rerun()
             
             with col2:
                 if st.button("📊 View Details", key=f"view_details_{selected_task_id}"):
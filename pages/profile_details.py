@@ -1,9 +1,12 @@
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 from datetime import datetime
 import time
 from config import Config
+from services.async_client import AsyncAPIClient, run_concurrently
+from services.status_poller import schedule_auto_refresh
+from services.figure_cache import cached_figure
+from services.post_analytics import get_post_analytics
 
 def display_sentiment_analysis(sentiment_summary):
     """Display sentiment analysis with visual bars like in the notebooks"""
@@ -22,11 +25,11 @@ def display_sentiment_analysis(sentiment_summary):
         if sentiment_summary['total_comments'] > 0:
             # Create sentiment chart
             sentiment_data = sentiment_summary['sentiment_distribution']
-            fig = px.pie(
+            fig = cached_figure("sentiment_pie", sentiment_data, lambda: px.pie(
                 values=list(sentiment_data.values()),
                 names=list(sentiment_data.keys()),
                 title="Sentiment Distribution"
-            )
+            ))
             st.plotly_chart(fig, use_container_width=True)
     
     # Display sentiment distribution with visual bars (from notebooks)
@@ -48,6 +51,54 @@ def display_sentiment_analysis(sentiment_summary):
         emoji = emoji_map.get(sentiment, "😐")
         st.markdown(f"   {emoji} {sentiment.capitalize():8} |{bar}| {percentage:.1f}%")
 
+def display_post_details(analytics, index):
+    """Metrics, caption, comment sentiment and top comments of one post"""
+    emoji_map = Config.SENTIMENT_CONFIG["emoji_map"]
+    post = analytics.posts.loc[index]
+
+    # Basic metrics
+    colm1, colm2, colm3, colm4 = st.columns(4)
+    with colm1:
+        st.metric("Likes", f"{post['likes']:,}")
+    with colm2:
+        st.metric("Comments", f"{post['comments']:,}")
+    with colm3:
+        if post['views']:
+            st.metric("Views", f"{post['views']:,}")
+    with colm4:
+        st.metric("Type", post['type'])
+
+    st.markdown("**Caption:**")
+    st.write(post['caption'])
+
+    # Sentiment from top_comments
+    counts = analytics.post_sentiment(index)
+    if counts:
+        total = sum(counts.values()) or 1
+        percentages = {k: (v / total) * 100 for k, v in counts.items()}
+
+        colc1, colc2 = st.columns([1, 1])
+        with colc1:
+            st.markdown("**Sentiment Summary:**")
+            for s in ["positive", "neutral", "negative"]:
+                emoji = emoji_map.get(s, "😐")
+                st.markdown(f"{emoji} {s.capitalize()}: {counts[s]} ({percentages[s]:.1f}%)")
+        with colc2:
+            try:
+                fig = cached_figure("post_sentiment_pie", counts, lambda: px.pie(
+                    values=list(counts.values()), names=list(counts.keys()), title="Sentiment"
+                ))
+                st.plotly_chart(fig, use_container_width=True)
+            except Exception:
+                pass
+
+        st.markdown("**Top Comments:**")
+        for c in analytics.post_comments(index).itertuples():
+            emoji = emoji_map.get(c.sentiment, "😐")
+            st.markdown(f"{emoji} **@{c.owner_username}** ({c.posted})  |  {c.likes} likes\n\n{c.text}")
+    else:
+        st.info("No top comments available for this post.")
+
 def show_profile_details(api_client):
     """Show detailed profile information and controls"""
     if not st.session_state.current_profile:
@@ -87,12 +138,9 @@ def show_profile_details(api_client):
         
         # Force scrape button
         if st.button("Force Scrape Now", use_container_width=True):
-            with st.spinner("Starting scrape in background..."):
-                if api_client.force_scrape_task(profile['_id']):
-                    st.success("Scraping initiated! Monitoring status...")
-                    st.session_state.monitor_task_id = profile['_id']
-                else:
-                    st.error("Failed to initiate scraping")
+            api_client.start_force_scrape_task(profile['_id'])
+            st.success("Scraping started in the background! Monitoring status...")
+            st.session_state.monitor_task_id = profile['_id']
         
         # Update scrape interval
         with st.expander("Scrape Settings"):
@@ -117,76 +165,107 @@ def show_profile_details(api_client):
     # Always show current task status with enhanced logs (persists across reloads)
     st.markdown('<h3 class="main-header">Task Status</h3>', unsafe_allow_html=True)
     
-    # Add logs count selector
-    col1, col2 = st.columns([1, 3])
-    with col1:
-        logs_to_show = st.selectbox(
-            "Logs to show:",
-            options=[5, 10, 20, 50, 100],
-            index=1,  # Default to 10
-            key=f"profile_logs_count_{profile['_id']}"
-        )
-    with col2:
-        if st.button("Refresh Status", key=f"refresh_profile_status_{profile['_id']}", type="secondary"):
-            st.rerun()
+    # Background force-scrape job started from this session, if any (checked first so a
+    # finished job's stale cached responses are dropped before fetching)
+    api_client.get_scrape_job(profile['_id'])
     
-    # Get enhanced status with selected logs count
-    current_status = api_client.get_task_status(profile['_id'], logs_count=logs_to_show)
+    # Status, post details and sentiment are independent, so fetch them concurrently
+    aio = AsyncAPIClient(api_client)
+    results = run_concurrently({
+        "status": aio.get_task_status(profile['_id'], logs_count=st.session_state.get(f"profile_logs_count_{profile['_id']}", 10)),
+        "details": aio.get_task_details(profile['_id']),
+        "sentiment": aio.get_sentiment_summary(profile['_id']),
+    })
     
-    if current_status:
-        if current_status.get('is_processing'):
-            st.info("Task is processing...")
-            
-            # Display logs if available
-            if current_status.get('logs'):
-                logs = current_status['logs']
-                st.success(f"📊 Showing {len(logs)} latest logs (Total available: {current_status.get('logs_count', 0)})")
+    # Status panel reruns on its own (auto-refresh, log count, refresh button) without the rest of the page
+    @st.fragment
+    def task_status_panel(prefetched):
+        # Add logs count selector
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            logs_to_show = st.selectbox(
+                "Logs to show:",
+                options=[5, 10, 20, 50, 100],
+                index=1,  # Default to 10
+                key=f"profile_logs_count_{profile['_id']}"
+            )
+        with col2:
+            # Clicking reruns only this panel (the auto-refresh clicks it too)
+            st.button("Refresh Status", key=f"refresh_profile_status_{profile['_id']}", type="secondary")
+        
+        # Full page runs hand over the status fetched with the rest of the page; panel reruns fetch their own
+        current_status = prefetched.pop("status") if "status" in prefetched else api_client.get_task_status(profile['_id'], logs_count=logs_to_show)
+        
+        scrape_job = api_client.get_scrape_job(profile['_id'])
+        if scrape_job:
+            if scrape_job['status'] in ('queued', 'running'):
+                st.caption(f"Background scrape request {scrape_job['status']} ({int(time.time() - scrape_job['submitted_at'])}s)")
+            elif scrape_job['status'] == 'failed':
+                st.error(f"Background scrape failed: {scrape_job.get('error')}")
+        
+        if current_status:
+            if current_status.get('is_processing'):
+                st.info("Task is processing...")
                 
-                # Display logs in a nice format
-                for i, log in enumerate(reversed(logs)):  # Show newest first
-                    timestamp = datetime.fromtimestamp(log.get('timestamp', 0)).strftime('%H:%M:%S')
-                    message = log.get('message', 'No message')
+                # Display logs if available
+                if current_status.get('logs'):
+                    logs = current_status['logs']
+                    st.success(f"📊 Showing {len(logs)} latest logs (Total available: {current_status.get('logs_count', 0)})")
                     
-                    # Create a nice log entry display
-                    with st.container():
-                        col1, col2 = st.columns([1, 4])
-                        with col1:
-                            st.markdown(f"**{timestamp}**")
-                        with col2:
-                            st.markdown(message)
+                    # Display logs in a nice format
+                    for i, log in enumerate(reversed(logs)):  # Show newest first
+                        timestamp = datetime.fromtimestamp(log.get('timestamp', 0)).strftime('%H:%M:%S')
+                        message = log.get('message', 'No message')
+                        
+                        # Create a nice log entry display
+                        with st.container():
+                            col1, col2 = st.columns([1, 4])
+                            with col1:
+                                st.markdown(f"**{timestamp}**")
+                            with col2:
+                                st.markdown(message)
+                        
+                        # Add separator between logs (except for last one)
+                        if i < len(logs) - 1:
+                            st.markdown("---")
                     
-                    # Add separator between logs (except for last one)
-                    if i < len(logs) - 1:
+                    # Show latest event summary
+                    latest_event = current_status.get('latest_event')
+                    if latest_event:
                         st.markdown("---")
-                
-                # Show latest event summary
-                latest_event = current_status.get('latest_event')
-                if latest_event:
-                    st.markdown("---")
-                    st.markdown('<h4 class="main-header">Latest Event Summary</h4>', unsafe_allow_html=True)
-                    st.markdown(f"**Event:** {latest_event.get('event_type', 'Unknown')}")
-                    st.markdown(f"**Time:** {datetime.fromtimestamp(latest_event.get('timestamp', 0)).strftime('%Y-%m-%d %H:%M:%S')}")
-                    st.markdown(f"**Message:** {latest_event.get('message', 'No message')}")
+                        st.markdown('<h4 class="main-header">Latest Event Summary</h4>', unsafe_allow_html=True)
+                        st.markdown(f"**Event:** {latest_event.get('event_type', 'Unknown')}")
+                        st.markdown(f"**Time:** {datetime.fromtimestamp(latest_event.get('timestamp', 0)).strftime('%Y-%m-%d %H:%M:%S')}")
+                        st.markdown(f"**Message:** {latest_event.get('message', 'No message')}")
+                else:
+                    # Fallback to basic display
+                    latest_event = current_status.get('latest_event')
+                    if latest_event:
+                        st.caption(
+                            f"Latest: {latest_event.get('event_type', 'event')} at "
+                            f"{datetime.fromtimestamp(latest_event.get('timestamp', 0)).strftime('%Y-%m-%d %H:%M:%S')}"
+                        )
             else:
-                # Fallback to basic display
-                latest_event = current_status.get('latest_event')
-                if latest_event:
-                    st.caption(
-                        f"Latest: {latest_event.get('event_type', 'event')} at "
-                        f"{datetime.fromtimestamp(latest_event.get('timestamp', 0)).strftime('%Y-%m-%d %H:%M:%S')}"
-                    )
+                st.success("Task is idle/completed")
         else:
-            st.success("Task is idle/completed")
-    else:
-        st.warning("Unable to fetch task status.")
+            st.warning("Unable to fetch task status.")
 
-    # Backward-compat monitor flag: if set and now completed, clear it
-    if hasattr(st.session_state, 'monitor_task_id'):
-        if not (current_status and current_status.get('is_processing')):
-            del st.session_state.monitor_task_id
+        # Backward-compat monitor flag: if set and now completed, clear it
+        if hasattr(st.session_state, 'monitor_task_id'):
+            if not (current_status and current_status.get('is_processing')):
+                del st.session_state.monitor_task_id
+
+        # Poll again soon while processing, back off while idle
+        schedule_auto_refresh(
+            f"profile_status_{profile['_id']}",
+            f"refresh_profile_status_{profile['_id']}",
+            current_status.get('is_processing') if current_status else None,
+        )
+
+    task_status_panel({"status": results["status"]})
 
     # Get detailed task data
-    task_details = api_client.get_task_details(profile['_id'])
+    task_details = results["details"]
     
     # Support both 'posts', 'scraped_posts', and nested 'target_profile_data.scraped_posts'
     posts_list = None
@@ -201,113 +280,70 @@ def show_profile_details(api_client):
         st.markdown('<h3 class="main-header">Recent Posts Analysis</h3>', unsafe_allow_html=True)
         posts = posts_list
         
-        # Create metrics
-        def get_like_count(p):
-            return p.get('likes', p.get('likes_count', 0))
-        def get_comment_count(p):
-            return p.get('comments_count', p.get('comments', 0))
-
-        total_likes = sum(get_like_count(post) for post in posts)
-        total_comments = sum(get_comment_count(post) for post in posts)
-        avg_likes = total_likes / len(posts) if posts else 0
-        avg_comments = total_comments / len(posts) if posts else 0
+        # Columnar metrics, computed once per scrape and shared between reruns and sessions
+        last_scraped = task_details.get('last_scraped', profile.get('last_scraped'))
+        analytics = get_post_analytics(profile['_id'], last_scraped, posts)
+        totals = analytics.totals
         
         # Display metrics
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total Posts", len(posts))
+            st.metric("Total Posts", totals['posts'])
         with col2:
-            st.metric("Total Likes", f"{total_likes:,}")
+            st.metric("Total Likes", f"{totals['likes']:,}")
         with col3:
-            st.metric("Total Comments", f"{total_comments:,}")
+            st.metric("Total Comments", f"{totals['comments']:,}")
         with col4:
-            st.metric("Avg Likes/Post", f"{avg_likes:.0f}")
+            st.metric("Avg Likes/Post", f"{totals['avg_likes']:.0f}")
         
-        # Posts table
-        st.markdown('<h4 class="main-header">Recent Posts</h4>', unsafe_allow_html=True)
-        posts_data = []
-        for post in posts[:10]:  # Show last 10 posts
-            caption = post.get('caption', '')
-            if caption and len(caption) > 100:
-                caption = caption[:100] + '...'
-            posts_data.append({
-                'Caption': caption,
-                'Likes': get_like_count(post),
-                'Comments': get_comment_count(post),
-                'Date': datetime.fromtimestamp(post.get('timestamp', 0)).strftime('%Y-%m-%d') if post.get('timestamp') else 'Unknown'
-            })
-        
-        if posts_data:
-            df = pd.DataFrame(posts_data)
-            st.dataframe(df, use_container_width=True)
+        # Posts list, paginated by Config.PAGINATION; paging and opening a post rerun only this panel
+        pagination = Config.PAGINATION
+        shown_count = min(len(posts), pagination["max_posts_display"])
 
-        # Per-post comments and sentiment details
-        st.markdown('<h4 class="main-header">Comments & Sentiment (per post)</h4>', unsafe_allow_html=True)
-        emoji_map = Config.SENTIMENT_CONFIG["emoji_map"]
-        for idx, post in enumerate(posts[:10]):
-            caption_full = post.get('caption', '') or ''
-            date_str = (
-                datetime.fromtimestamp(post.get('timestamp', 0)).strftime('%Y-%m-%d %H:%M')
-                if post.get('timestamp') else 'Unknown'
-            )
-            header = f"Post {idx+1} • {date_str}"
-            with st.expander(header, expanded=False):
-                # Basic metrics
-                colm1, colm2, colm3, colm4 = st.columns(4)
-                with colm1:
-                    st.metric("Likes", f"{get_like_count(post):,}")
-                with colm2:
-                    st.metric("Comments", f"{get_comment_count(post):,}")
-                with colm3:
-                    views = post.get('video_view_count', 0)
-                    if views:
-                        st.metric("Views", f"{views:,}")
-                with colm4:
-                    st.metric("Type", post.get('type', 'Unknown'))
+        @st.fragment
+        def posts_panel():
+            per_page = pagination["posts_per_page"]
+            page_count = max((shown_count - 1) // per_page + 1, 1)
+            st.markdown('<h4 class="main-header">Recent Posts</h4>', unsafe_allow_html=True)
+            page = 1
+            if page_count > 1:
+                page_key = f"posts_page_{profile['_id']}"
+                # A new scrape can leave fewer pages than the one kept in session state
+                stored = st.session_state.get(page_key)
+                if stored is not None and not 1 <= stored <= page_count:
+                    st.session_state[page_key] = min(max(int(stored), 1), page_count)
+                # No explicit value: the widget starts at min_value and keeps its page in session state
+                page = st.number_input(
+                    "Posts page", min_value=1, max_value=page_count, step=1, key=page_key
+                )
+            first = (page - 1) * per_page
+            last = min(first + per_page, shown_count)
+            limited = f" (latest {shown_count} of {len(posts)})" if len(posts) > shown_count else ""
+            st.caption(f"Showing posts {first + 1}-{last} of {shown_count}{limited}")
 
-                st.markdown("**Caption:**")
-                st.write(caption_full)
+            if last > first:
+                st.dataframe(analytics.table(first, last), use_container_width=True)
 
-                # Sentiment from top_comments
-                top_comments = post.get('top_comments', []) or []
-                if top_comments:
-                    counts = {"positive": 0, "negative": 0, "neutral": 0}
-                    for c in top_comments:
-                        s = (c.get('sentiment') or 'neutral').lower()
-                        if s not in counts:
-                            s = 'neutral'
-                        counts[s] += 1
-                    total = sum(counts.values()) or 1
-                    percentages = {k: (v / total) * 100 for k, v in counts.items()}
-
-                    colc1, colc2 = st.columns([1, 1])
-                    with colc1:
-                        st.markdown("**Sentiment Summary:**")
-                        for s in ["positive", "neutral", "negative"]:
-                            emoji = emoji_map.get(s, "😐")
-                            st.markdown(f"{emoji} {s.capitalize()}: {counts[s]} ({percentages[s]:.1f}%)")
-                    with colc2:
-                        try:
-                            fig = px.pie(values=list(counts.values()), names=list(counts.keys()), title="Sentiment")
-                            st.plotly_chart(fig, use_container_width=True)
-                        except Exception:
-                            pass
+            # Per-post comments and sentiment: only titles are listed, the opened post is rendered on demand
+            st.markdown('<h4 class="main-header">Comments & Sentiment (per post)</h4>', unsafe_allow_html=True)
+            titles = analytics.titles(first, last)
+            opened = st.selectbox(
+                "Open post:",
+                options=[int(idx) for idx in titles.index],
+                format_func=lambda idx: titles[idx],
+                index=None,
+                placeholder="Choose a post...",
+                key=f"open_post_{profile['_id']}_{page}",
+            )
+            if opened is not None and opened in titles.index:
+                with st.container(border=True):
+                    st.markdown(f"**{titles[opened]}**")
+                    display_post_details(analytics, opened)
 
-                    st.markdown("**Top Comments:**")
-                    for c in top_comments:
-                        s = (c.get('sentiment') or 'neutral').lower()
-                        emoji = emoji_map.get(s, "😐")
-                        username = c.get('owner_username', 'unknown')
-                        text = c.get('text', '')
-                        likes = c.get('likes_count', 0)
-                        ts = c.get('timestamp')
-                        ts_str = datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M') if ts else 'Unknown'
-                        st.markdown(f"{emoji} **@{username}** ({ts_str})  |  {likes} likes\n\n{text}")
-                else:
-                    st.info("No top comments available for this post.")
+        posts_panel()
         
         # Sentiment analysis with improved visualization
-        sentiment_summary = api_client.get_sentiment_summary(profile['_id'])
+        sentiment_summary = results["sentiment"]
         if sentiment_summary:
             display_sentiment_analysis(sentiment_summary)
     else:
@@ -1,6 +1,9 @@
 import streamlit as st
 import json
 from datetime import datetime
+from services.async_client import AsyncAPIClient, run_concurrently
+from services.text_stream import TextAccumulator, ThrottledRenderer
+from config import Config
 
 def show_project_chat(api_client):
     """Show project chat interface matching the exact UI from the image"""
@@ -14,24 +17,21 @@ def show_project_chat(api_client):
     # Function to load existing chat history from API
     def load_project_chat_history(api_client, project):
         try:
-            # Ensure the project key exists in session state
-            if project not in st.session_state.local_user_data["projects"]:
-                st.session_state.local_user_data["projects"][project] = {}
-            if "chats" not in st.session_state.local_user_data["projects"][project]:
-                st.session_state.local_user_data["projects"][project]["chats"] = []
-            
-            # Try to get existing chat data from project data if available
+            # Refresh the cached project (disk or memory) only if the server's mod_count moved on
             try:
-                project_data = api_client.get_project_data(project)
-                if project_data and isinstance(project_data, dict):
-                    # Check if project data contains chat history
-                    if "chats" in project_data and isinstance(project_data["chats"], list):
-                        st.session_state.local_user_data["projects"][project]["chats"] = project_data["chats"]
-                    elif "chat_history" in project_data and isinstance(project_data["chat_history"], list):
-                        st.session_state.local_user_data["projects"][project]["chats"] = project_data["chat_history"]
+                api_client.check_and_reload_project_data(project)
             except Exception:
                 # If API call fails, keep existing local chats
                 pass
+            
+            # Ensure the project key exists in session state
+            if project not in st.session_state.local_user_data["projects"]:
+                st.session_state.local_user_data["projects"][project] = {}
+            project_data = st.session_state.local_user_data["projects"][project]
+            if "chats" not in project_data:
+                # Older payloads name the list chat_history
+                history = project_data.get("chat_history")
+                project_data["chats"] = history if isinstance(history, list) else []
                 
         except Exception as e:
             # If anything fails, ensure we have a safe structure
@@ -40,6 +40,13 @@ def show_project_chat(api_client):
             if "chats" not in st.session_state.local_user_data["projects"][project]:
                 st.session_state.local_user_data["projects"][project]["chats"] = []
     
+    # The project list and tracking tasks are independent, so fetch them concurrently
+    aio = AsyncAPIClient(api_client)
+    results = run_concurrently({
+        "projects": aio.get_project_list(),
+        "tasks": aio.get_tracking_tasks(),
+    })
+    
     # Simplified top bar - one row only
     col1, col2 = st.columns([1, 2])
     
@@ -59,7 +66,7 @@ def show_project_chat(api_client):
     
     with col2:
         # Project dropdown selector with refresh capability
-        projects = api_client.get_project_list()
+        projects = results["projects"] or []
         
         # Project selector only (no refresh button)
         if projects:
@@ -142,8 +149,8 @@ def show_project_chat(api_client):
             st.session_state.current_page = 'project_tracker'
             st.rerun()
     
-    # Get tracking tasks for profile selector in form
-    tasks = api_client.get_tracking_tasks()
+    # Tracking tasks for the profile selector in the form were fetched above
+    tasks = results["tasks"]
     
     # Chat conversation area - make it scrollable with fixed height
     st.markdown("**Chat History**")
@@ -329,10 +336,9 @@ def show_project_chat(api_client):
                 combined_message = message
             
             # Add user message to local cache and fallback history
+            optimistic_message = {'role': 'user', 'type': 'text', 'text': combined_message}
             try:
-                st.session_state.local_user_data["projects"][project]["chats"].append({
-                    'role': 'user', 'type': 'text', 'text': combined_message
-                })
+                st.session_state.local_user_data["projects"][project]["chats"].append(optimistic_message)
             except Exception:
                 st.session_state.chat_history.append({'role': 'user', 'text': combined_message})
 
@@ -344,19 +350,26 @@ def show_project_chat(api_client):
                     # Create a placeholder for the streaming AI response
                     ai_message_placeholder = st.empty()
                     
-                    # Process streaming response in real-time
-                    aggregated_text = ""
+                    # Process streaming response in real-time, redrawing at a bounded frame rate
+                    aggregated_text = TextAccumulator()
+                    renderer = ThrottledRenderer(
+                        ai_message_placeholder,
+                        aggregated_text,
+                        fps=Config.STREAMING_CONFIG["render_fps"],
+                        template="**AI:** {text}",
+                    )
                     assistant_message_added_via_mods = False
+                    user_message_added_via_mods = False
                     
                     try:
                         for text_chunk, is_final, data_mods in api_client.process_streaming_response(streaming_response, project):
-                            if text_chunk:
-                                aggregated_text += text_chunk
-                                # Update the placeholder in real-time
-                                ai_message_placeholder.markdown(f"**AI:** {aggregated_text}")
+                            # The final tuple carries the whole reply, which was already accumulated
+                            if text_chunk and not is_final:
+                                aggregated_text.append(text_chunk)
+                                renderer.update()
                             
                             # Check if this was added via data_mods
-                            if data_mods and not assistant_message_added_via_mods:
+                            if data_mods and not (assistant_message_added_via_mods and user_message_added_via_mods):
                                 for mod in data_mods:
                                     try:
                                         key_path = mod.get("key_path")
@@ -373,28 +386,46 @@ def show_project_chat(api_client):
                                             for m in messages:
                                                 if isinstance(m, dict) and m.get("role") == "assistant":
                                                     assistant_message_added_via_mods = True
-                                                    break
+                                                elif isinstance(m, dict) and m.get("role") == "user":
+                                                    user_message_added_via_mods = True
                                     except Exception:
                                         continue
                             
                             # If final, break the loop
                             if is_final:
+                                # Error tuples arrive only as final; make sure they are shown
+                                if text_chunk and not aggregated_text:
+                                    aggregated_text.append(text_chunk)
                                 break
+                        renderer.flush()
                         
+                        # The server echoed the user message as a mod: drop the optimistic copy
+                        if user_message_added_via_mods:
+                            try:
+                                chats = st.session_state.local_user_data["projects"][project]["chats"]
+                                for index, chat in enumerate(chats):
+                                    if chat is optimistic_message:
+                                        del chats[index]
+                                        break
+                            except Exception:
+                                pass
+
                         # Add the complete AI response to chat history if not already added via data_mods
                         if aggregated_text and not assistant_message_added_via_mods:
                             try:
                                 st.session_state.local_user_data["projects"][project]["chats"].append({
-                                    'role': 'assistant', 'type': 'text', 'text': aggregated_text
+                                    'role': 'assistant', 'type': 'text', 'text': aggregated_text.text
                                 })
                             except Exception:
-                                st.session_state.chat_history.append({'role': 'assistant', 'text': aggregated_text})
+                                st.session_state.chat_history.append({'role': 'assistant', 'text': aggregated_text.text})
                                 
                     except Exception as e:
                         st.error(f"Error processing streaming response: {e}")
                 else:
                     st.error("Failed to get AI response")
 
+            # Messages added here rather than through data_mods do not move our mod_count: take over the server's
+            api_client.sync_project_mod_count(project)
             st.rerun()
     
     # Close input container
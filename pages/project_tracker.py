@@ -5,6 +5,10 @@ from plotly.subplots import make_subplots
 import time
 from datetime import datetime
 from config import Config
+from services.async_client import AsyncAPIClient, run_concurrently
+from services.reel_import import parse_reel_imports, existing_reel_keys
+from services.status_poller import schedule_auto_refresh
+from services.figure_cache import cached_figure
 
 def show_project_tracker(api_client):
     """Show project reel tracking interface"""
@@ -18,11 +22,18 @@ def show_project_tracker(api_client):
     # Project selector and navigation tabs at the top
     st.markdown('<h1 class="brand-title">Project Tracker</h1>', unsafe_allow_html=True)
     
+    # The project list and this project's reel tasks are independent, so fetch them concurrently
+    aio = AsyncAPIClient(api_client)
+    results = run_concurrently({
+        "projects": aio.get_project_list(),
+        "reel_tasks": aio.get_project_reel_tasks(project),
+    })
+    
     # Project selector and navigation
     col1, col2, col3 = st.columns([2, 1, 1])
     with col1:
         # Project dropdown selector
-        projects = api_client.get_project_list()
+        projects = results["projects"] or []
         if projects:
             current_project_idx = projects.index(project) if project in projects else 0
             selected_project = st.selectbox(
@@ -94,8 +105,8 @@ def show_project_tracker(api_client):
     
     st.markdown("---")
 
-    # Load existing reel tasks once for the page
-    reel_tasks = api_client.get_project_reel_tasks(project)
+    # Reel tasks were loaded once for the page above
+    reel_tasks = results["reel_tasks"] or []
 
     # Always-visible status panel at the top
     st.markdown('<h3 class="main-header">Current Reel Task Status</h3>', unsafe_allow_html=True)
@@ -126,71 +137,91 @@ def show_project_tracker(api_client):
                 selected_task_id = tid
                 break
 
-        # Show enhanced status with logs
-        st.subheader("📊 Reel Task Status")
-        
-        # Add logs count selector
-        col1, col2 = st.columns([1, 3])
-        with col1:
-            logs_to_show = st.selectbox(
-                "Logs to show:",
-                options=[5, 10, 20, 50, 100],
-                index=1,  # Default to 10
-                key=f"reel_logs_count_{selected_task_id}"
-            )
-        with col2:
-            if st.button("Refresh Status", key=f"refresh_reel_status_{selected_task_id}", type="secondary"):
-                st.rerun()
-        
-        # Get enhanced status with selected logs count
-        status = api_client.get_task_status(selected_task_id, logs_count=logs_to_show)
-        
-        if status:
-            if status.get('is_processing'):
-                st.info("⏳ Reel task is processing...")
-                
-                # Display logs if available
-                if status.get('logs'):
-                    logs = status['logs']
-                    st.success(f"📊 Showing {len(logs)} latest logs (Total available: {status.get('logs_count', 0)})")
+        # Status panel reruns on its own (auto-refresh, log count, refresh button) without the rest of the page
+        @st.fragment
+        def reel_status_panel(selected_task_id):
+            # Show enhanced status with logs
+            st.subheader("📊 Reel Task Status")
+            
+            # Add logs count selector
+            col1, col2 = st.columns([1, 3])
+            with col1:
+                logs_to_show = st.selectbox(
+                    "Logs to show:",
+                    options=[5, 10, 20, 50, 100],
+                    index=1,  # Default to 10
+                    key=f"reel_logs_count_{selected_task_id}"
+                )
+            with col2:
+                # Clicking reruns only this panel (the auto-refresh clicks it too)
+                st.button("Refresh Status", key=f"refresh_reel_status_{selected_task_id}", type="secondary")
+            
+            # Get enhanced status with selected logs count
+            status = api_client.get_task_status(selected_task_id, logs_count=logs_to_show)
+            
+            # Background force-scrape job started from this session, if any
+            scrape_job = api_client.get_scrape_job(selected_task_id)
+            if scrape_job:
+                if scrape_job['status'] in ('queued', 'running'):
+                    st.caption(f"⏳ Background scrape request {scrape_job['status']} ({int(time.time() - scrape_job['submitted_at'])}s)")
+                elif scrape_job['status'] == 'failed':
+                    st.error(f"⚠️ Background scrape failed: {scrape_job.get('error')}")
+            
+            if status:
+                if status.get('is_processing'):
+                    st.info("⏳ Reel task is processing...")
                     
-                    # Display logs in a nice format
-                    for i, log in enumerate(reversed(logs)):  # Show newest first
-                        timestamp = datetime.fromtimestamp(log.get('timestamp', 0)).strftime('%H:%M:%S')
-                        message = log.get('message', 'No message')
+                    # Display logs if available
+                    if status.get('logs'):
+                        logs = status['logs']
+                        st.success(f"📊 Showing {len(logs)} latest logs (Total available: {status.get('logs_count', 0)})")
                         
-                        # Create a nice log entry display
-                        with st.container():
-                            col1, col2 = st.columns([1, 4])
-                            with col1:
-                                st.markdown(f"**{timestamp}**")
-                            with col2:
-                                st.markdown(message)
+                        # Display logs in a nice format
+                        for i, log in enumerate(reversed(logs)):  # Show newest first
+                            timestamp = datetime.fromtimestamp(log.get('timestamp', 0)).strftime('%H:%M:%S')
+                            message = log.get('message', 'No message')
+                            
+                            # Create a nice log entry display
+                            with st.container():
+                                col1, col2 = st.columns([1, 4])
+                                with col1:
+                                    st.markdown(f"**{timestamp}**")
+                                with col2:
+                                    st.markdown(message)
+                            
+                            # Add separator between logs (except for last one)
+                            if i < len(logs) - 1:
+                                st.markdown("---")
                         
-                        # Add separator between logs (except for last one)
-                        if i < len(logs) - 1:
+                        # Show latest event summary
+                        latest_event = status.get('latest_event')
+                        if latest_event:
                             st.markdown("---")
-                    
-                    # Show latest event summary
-                    latest_event = status.get('latest_event')
-                    if latest_event:
-                        st.markdown("---")
-                        st.subheader("🎯 Latest Event Summary")
-                        st.markdown(f"**Event:** {latest_event.get('event_type', 'Unknown')}")
-                        st.markdown(f"**Time:** {datetime.fromtimestamp(latest_event.get('timestamp', 0)).strftime('%Y-%m-%d %H:%M:%S')}")
-                        st.markdown(f"**Message:** {latest_event.get('message', 'No message')}")
+                            st.subheader("🎯 Latest Event Summary")
+                            st.markdown(f"**Event:** {latest_event.get('event_type', 'Unknown')}")
+                            st.markdown(f"**Time:** {datetime.fromtimestamp(latest_event.get('timestamp', 0)).strftime('%Y-%m-%d %H:%M:%S')}")
+                            st.markdown(f"**Message:** {latest_event.get('message', 'No message')}")
+                    else:
+                        # Fallback to basic display
+                        latest_event = status.get('latest_event')
+                        if latest_event:
+                            st.caption(
+                                f"Latest: {latest_event.get('event_type', 'event')} at "
+                                f"{datetime.fromtimestamp(latest_event.get('timestamp', 0)).strftime('%Y-%m-%d %H:%M:%S')}"
+                            )
                 else:
-                    # Fallback to basic display
-                    latest_event = status.get('latest_event')
-                    if latest_event:
-                        st.caption(
-                            f"Latest: {latest_event.get('event_type', 'event')} at "
-                            f"{datetime.fromtimestamp(latest_event.get('timestamp', 0)).strftime('%Y-%m-%d %H:%M:%S')}"
-                        )
+                    st.success("✅ Reel task is idle/completed")
             else:
-                st.success("✅ Reel task is idle/completed")
-        else:
-            st.warning("⚠️ Unable to fetch reel task status.")
+                st.warning("⚠️ Unable to fetch reel task status.")
+
+            # Poll again soon while processing, back off while idle
+            schedule_auto_refresh(
+                f"reel_status_{selected_task_id}",
+                f"refresh_reel_status_{selected_task_id}",
+                status.get('is_processing') if status else None,
+            )
+
+        reel_status_panel(selected_task_id)
     else:
         st.caption("No reel tasks yet.")
 
@@ -231,7 +262,72 @@ def show_project_tracker(api_client):
                         st.error("Failed to add reel to tracking")
                 else:
                     st.error("Please enter a reel URL")
-    
+
+    # Bulk import many reels at once
+    with st.expander("Bulk Import Reels", expanded=False):
+        import_summary = st.session_state.get('reel_import_summary')
+        if import_summary and import_summary.get('project') == project:
+            st.success(f"Last import: added {import_summary['created']} reel(s), {import_summary['failed']} failed, {import_summary['skipped']} skipped")
+            for failed_url in import_summary['failed_urls'][:20]:
+                st.caption(f"Failed: {failed_url}")
+
+        with st.form("bulk_reel_import_form", clear_on_submit=True):
+            pasted = st.text_area(
+                "Reel URLs",
+                placeholder="https://www.instagram.com/reel/ABC123/\nhttps://www.instagram.com/reel/DEF456/, 7",
+                help="One URL per line, optionally followed by a comma and the scrape interval in days"
+            )
+            uploaded = st.file_uploader(
+                "Or upload a CSV",
+                type=["csv", "txt"],
+                help="Columns: url, interval_days (the interval column is optional)"
+            )
+            default_interval = st.number_input(
+                "Default Scrape Interval (days)",
+                min_value=Config.BULK_IMPORT_CONFIG["min_interval_days"],
+                max_value=Config.BULK_IMPORT_CONFIG["max_interval_days"],
+                value=2.0,
+                step=0.5,
+                help="Used for rows without their own interval"
+            )
+            import_submit = st.form_submit_button("Import Reels")
+
+        if import_submit:
+            # Pasted text and the CSV are parsed as separate sources so each keeps its own header and line numbers
+            sources = [("pasted list", pasted or "")]
+            if uploaded is not None:
+                sources.append((uploaded.name, uploaded.getvalue().decode("utf-8-sig", errors="replace")))
+
+            parsed = parse_reel_imports(sources, default_interval, existing_reel_keys(reel_tasks))
+            reels, skipped = parsed["reels"], parsed["invalid"] + parsed["duplicates"]
+            if skipped:
+                with st.expander(f"Skipped {len(skipped)} row(s)", expanded=not reels):
+                    for row in skipped:
+                        st.caption(f"{row['source']} line {row['line']}: {row['value'] or '(empty)'} ({row['reason']})")
+
+            if not reels:
+                st.warning("No new reels to import.")
+            else:
+                progress = st.progress(0.0, text=f"Importing {len(reels)} reel(s)...")
+                status_line = st.empty()
+                created, failed_urls = 0, []
+                for done, (reel, task_id) in enumerate(api_client.create_reel_tracking_tasks(project, reels), start=1):
+                    if task_id:
+                        created += 1
+                    else:
+                        failed_urls.append(reel['url'])
+                    progress.progress(done / len(reels), text=f"Imported {done} of {len(reels)} reel(s)")
+                    status_line.caption(f"{'Added' if task_id else 'Failed'}: {reel['url']}")
+
+                st.session_state.reel_import_summary = {
+                    'project': project,
+                    'created': created,
+                    'failed': len(failed_urls),
+                    'failed_urls': failed_urls,
+                    'skipped': len(skipped),
+                }
+                st.rerun()
+
     # Display existing reel tasks
     st.markdown('<h3 class="main-header">Tracked Reels</h3>', unsafe_allow_html=True)
 
@@ -240,6 +336,9 @@ def show_project_tracker(api_client):
     else:
         st.markdown(f"**Total tracked reels:** {len(reel_tasks)}")
         
+        # Resolve every reel's live status in one concurrent pass instead of one request per reel
+        reel_statuses = api_client.get_task_statuses([t['_id'] for t in reel_tasks], logs_count=5)  # 5 logs for quick status
+        
         for task in reel_tasks:
             with st.container():
                 st.markdown("---")
@@ -261,7 +360,7 @@ def show_project_tracker(api_client):
 
                     # Show live processing status for this task
                     try:
-                        t_status = api_client.get_task_status(task['_id'], logs_count=5)  # Get 5 logs for quick status
+                        t_status = reel_statuses.get(task['_id'])
                         if t_status and t_status.get('is_processing'):
                             st.caption("Status: ⏳ processing")
                             # Show latest log if available
@@ -279,12 +378,9 @@ def show_project_tracker(api_client):
                 with col2:
                     # Actions
                     if st.button("Force Scrape", key=f"force_scrape_reel_{task['_id']}"):
-                        with st.spinner("Starting reel scrape in background..."):
-                            if api_client.force_scrape_reel_task(task['_id']):
-                                st.success("Scraping initiated! Monitoring status...")
-                                st.session_state.monitor_reel_task_id = task['_id']
-                            else:
-                                st.error("Failed to scrape")
+                        api_client.start_force_scrape_reel_task(task['_id'])
+                        st.success("Scraping started in the background! Monitoring status...")
+                        st.session_state.monitor_reel_task_id = task['_id']
                     
                     if st.button("Update Interval", key=f"update_reel_interval_{task['_id']}"):
                         st.session_state.editing_reel_task_id = task['_id']
@@ -437,29 +533,33 @@ def show_project_tracker(api_client):
                     })
             
             if performance_data:
-                df = pd.DataFrame(performance_data)
-                
-                # Create performance chart
-                fig = make_subplots(
-                    rows=1, cols=3,
-                    subplot_titles=('Likes', 'Comments', 'Views'),
-                    specs=[[{"type": "bar"}, {"type": "bar"}, {"type": "bar"}]]
-                )
-                
-                fig.add_trace(
-                    go.Bar(x=df['Reel ID'], y=df['Likes'], name='Likes'),
-                    row=1, col=1
-                )
-                fig.add_trace(
-                    go.Bar(x=df['Reel ID'], y=df['Comments'], name='Comments'),
-                    row=1, col=2
-                )
-                fig.add_trace(
-                    go.Bar(x=df['Reel ID'], y=df['Views'], name='Views'),
-                    row=1, col=3
-                )
+                def build_performance_chart():
+                    df = pd.DataFrame(performance_data)
+                    
+                    fig = make_subplots(
+                        rows=1, cols=3,
+                        subplot_titles=('Likes', 'Comments', 'Views'),
+                        specs=[[{"type": "bar"}, {"type": "bar"}, {"type": "bar"}]]
+                    )
+                    
+                    fig.add_trace(
+                        go.Bar(x=df['Reel ID'], y=df['Likes'], name='Likes'),
+                        row=1, col=1
+                    )
+                    fig.add_trace(
+                        go.Bar(x=df['Reel ID'], y=df['Comments'], name='Comments'),
+                        row=1, col=2
+                    )
+                    fig.add_trace(
+                        go.Bar(x=df['Reel ID'], y=df['Views'], name='Views'),
+                        row=1, col=3
+                    )
+                    
+                    fig.update_layout(height=400, showlegend=False)
+                    return fig
                 
-                fig.update_layout(height=400, showlegend=False)
+                # Served from the figure cache until the reel numbers change
+                fig = cached_figure("reel_performance", performance_data, build_performance_chart)
                 st.plotly_chart(fig, use_container_width=True)
             
             # Show sentiment summary with visual bars
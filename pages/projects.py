@@ -80,23 +80,18 @@ def show_projects_page(api_client):
                 col_bulk1, col_bulk2 = st.columns(2)
                 with col_bulk1:
                     if st.button("Delete Selected", type="primary", key="bulk_delete"):
-                        st.info(f"Deleting {len(selected_projects)} project(s)...")
+                        with st.spinner(f"Deleting {len(selected_projects)} project(s)..."):
+                            # Runs the deletions concurrently and purges the local cache once
+                            report = api_client.delete_projects(selected_projects)
                         success_count = 0
                         failed_count = 0
-                        for project in selected_projects:
-                            st.write(f"Deleting project: {project}")
-                            if api_client.delete_project(project):
+                        for project, outcome in report.items():
+                            if outcome["deleted"]:
                                 success_count += 1
                                 st.write(f"Successfully deleted: {project}")
-                                # Remove from local cache if it exists
-                                try:
-                                    if project in st.session_state.local_user_data.get("projects", {}):
-                                        del st.session_state.local_user_data["projects"][project]
-                                except Exception:
-                                    pass
                             else:
                                 failed_count += 1
-                                st.write(f"Failed to delete: {project}")
+                                st.write(f"Failed to delete: {project} ({outcome['error']})")
                         
                         if failed_count == 0:
                             st.success(f"Successfully deleted {success_count} project(s)!")
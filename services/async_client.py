@@ -0,0 +1,130 @@
+"""
+asyncio facade over APIClient with concurrent fan-out of independent calls.
+
+Every coroutine runs the matching synchronous APIClient method on a worker
+thread. The calls still go through the shared pooled transport, so a batch
+of N independent requests costs roughly as much as the slowest one instead
+of the sum of all of them.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Dict, List, Optional
+
+from services.concurrency import bind_script_ctx
+
+
+class AsyncAPIClient:
+    """Async variant of APIClient with the same method surface"""
+
+    def __init__(self, client, max_concurrency: int = 10):
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Semaphores are bound to the loop they are first used in
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _call(self, method_name: str, *args, **kwargs):
+        # Worker threads need the script context to read st.session_state
+        method = bind_script_ctx(getattr(self.client, method_name))
+        async with self._get_semaphore():
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+    # Authentication
+    async def login(self, email: str, password: str) -> bool:
+        return await self._call("login", email, password)
+
+    async def signup(self, email: str, password: str) -> bool:
+        return await self._call("signup", email, password)
+
+    async def delete_account(self) -> bool:
+        return await self._call("delete_account")
+
+    # Projects
+    async def get_project_list(self) -> List[str]:
+        return await self._call("get_project_list")
+
+    async def create_project(self, project_name: str) -> bool:
+        return await self._call("create_project", project_name)
+
+    async def delete_project(self, project_name: str) -> bool:
+        return await self._call("delete_project", project_name)
+
+    async def get_project_data(self, project_name: str) -> Optional[Dict]:
+        return await self._call("get_project_data", project_name)
+
+    async def get_project_mod_count(self, project_name: str) -> Optional[int]:
+        return await self._call("get_project_mod_count", project_name)
+
+    async def ai_chat(self, project_name: str, message: str):
+        return await self._call("ai_chat", project_name, message)
+
+    # Instagram profile tracking
+    async def create_tracking_task(self, target_profile: str, is_competitor: bool = False) -> Optional[str]:
+        return await self._call("create_tracking_task", target_profile, is_competitor)
+
+    async def get_tracking_tasks(self) -> List[Dict]:
+        return await self._call("get_tracking_tasks")
+
+    async def get_task_details(self, task_id: str) -> Optional[Dict]:
+        return await self._call("get_task_details", task_id)
+
+    async def force_scrape_task(self, task_id: str) -> bool:
+        return await self._call("force_scrape_task", task_id)
+
+    async def delete_tracking_task(self, task_id: str) -> bool:
+        return await self._call("delete_tracking_task", task_id)
+
+    async def update_scrape_interval(self, task_id: str, interval_days: float) -> bool:
+        return await self._call("update_scrape_interval", task_id, interval_days)
+
+    async def get_sentiment_summary(self, task_id: str) -> Optional[Dict]:
+        return await self._call("get_sentiment_summary", task_id)
+
+    # Instagram reel tracking
+    async def create_reel_tracking_task(self, project_name: str, reel_url: str, scrape_interval_days: int = 2) -> Optional[str]:
+        return await self._call("create_reel_tracking_task", project_name, reel_url, scrape_interval_days)
+
+    async def get_project_reel_tasks(self, project_name: str) -> List[Dict]:
+        return await self._call("get_project_reel_tasks", project_name)
+
+    async def force_scrape_reel_task(self, task_id: str) -> bool:
+        return await self._call("force_scrape_reel_task", task_id)
+
+    async def delete_reel_task(self, task_id: str) -> bool:
+        return await self._call("delete_reel_task", task_id)
+
+    async def get_task_status(self, task_id: str, logs_count: int = 10) -> Optional[Dict]:
+        return await self._call("get_task_status", task_id, logs_count=logs_count)
+
+
+async def gather_calls(calls: Dict[str, Awaitable]) -> Dict[str, Any]:
+    """Await named coroutines concurrently; a call that raises yields None"""
+    keys = list(calls.keys())
+    results = await asyncio.gather(*calls.values(), return_exceptions=True)
+    gathered = {}
+    for key, result in zip(keys, results):
+        if isinstance(result, Exception):
+            print(f"Concurrent call '{key}' failed: {result}")
+            result = None
+        gathered[key] = result
+    return gathered
+
+
+def run_concurrently(calls: Dict[str, Awaitable]) -> Dict[str, Any]:
+    """Run named coroutines concurrently from synchronous (page) code
+
+    Example:
+        aio = AsyncAPIClient(api_client)
+        results = run_concurrently({
+            "status": aio.get_task_status(task_id, logs_count=10),
+            "details": aio.get_task_details(task_id),
+        })
+    """
+    return asyncio.run(gather_calls(calls))
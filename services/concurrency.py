@@ -0,0 +1,130 @@
+"""
+Bounded thread-pool helpers for running independent API calls concurrently.
+
+Worker threads do not inherit Streamlit's script run context, which APIClient
+needs for st.session_state (debug logs, local cache). These helpers attach the
+calling script's context to every worker before running the call.
+"""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from config import Config
+
+try:
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+except ImportError:  # Allows use outside of a Streamlit runtime (benchmarks, scripts)
+    add_script_run_ctx = None
+    get_script_run_ctx = None
+
+
+def bind_script_ctx(fn: Callable) -> Callable:
+    """Wrap fn so it runs with the current script's Streamlit context on any thread
+
+    The caller's context variables (e.g. the rerun being profiled) are carried over too.
+    """
+    ctx = get_script_run_ctx(suppress_warning=True) if get_script_run_ctx else None
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+        # A Context can only be entered by one thread at a time, so every call gets its own copy
+        return context.copy().run(fn, *args, **kwargs)
+
+    return run
+
+
+def map_concurrently(fn: Callable[[Any], Any], items: Iterable[Any], max_workers: Optional[int] = None) -> List[Any]:
+    """Call fn on every item with a bounded worker pool, preserving input order
+
+    A call that raises yields None in its slot so one failure cannot sink the batch.
+    """
+    items = list(items)
+    if not items:
+        return []
+    workers = max(1, min(max_workers or Config.CONCURRENCY_CONFIG["max_workers"], len(items)))
+    bound = bind_script_ctx(fn)
+
+    def safe_call(item):
+        try:
+            return bound(item)
+        except Exception as e:
+            print(f"Concurrent call failed for {item!r}: {e}")
+            return None
+
+    if workers == 1:
+        return [safe_call(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(safe_call, items))
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls to at most rate_per_second"""
+
+    def __init__(self, rate_per_second: float):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the caller may make its next call"""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def iter_concurrently(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: Optional[int] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> Iterator[Tuple[Any, Any]]:
+    """Like map_concurrently, but yield (item, result) as each call completes
+
+    Lets callers report progress while the batch is still running. A call that
+    raises yields None as its result. At most two calls per worker are queued
+    ahead of the consumer; if it stops early (the script is stopped mid-import),
+    queued calls are cancelled and running ones are not waited for.
+    """
+    items = list(items)
+    if not items:
+        return
+    workers = max(1, min(max_workers or Config.CONCURRENCY_CONFIG["max_workers"], len(items)))
+    bound = bind_script_ctx(fn)
+
+    def safe_call(item):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            return bound(item)
+        except Exception as e:
+            print(f"Concurrent call failed for {item!r}: {e}")
+            return None
+
+    pending_items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = {}
+        for item in pending_items:
+            futures[executor.submit(safe_call, item)] = item
+            if len(futures) >= workers * 2:
+                break
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = futures.pop(future)
+                for next_item in pending_items:
+                    futures[executor.submit(safe_call, next_item)] = next_item
+                    break
+                yield item, future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,136 @@
+"""
+Batch engine for applying backend data_mods to the local user-data cache.
+
+Each mod is {"key_path": [...], "mode": "create"|"edit"|"del"|"append",
+"value": ...}. apply_data_mods() keeps the same semantics as the original
+per-mod walk in APIClient.apply_user_data_mods, but:
+
+- a parent path is resolved with one lookup per key; the membership test
+  of the original walk is left to KeyError, and only create mode then
+  falls back to the checked walk that adds the missing dicts.
+- consecutive mods that share a parent path (the common streaming case,
+  e.g. a new chat message followed by edits to projects/<name>/chats/-1)
+  reuse the resolved container. A mod only ever changes parent[last_key],
+  never the parent itself, so the container stays valid for the next mod.
+  A per-batch cache of parents keyed by path tuple was measured slower:
+  building and hashing the key costs more than the two to four lookups of
+  a typical path.
+- every mod is counted as applied or rejected instead of failing silently
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+MODES = frozenset({"create", "edit", "del", "append"})
+
+
+def _create_parent(root: dict, parent_path: list) -> Optional[Any]:
+    """Walk to the container that holds a create mod's last key, adding missing dicts on the way"""
+    node = root
+    for key in parent_path:
+        if isinstance(node, dict):
+            if key not in node:
+                node[key] = {}
+            node = node[key]
+        elif isinstance(node, list) and isinstance(key, int):
+            node = node[key]
+        else:
+            return None
+    return node
+
+
+def apply_data_mods(root: dict, mods: Optional[Iterable[dict]]) -> Dict[str, Any]:
+    """Apply a batch of data_mods to root in order.
+
+    Returns {"applied": int, "rejected": int, "modified_projects": set}. As
+    before, a project counts as modified by any well-formed mod under
+    projects/<name> other than one on its mod_count.
+    """
+    applied = rejected = 0
+    modified_projects: set[str] = set()
+    group_path: Optional[list] = None
+    parent: Any = None
+
+    for mod in mods or ():
+        try:
+            key_path = mod.get("key_path")
+            mode = mod.get("mode")
+            value = mod.get("value")
+        except AttributeError:
+            rejected += 1
+            continue
+        if not isinstance(key_path, list) or mode not in MODES or not key_path:
+            rejected += 1
+            continue
+        size = len(key_path)
+        if size >= 2 and key_path[0] == "projects" and isinstance(key_path[1], str):
+            if not (size == 3 and key_path[2] == "mod_count"):
+                modified_projects.add(key_path[1])
+
+        # Consecutive mods on the same parent reuse the resolved container
+        parent_path = key_path[:-1]
+        if parent is None or parent_path != group_path:
+            parent = root
+            try:
+                for key in parent_path:
+                    if isinstance(parent, dict):
+                        parent = parent[key]
+                    elif isinstance(parent, list) and isinstance(key, int):
+                        parent = parent[key]
+                    else:
+                        parent = None
+                        break
+            except KeyError:
+                parent = _create_parent(root, parent_path) if mode == "create" else None
+            except (IndexError, TypeError):
+                parent = None
+            if parent is None:
+                group_path = None
+                rejected += 1
+                continue
+            group_path = parent_path
+
+        last_key = key_path[-1]
+        try:
+            if isinstance(parent, dict):
+                if mode == "append":
+                    current = parent.get(last_key)
+                    if not isinstance(current, list):
+                        parent[last_key] = current = []
+                    current.append(value)
+                elif mode == "del":
+                    parent.pop(last_key, None)
+                else:
+                    parent[last_key] = value
+            elif isinstance(parent, list) and isinstance(last_key, int):
+                length = len(parent)
+                if mode == "edit":
+                    parent[last_key] = value
+                elif mode == "create":
+                    if last_key == length:
+                        parent.append(value)
+                    elif last_key < length:
+                        parent[last_key] = value
+                    else:
+                        rejected += 1
+                        continue
+                elif mode == "del":
+                    if last_key >= length:
+                        rejected += 1
+                        continue
+                    parent.pop(last_key)
+                else:
+                    if last_key >= length:
+                        rejected += 1
+                        continue
+                    if not isinstance(parent[last_key], list):
+                        parent[last_key] = []
+                    parent[last_key].append(value)
+            else:
+                rejected += 1
+                continue
+        except (IndexError, TypeError):
+            rejected += 1
+            continue
+        applied += 1
+
+    return {"applied": applied, "rejected": rejected, "modified_projects": modified_projects}
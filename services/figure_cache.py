@@ -0,0 +1,122 @@
+"""
+Process-wide LRU cache of built Plotly figures.
+
+Building a figure (px.pie, make_subplots + traces) costs tens of
+milliseconds per chart on every rerun, while handing an already built Figure
+to st.plotly_chart costs about one. Figures are keyed by a content hash of
+the data they are built from, so an unchanged chart is served from the cache
+and a changed one gets a new key; the stale entry simply ages out.
+
+The cache is bounded both by entry count and by the total size of the
+figures' serialized JSON (what Streamlit sends to the browser), evicting the
+least recently used figures first. Cached figures are shared between
+sessions and must be treated as read-only.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from config import Config
+
+
+def figure_key(kind: str, data: Any) -> str:
+    """Content hash of a chart kind and the data it is built from"""
+    payload = json.dumps([kind, data], sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class FigureCache:
+    """LRU cache of figures bounded by entry count and serialized size"""
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.oversized = 0
+
+    def get_or_build(self, kind: str, data: Any, build: Callable[[], Any]):
+        """Return the cached figure for (kind, data), building and caching it on a miss
+
+        build() must derive the figure from data alone; anything else that
+        changes its output belongs in data (or kind) too.
+        """
+        key = figure_key(kind, data)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Build outside the lock; two sessions racing on the same key just build twice
+        import plotly.io as pio  # deferred so importing this module stays cheap
+
+        fig = build()
+        size = len(pio.to_json(fig, validate=False))
+        with self._lock:
+            if size > self.max_bytes:
+                self.oversized += 1
+                return fig
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (fig, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+        return fig
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+                "evictions": self.evictions,
+                "oversized": self.oversized,
+            }
+
+
+_figure_cache: Optional[FigureCache] = None
+_figure_cache_lock = threading.Lock()
+
+
+def get_figure_cache() -> FigureCache:
+    """Get the process-wide figure cache, creating it on first use"""
+    global _figure_cache
+    with _figure_cache_lock:
+        if _figure_cache is None:
+            cache_config = Config.FIGURE_CACHE_CONFIG
+            _figure_cache = FigureCache(
+                max_entries=cache_config["max_entries"],
+                max_bytes=cache_config["max_megabytes"] * 1024 * 1024,
+            )
+        return _figure_cache
+
+
+def cached_figure(kind: str, data: Any, build: Callable[[], Any]):
+    """Build a figure through the shared cache (or directly when caching is disabled)"""
+    if not Config.FIGURE_CACHE_CONFIG["enabled"]:
+        return build()
+    return get_figure_cache().get_or_build(kind, data, build)
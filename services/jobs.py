@@ -0,0 +1,112 @@
+"""
+Background job registry for long-running, fire-and-forget API calls.
+
+Force-scrape requests can hold an HTTP call open for up to 15 minutes. They
+run here on a process-wide executor instead of on the Streamlit script
+thread; pages keep only the job ID and poll progress through get_task_status.
+Job functions must not touch st.session_state, because they outlive the
+script run that submitted them.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from config import Config
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+FINISHED_STATES = {JOB_SUCCEEDED, JOB_FAILED}
+
+
+class JobRegistry:
+    """Runs jobs on a bounded thread pool and tracks their state by job ID"""
+
+    def __init__(self, max_workers: int = 4, max_finished_jobs: int = 200):
+        self.max_finished_jobs = max_finished_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="codvid-job")
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._active_by_key: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, target_id: str, fn: Callable[[], Any]) -> str:
+        """Queue fn and return its job ID
+
+        If the same kind of job is already queued or running for target_id,
+        its ID is returned instead of starting a duplicate.
+        """
+        key = f"{kind}:{target_id}"
+        with self._lock:
+            active_id = self._active_by_key.get(key)
+            if active_id and self._jobs.get(active_id, {}).get("status") not in FINISHED_STATES:
+                return active_id
+            job_id = uuid.uuid4().hex
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "kind": kind,
+                "target_id": target_id,
+                "status": JOB_QUEUED,
+                "submitted_at": time.time(),
+                "started_at": None,
+                "finished_at": None,
+                "result": None,
+                "error": None,
+            }
+            self._active_by_key[key] = job_id
+            self._prune()
+        self._executor.submit(self._run, job_id, key, fn)
+        return job_id
+
+    def _run(self, job_id: str, key: str, fn: Callable[[], Any]):
+        self._update(job_id, status=JOB_RUNNING, started_at=time.time())
+        try:
+            result = fn()
+            status = JOB_SUCCEEDED if result else JOB_FAILED
+            self._update(job_id, status=status, result=result, finished_at=time.time(),
+                         error=None if result else "Request was not accepted by the backend")
+        except Exception as e:
+            self._update(job_id, status=JOB_FAILED, error=str(e), finished_at=time.time())
+        finally:
+            with self._lock:
+                if self._active_by_key.get(key) == job_id:
+                    del self._active_by_key[key]
+
+    def _update(self, job_id: str, **fields):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.update(fields)
+
+    def _prune(self):
+        # Drop the oldest finished jobs once over the limit; active jobs are never dropped
+        finished = [jid for jid, job in self._jobs.items() if job["status"] in FINISHED_STATES]
+        for jid in finished[:max(len(finished) - self.max_finished_jobs, 0)]:
+            del self._jobs[jid]
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Snapshot of a job's state, or None if unknown or pruned"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+
+_registry: Optional[JobRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_job_registry() -> JobRegistry:
+    """Process-wide job registry, shared by every session"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            jobs_config = Config.BACKGROUND_JOBS_CONFIG
+            _registry = JobRegistry(
+                max_workers=jobs_config["max_workers"],
+                max_finished_jobs=jobs_config["max_finished_jobs"],
+            )
+        return _registry
@@ -0,0 +1,142 @@
+"""
+Fixed-capacity ring buffer for API debug logs.
+
+Replaces the unbounded st.session_state.api_logs list. Entries are evicted
+oldest-first once either the entry count or the total serialized size goes
+over its limit, and request/response fields larger than max_body_bytes are
+replaced with a truncated preview before they are stored.
+
+The untruncated originals of truncated entries are kept on the side, within
+their own max_full_bytes budget (oldest dropped first), so that
+full_entries() can hand complete bodies to the replay corpus export
+(services/replay.py) while the viewer only ever sees the previews.
+"""
+
+import json
+import threading
+from collections import deque
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+class LogStore:
+    """Ring buffer of debug log entries with byte-size accounting"""
+
+    def __init__(self, max_entries: int = 500, max_bytes: int = 5_000_000, max_body_bytes: int = 20_000,
+                 max_full_bytes: int = 0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_body_bytes = max_body_bytes
+        self.max_full_bytes = max_full_bytes
+        self._entries: deque = deque()
+        self._total_bytes = 0
+        # seq -> (size, original entry) for truncated entries, oldest first
+        self._full: Dict[int, Tuple[int, Dict[str, Any]]] = {}
+        self._full_bytes = 0
+        self._lock = threading.Lock()
+        self.evicted = 0
+        self.truncated = 0
+        self._next_seq = 0
+
+    @staticmethod
+    def _size(value: Any) -> int:
+        try:
+            return len(json.dumps(value, default=str))
+        except Exception:
+            return len(str(value))
+
+    def _truncate(self, value: Any) -> Any:
+        size = self._size(value)
+        if size <= self.max_body_bytes:
+            return value
+        self.truncated += 1
+        preview = value if isinstance(value, str) else json.dumps(value, default=str)
+        return {
+            "_truncated": True,
+            "original_bytes": size,
+            "preview": preview[:self.max_body_bytes],
+        }
+
+    def _shrink(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        entry = dict(entry)
+        for section in ("request", "response"):
+            value = entry.get(section)
+            if isinstance(value, dict):
+                entry[section] = {k: self._truncate(v) for k, v in value.items()}
+            elif value is not None:
+                entry[section] = self._truncate(value)
+        return entry
+
+    def append(self, entry: Dict[str, Any]):
+        truncated_before = self.truncated
+        shrunk = self._shrink(entry)
+        size = self._size(shrunk)
+        full = None
+        if self.truncated != truncated_before and self.max_full_bytes:
+            full = dict(entry)
+            full_size = self._size(full)
+            if full_size > self.max_full_bytes:
+                full = None
+        with self._lock:
+            # Stable ID so viewers can keep a selection while newer entries arrive
+            shrunk["seq"] = self._next_seq
+            self._next_seq += 1
+            self._entries.append((size, shrunk))
+            self._total_bytes += size
+            if full is not None:
+                full["seq"] = shrunk["seq"]
+                self._full[shrunk["seq"]] = (full_size, full)
+                self._full_bytes += full_size
+            # Keep at least the newest entry even if it alone exceeds max_bytes
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+            ):
+                old_size, old = self._entries.popleft()
+                self._total_bytes -= old_size
+                self.evicted += 1
+                self._drop_full(old["seq"])
+            while self._full_bytes > self.max_full_bytes:
+                self._drop_full(next(iter(self._full)))
+
+    def _drop_full(self, seq: int):
+        dropped = self._full.pop(seq, None)
+        if dropped is not None:
+            self._full_bytes -= dropped[0]
+
+    def latest(self, limit: int | None = None) -> List[Dict[str, Any]]:
+        """Newest entries first"""
+        with self._lock:
+            entries = [entry for _, entry in reversed(self._entries)]
+        return entries[:limit] if limit is not None else entries
+
+    def full_entries(self) -> List[Dict[str, Any]]:
+        """Oldest entries first, with the untruncated original wherever one is still kept"""
+        with self._lock:
+            return [self._full.get(entry["seq"], (0, entry))[1] for _, entry in self._entries]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            self._full.clear()
+            self._full_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "evicted": self.evicted,
+                "truncated": self.truncated,
+                "full_bytes": self._full_bytes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Oldest entries first"""
+        with self._lock:
+            entries = [entry for _, entry in self._entries]
+        return iter(entries)
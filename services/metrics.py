@@ -0,0 +1,246 @@
+"""
+Always-on, process-wide API metrics per backend endpoint.
+
+APIClient records every backend call here, independent of debug mode:
+latency in a fixed-bucket histogram, error counts by HTTP status (or
+"exception" when no response came back) and request/response payload
+sizes. Recording is a dict lookup and a few additions under one lock, so it
+stays cheap on every request, and all sessions in the process share the same
+counters.
+
+Endpoints are labelled by method and path with object IDs and query strings
+folded away (".../delete_reel_task/{id}"), so the number of series stays
+bounded. Snapshots are available as a dict (sidebar panel), JSON or
+Prometheus text, and start_metrics_exporter() serves the latter two on a
+local port:
+
+    http://127.0.0.1:9464/metrics       Prometheus text format
+    http://127.0.0.1:9464/metrics.json  JSON snapshot
+"""
+
+import bisect
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from config import Config
+
+OTHER_ENDPOINT = "{other}"
+_ID_SEGMENT = re.compile(r"/(?:[0-9a-fA-F]{24}|[0-9a-fA-F-]{36}|\d+)(?=/|$)")
+
+
+def endpoint_label(endpoint: str) -> str:
+    """Path of an endpoint with the query string dropped and object IDs replaced by {id}"""
+    return _ID_SEGMENT.sub("/{id}", endpoint.split("?", 1)[0])
+
+
+class _EndpointStats:
+    __slots__ = ("bucket_counts", "count", "sum_ms", "max_ms", "errors", "request_bytes", "response_bytes")
+
+    def __init__(self, bucket_count: int):
+        # One slot per bucket bound plus the overflow (+Inf) slot; counts are per bucket, not cumulative
+        self.bucket_counts = [0] * (bucket_count + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+        self.errors: Dict[str, int] = {}
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+
+class APIMetrics:
+    """Latency histograms, error counts and payload sizes keyed by (method, endpoint)"""
+
+    def __init__(self, buckets_ms: Sequence[float], max_endpoints: int = 100):
+        self.buckets_ms = sorted(float(b) for b in buckets_ms)
+        self.max_endpoints = max_endpoints
+        self._lock = threading.Lock()
+        self._endpoints: Dict[Tuple[str, str], _EndpointStats] = {}
+        self._started_at = time.time()
+
+    def _stats_for(self, method: str, endpoint: str) -> _EndpointStats:
+        key = (method.upper(), endpoint_label(endpoint))
+        stats = self._endpoints.get(key)
+        if stats is None:
+            if len(self._endpoints) >= self.max_endpoints:
+                key = (key[0], OTHER_ENDPOINT)
+                stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = _EndpointStats(len(self.buckets_ms))
+        return stats
+
+    def observe(self, method: str, endpoint: str, duration_ms: float, status_code: Optional[int] = None,
+                request_bytes: int = 0, response_bytes: int = 0, error: Optional[str] = None):
+        """Record one call; error is set for failed calls (an HTTP status or "exception")"""
+        index = bisect.bisect_left(self.buckets_ms, duration_ms)
+        with self._lock:
+            stats = self._stats_for(method, endpoint)
+            stats.bucket_counts[index] += 1
+            stats.count += 1
+            stats.sum_ms += duration_ms
+            if duration_ms > stats.max_ms:
+                stats.max_ms = duration_ms
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+            if error is not None:
+                stats.errors[error] = stats.errors.get(error, 0) + 1
+
+    def add_response_bytes(self, method: str, endpoint: str, response_bytes: int):
+        """Add bytes received after the call was observed (streamed bodies)"""
+        with self._lock:
+            self._stats_for(method, endpoint).response_bytes += response_bytes
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+            self._started_at = time.time()
+
+    def _quantile(self, stats: _EndpointStats, q: float) -> float:
+        """Estimate a latency quantile by interpolating within its histogram bucket"""
+        if not stats.count:
+            return 0.0
+        rank = q * stats.count
+        seen = 0
+        lower = 0.0
+        for bound, count in zip(self.buckets_ms + [stats.max_ms], stats.bucket_counts):
+            upper = max(bound, lower)
+            if count and seen + count >= rank:
+                return min(lower + (upper - lower) * (rank - seen) / count, stats.max_ms)
+            seen += count
+            lower = upper
+        return stats.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Point-in-time copy of every endpoint's metrics, slowest p95 first"""
+        with self._lock:
+            endpoints: List[Dict[str, Any]] = []
+            for (method, endpoint), stats in self._endpoints.items():
+                endpoints.append({
+                    "method": method,
+                    "endpoint": endpoint,
+                    "count": stats.count,
+                    "errors": dict(stats.errors),
+                    "error_count": sum(stats.errors.values()),
+                    "mean_ms": stats.sum_ms / stats.count if stats.count else 0.0,
+                    "p50_ms": self._quantile(stats, 0.5),
+                    "p95_ms": self._quantile(stats, 0.95),
+                    "p99_ms": self._quantile(stats, 0.99),
+                    "max_ms": stats.max_ms,
+                    "sum_ms": stats.sum_ms,
+                    "buckets": list(stats.bucket_counts),
+                    "request_bytes": stats.request_bytes,
+                    "response_bytes": stats.response_bytes,
+                })
+            started_at = self._started_at
+        endpoints.sort(key=lambda e: e["p95_ms"], reverse=True)
+        return {
+            "started_at": started_at,
+            "generated_at": time.time(),
+            "buckets_ms": list(self.buckets_ms),
+            "endpoints": endpoints,
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot())
+
+    def to_prometheus(self) -> str:
+        """Snapshot in the Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        bounds = [f"{b / 1000:g}" for b in snapshot["buckets_ms"]] + ["+Inf"]
+        lines = [
+            "# HELP codvid_api_request_duration_seconds Backend API call latency seen by the client.",
+            "# TYPE codvid_api_request_duration_seconds histogram",
+        ]
+        errors = ["# HELP codvid_api_errors_total Failed backend API calls by HTTP status or exception.",
+                  "# TYPE codvid_api_errors_total counter"]
+        request_bytes = ["# HELP codvid_api_request_bytes_total Request payload bytes sent.",
+                         "# TYPE codvid_api_request_bytes_total counter"]
+        response_bytes = ["# HELP codvid_api_response_bytes_total Response body bytes received.",
+                          "# TYPE codvid_api_response_bytes_total counter"]
+        for e in snapshot["endpoints"]:
+            labels = f'method="{_escape(e["method"])}",endpoint="{_escape(e["endpoint"])}"'
+            cumulative = 0
+            for bound, count in zip(bounds, e["buckets"]):
+                cumulative += count
+                lines.append(f'codvid_api_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"codvid_api_request_duration_seconds_sum{{{labels}}} {e['sum_ms'] / 1000:.6f}")
+            lines.append(f"codvid_api_request_duration_seconds_count{{{labels}}} {e['count']}")
+            for kind, count in sorted(e["errors"].items()):
+                errors.append(f'codvid_api_errors_total{{{labels},error="{_escape(kind)}"}} {count}')
+            request_bytes.append(f"codvid_api_request_bytes_total{{{labels}}} {e['request_bytes']}")
+            response_bytes.append(f"codvid_api_response_bytes_total{{{labels}}} {e['response_bytes']}")
+        return "\n".join(lines + errors + request_bytes + response_bytes) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_api_metrics: Optional[APIMetrics] = None
+_api_metrics_lock = threading.Lock()
+
+
+def get_api_metrics() -> APIMetrics:
+    """Get the process-wide API metrics, creating them on first use"""
+    global _api_metrics
+    with _api_metrics_lock:
+        if _api_metrics is None:
+            _api_metrics = APIMetrics(
+                buckets_ms=Config.METRICS_CONFIG["latency_buckets_ms"],
+                max_endpoints=Config.METRICS_CONFIG["max_endpoints"],
+            )
+        return _api_metrics
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == "/metrics":
+            body, content_type = get_api_metrics().to_prometheus(), "text/plain; version=0.0.4; charset=utf-8"
+        elif path == "/metrics.json":
+            body, content_type = get_api_metrics().to_json(), "application/json"
+        else:
+            self.send_error(404)
+            return
+        payload = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_exporter: Optional[ThreadingHTTPServer] = None
+_exporter_started = False
+_exporter_lock = threading.Lock()
+
+
+def start_metrics_exporter() -> Optional[str]:
+    """Serve /metrics and /metrics.json on the configured local port, once per process
+
+    Returns the exporter's base URL, or None when it is disabled or the port
+    could not be bound (e.g. another app process already serves it).
+    """
+    global _exporter, _exporter_started
+    with _exporter_lock:
+        if not _exporter_started:
+            _exporter_started = True
+            port = Config.METRICS_CONFIG["export_port"]
+            if Config.METRICS_CONFIG["enabled"] and port:
+                try:
+                    _exporter = ThreadingHTTPServer((Config.METRICS_CONFIG["export_host"], port), _MetricsHandler)
+                except OSError as e:
+                    print(f"Metrics exporter not started: {e}")
+                else:
+                    _exporter.daemon_threads = True
+                    threading.Thread(target=_exporter.serve_forever, name="metrics-exporter", daemon=True).start()
+        if _exporter is None:
+            return None
+        host, port = _exporter.server_address[:2]
+        return f"http://{host}:{port}"
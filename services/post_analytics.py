@@ -0,0 +1,171 @@
+"""
+Columnar post analytics for the profile details page.
+
+normalize_posts() converts a task's scraped posts once into two typed
+DataFrames, one row per post and one row per top comment, resolving the
+field-name fallbacks of the scraper output (likes/likes_count,
+comments_count/comments) on whole columns. PostAnalytics then derives the
+page's totals, table rows and per-post sentiment counts with vectorized
+pandas operations instead of loops over the post dicts.
+
+get_post_analytics() caches the result per (task ID, last_scraped) in a
+small process-wide LRU, so reruns and other sessions viewing the same
+scrape reuse it; a new scrape changes last_scraped and gets a fresh entry.
+Cached frames are shared and must be treated as read-only.
+
+This module imports pandas, so only the analytics pages should import it.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import Config
+
+SENTIMENTS = ["positive", "negative", "neutral"]
+
+
+def _numeric(frame: pd.DataFrame, *columns: str) -> pd.Series:
+    """First non-null numeric value across columns (in order), 0 when none is set"""
+    result = pd.Series(np.nan, index=frame.index, dtype="float64")
+    for column in columns:
+        if column in frame:
+            result = result.fillna(pd.to_numeric(frame[column], errors="coerce"))
+    return result.fillna(0).astype("int64")
+
+
+def _text(frame: pd.DataFrame, column: str, default: str = "") -> pd.Series:
+    if column not in frame:
+        return pd.Series(default, index=frame.index, dtype="string")
+    return frame[column].astype("string").fillna(default)
+
+
+def _local_times(frame: pd.DataFrame, column: str) -> pd.Series:
+    """Epoch seconds as local datetimes (as datetime.fromtimestamp); missing or zero timestamps become NaT"""
+    if column not in frame:
+        return pd.Series(pd.NaT, index=frame.index, dtype="datetime64[ns]")
+    seconds = pd.to_numeric(frame[column], errors="coerce")
+    seconds = seconds.where(seconds > 0)
+    valid = seconds.notna().to_numpy()
+    # UTC offsets only change on the hour, so look them up once per distinct hour
+    hours, inverse = np.unique(seconds.to_numpy()[valid] // 3600, return_inverse=True)
+    offsets = np.array([
+        datetime.fromtimestamp(hour * 3600, timezone.utc).astimezone().utcoffset().total_seconds() for hour in hours
+    ])
+    local = seconds.to_numpy(dtype="float64", copy=True)
+    local[valid] += offsets[inverse] if len(hours) else 0
+    return pd.Series(pd.to_datetime(local, unit="s"), index=frame.index)
+
+
+def _format_times(times: pd.Series, fmt: str) -> pd.Series:
+    return times.dt.strftime(fmt).astype("string").fillna("Unknown")
+
+
+def normalize_posts(posts: List[Dict[str, Any]]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Convert scraped posts into (posts, comments) frames; comments reference posts by post_index"""
+    raw = pd.DataFrame.from_records([post if isinstance(post, dict) else {} for post in posts])
+    posts_frame = pd.DataFrame({
+        "likes": _numeric(raw, "likes", "likes_count"),
+        "comments": _numeric(raw, "comments_count", "comments"),
+        "views": _numeric(raw, "video_view_count"),
+        "caption": _text(raw, "caption"),
+        "type": _text(raw, "type", "Unknown"),
+        "posted_at": _local_times(raw, "timestamp"),
+    }, index=pd.RangeIndex(len(raw), name="post_index"))
+
+    comment_rows = [
+        {**comment, "post_index": index}
+        for index, post in enumerate(posts) if isinstance(post, dict)
+        for comment in (post.get("top_comments") or []) if isinstance(comment, dict)
+    ]
+    raw_comments = pd.DataFrame.from_records(comment_rows, columns=None if comment_rows else ["post_index"])
+    sentiment = _text(raw_comments, "sentiment", "neutral").str.lower()
+    comments_frame = pd.DataFrame({
+        "post_index": raw_comments["post_index"].astype("int64"),
+        "owner_username": _text(raw_comments, "owner_username", "unknown"),
+        "text": _text(raw_comments, "text"),
+        "likes": _numeric(raw_comments, "likes_count"),
+        "posted_at": _local_times(raw_comments, "timestamp"),
+        "sentiment": pd.Categorical(sentiment.where(sentiment.isin(SENTIMENTS), "neutral"), categories=SENTIMENTS),
+    })
+    return posts_frame, comments_frame
+
+
+class PostAnalytics:
+    """Metrics of one task's scraped posts, computed once from the columnar frames"""
+
+    def __init__(self, posts: List[Dict[str, Any]]):
+        self.posts, self.comments = normalize_posts(posts)
+        count = len(self.posts)
+        total_likes = int(self.posts["likes"].sum())
+        total_comments = int(self.posts["comments"].sum())
+        self.totals = {
+            "posts": count,
+            "likes": total_likes,
+            "comments": total_comments,
+            "avg_likes": total_likes / count if count else 0,
+            "avg_comments": total_comments / count if count else 0,
+        }
+        # Comment sentiment counts per post (posts without top comments are absent)
+        self.sentiment_counts = (
+            self.comments.groupby(["post_index", "sentiment"], observed=False).size().unstack(fill_value=0)
+            .reindex(columns=SENTIMENTS, fill_value=0)
+        )
+        self.sentiment_counts = self.sentiment_counts[self.sentiment_counts.sum(axis=1) > 0]
+
+    def titles(self, start: int, stop: int) -> pd.Series:
+        """Selector titles of posts [start, stop), indexed by post_index"""
+        page = self.posts.iloc[start:stop]
+        return "Post " + (page.index + 1).astype(str) + " • " + _format_times(page["posted_at"], "%Y-%m-%d %H:%M")
+
+    def table(self, start: int, stop: int) -> pd.DataFrame:
+        """Rows of the posts table for posts [start, stop)"""
+        page = self.posts.iloc[start:stop]
+        caption = page["caption"].where(page["caption"].str.len() <= 100, page["caption"].str.slice(0, 100) + "...")
+        return pd.DataFrame({
+            "Caption": caption,
+            "Likes": page["likes"],
+            "Comments": page["comments"],
+            "Date": _format_times(page["posted_at"], "%Y-%m-%d"),
+        }).reset_index(drop=True)
+
+    def post_sentiment(self, index: int) -> Optional[Dict[str, int]]:
+        """Sentiment counts of a post's top comments, or None if it has none"""
+        if index not in self.sentiment_counts.index:
+            return None
+        return {s: int(n) for s, n in self.sentiment_counts.loc[index].items()}
+
+    def post_comments(self, index: int) -> pd.DataFrame:
+        comments = self.comments[self.comments["post_index"] == index]
+        return comments.assign(posted=_format_times(comments["posted_at"], "%Y-%m-%d %H:%M"))
+
+
+_cache: "OrderedDict[Hashable, PostAnalytics]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def get_post_analytics(task_id: str, last_scraped: Any, posts: List[Dict[str, Any]]) -> PostAnalytics:
+    """PostAnalytics for a task's posts, cached per (task_id, last_scraped)
+
+    Without a last_scraped value there is nothing to tell scrapes apart, so
+    the analytics are computed without caching.
+    """
+    if last_scraped is None:
+        return PostAnalytics(posts)
+    key = (task_id, last_scraped)
+    with _cache_lock:
+        analytics = _cache.get(key)
+        if analytics is not None:
+            _cache.move_to_end(key)
+            return analytics
+    # Build outside the lock; two sessions racing on the same scrape just build twice
+    analytics = PostAnalytics(posts)
+    with _cache_lock:
+        _cache[key] = analytics
+        while len(_cache) > Config.POST_ANALYTICS_CONFIG["max_entries"]:
+            _cache.popitem(last=False)
+    return analytics
@@ -0,0 +1,76 @@
+"""
+Parsing and validation for bulk competitor onboarding.
+
+Accepts handles separated by newlines, commas or spaces, with or without a
+leading "@", and full profile URLs. Handles are normalised to lower case,
+validated against Instagram's username rules and de-duplicated against each
+other and against a snapshot of the existing tracking tasks. Top-level
+Instagram paths that are not profiles (instagram.com/p/..., /explore/,
+/stories/...) are rejected, both as URLs and as bare handles.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+from config import Config
+
+_HANDLE = re.compile(r"^[a-z0-9._]{1,30}$")
+_PROFILE_URL = re.compile(r"^(?:https?://)?(?:www\.|m\.)?instagram\.com/([A-Za-z0-9._]+)/?(?:[?#].*)?$", re.IGNORECASE)
+# First path segments Instagram uses for its own pages; no profile can have these names
+_RESERVED_PATHS = frozenset({
+    "about", "accounts", "api", "challenge", "developer", "direct", "emails", "explore", "graphql",
+    "legal", "p", "reel", "reels", "session", "stories", "tv", "web",
+})
+_SEPARATORS = re.compile(r"[\s,;]+")
+
+
+def normalize_handle(raw: str) -> Optional[str]:
+    """Lower-case Instagram username from a handle or profile URL, or None if invalid"""
+    value = (raw or "").strip()
+    match = _PROFILE_URL.match(value)
+    if match:
+        value = match.group(1)
+    value = value.lstrip("@").lower()
+    if not _HANDLE.match(value) or value.startswith(".") or value.endswith(".") or value in _RESERVED_PATHS:
+        return None
+    return value
+
+
+def tracked_handles(tasks: Iterable[Dict[str, Any]]) -> set:
+    """Normalised handles of every profile in a get_tracking_tasks snapshot"""
+    handles = set()
+    for task in tasks or []:
+        handle = normalize_handle(task.get("target_profile", ""))
+        if handle:
+            handles.add(handle)
+    return handles
+
+
+def parse_profile_handles(text: str, existing_handles: Optional[set] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """Split pasted handles into ones to onboard and ones that were skipped.
+
+    Returns {"handles": [str], "invalid": [...], "duplicates": [...]}, where
+    skipped entries carry the raw value and a reason.
+    """
+    existing_handles = existing_handles or set()
+    max_rows = Config.BULK_IMPORT_CONFIG["max_rows"]
+    handles, invalid, duplicates = [], [], []
+    seen = set()
+
+    for raw in _SEPARATORS.split(text or ""):
+        if not raw:
+            continue
+        handle = normalize_handle(raw)
+        if not handle:
+            invalid.append({"value": raw, "reason": "not a valid Instagram handle"})
+        elif handle in existing_handles:
+            duplicates.append({"value": raw, "reason": "already tracked"})
+        elif handle in seen:
+            duplicates.append({"value": raw, "reason": "repeated in list"})
+        elif len(handles) >= max_rows:
+            invalid.append({"value": raw, "reason": f"over the {max_rows}-profile import limit"})
+        else:
+            seen.add(handle)
+            handles.append(handle)
+
+    return {"handles": handles, "invalid": invalid, "duplicates": duplicates}
@@ -0,0 +1,116 @@
+"""
+SQLite-backed persistent cache for project data across sessions.
+
+st.session_state.local_user_data is lost on every login or browser refresh.
+ProjectStore keeps each project's full data on local disk with its
+mod_count, keyed by an opaque user key and project name. The client can then
+re-download a project only when the server's mod_count has moved on.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from config import Config
+
+
+def make_user_key(base_url: str, email: str) -> str:
+    """Stable, non-reversible key for one account on one backend"""
+    return hashlib.sha256(f"{base_url.rstrip('/')}|{email.strip().lower()}".encode("utf-8")).hexdigest()
+
+
+class ProjectStore:
+    """Key-value store of (user_key, project_name) -> (mod_count, project_data)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS projects (
+                user_key TEXT NOT NULL,
+                project_name TEXT NOT NULL,
+                mod_count INTEGER,
+                data TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (user_key, project_name)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def load(self, user_key: str, project_name: str) -> Optional[Dict[str, Any]]:
+        """Return the stored project data (including its mod_count), or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM projects WHERE user_key = ? AND project_name = ?",
+                (user_key, project_name),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            self.delete(user_key, project_name)
+            return None
+
+    def save(self, user_key: str, project_name: str, project_data: Dict[str, Any]):
+        mod_count = project_data.get("mod_count") if isinstance(project_data, dict) else None
+        payload = json.dumps(project_data, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO projects (user_key, project_name, mod_count, data, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (user_key, project_name, mod_count, payload, time.time()),
+            )
+            self._conn.commit()
+
+    def delete(self, user_key: str, project_name: str):
+        self.delete_many(user_key, [project_name])
+
+    def delete_many(self, user_key: str, project_names: List[str]):
+        """Remove several projects in a single transaction"""
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM projects WHERE user_key = ? AND project_name = ?",
+                [(user_key, name) for name in project_names],
+            )
+            self._conn.commit()
+
+    def delete_user(self, user_key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM projects WHERE user_key = ?", (user_key,))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_store: Optional[ProjectStore] = None
+_store_lock = threading.Lock()
+
+
+def get_project_store() -> Optional[ProjectStore]:
+    """Process-wide project store, or None when disabled or the path is unusable"""
+    global _store
+    store_config = Config.PROJECT_STORE_CONFIG
+    if not store_config["enabled"]:
+        return None
+    with _store_lock:
+        if _store is None:
+            try:
+                _store = ProjectStore(store_config["path"])
+            except (OSError, sqlite3.Error) as e:
+                print(f"Project store unavailable: {e}")
+                return None
+        return _store
@@ -0,0 +1,146 @@
+"""
+Parsing and validation for bulk reel imports.
+
+Accepts either a pasted list (one URL per line, optionally followed by
+", <interval days>") or the text of a CSV file with a url column and an
+optional interval column. A header row is recognised as the first row of
+each source. Rows are validated, normalised to a canonical
+reel URL and de-duplicated against each other and against the project's
+existing reel tasks before anything is sent to the backend.
+"""
+
+import csv
+import io
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from config import Config
+
+_REEL_URL = re.compile(
+    r"^(?:https?://)?(?:www\.|m\.)?instagram\.com/(?:[A-Za-z0-9_.]+/)?(?:reel|reels|p)/([A-Za-z0-9_-]+)/?(?:[?#].*)?$",
+    re.IGNORECASE,
+)
+_URL_HEADERS = {"url", "reel_url", "reel", "link"}
+_INTERVAL_HEADERS = {"interval", "interval_days", "scrape_interval", "scrape_interval_days", "days"}
+
+
+def reel_shortcode(url: str) -> Optional[str]:
+    """Instagram shortcode of a reel/post URL, or None if the URL is not one"""
+    match = _REEL_URL.match((url or "").strip())
+    return match.group(1) if match else None
+
+
+def canonical_reel_url(shortcode: str) -> str:
+    return f"https://www.instagram.com/reel/{shortcode}/"
+
+
+def existing_reel_keys(reel_tasks: Iterable[Dict[str, Any]]) -> set:
+    """Shortcodes (and raw reel IDs) already tracked in a project"""
+    keys = set()
+    for task in reel_tasks or []:
+        code = reel_shortcode(task.get("reel_url", ""))
+        if code:
+            keys.add(code)
+        if task.get("reel_id"):
+            keys.add(str(task["reel_id"]))
+    return keys
+
+
+def _parse_interval(raw: str, default_interval: float) -> Tuple[Optional[float], Optional[str]]:
+    limits = Config.BULK_IMPORT_CONFIG
+    if raw is None or not str(raw).strip():
+        return default_interval, None
+    try:
+        interval = float(str(raw).strip())
+    except ValueError:
+        return None, f"invalid interval '{raw}'"
+    if not limits["min_interval_days"] <= interval <= limits["max_interval_days"]:
+        return None, f"interval must be between {limits['min_interval_days']} and {limits['max_interval_days']} days"
+    return interval, None
+
+
+def _rows(text: str) -> Iterable[Tuple[int, List[str]]]:
+    reader = csv.reader(io.StringIO(text))
+    for line_number, row in enumerate(reader, start=1):
+        cells = [cell.strip() for cell in row]
+        if cells and any(cells) and not cells[0].startswith("#"):
+            yield line_number, cells
+
+
+def parse_reel_import(
+    text: str,
+    default_interval: float,
+    existing_keys: Optional[set] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Split an import into reels to create and rows that were skipped.
+
+    Returns {"reels": [{"url", "shortcode", "interval", "line"}],
+    "invalid": [...], "duplicates": [...]}, where skipped rows carry the
+    line number, the raw value and a reason.
+    """
+    return parse_reel_imports([(None, text)], default_interval, existing_keys)
+
+
+def parse_reel_imports(
+    sources: Iterable[Tuple[Optional[str], str]],
+    default_interval: float,
+    existing_keys: Optional[set] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """parse_reel_import over several (source, text) pairs, e.g. pasted text and an uploaded CSV
+
+    Each source keeps its own header and line numbers; rows additionally
+    carry their "source". Duplicates and the row limit apply across sources.
+    """
+    existing_keys = existing_keys or set()
+    max_rows = Config.BULK_IMPORT_CONFIG["max_rows"]
+    reels, invalid, duplicates = [], [], []
+    seen = set()
+
+    for source, text in sources:
+        url_col, interval_col = 0, 1
+        first_row = True
+        for line_number, cells in _rows(text or ""):
+            header = [cell.lower() for cell in cells]
+            if first_row:
+                first_row = False
+                if _URL_HEADERS.intersection(header):
+                    url_col = next(i for i, name in enumerate(header) if name in _URL_HEADERS)
+                    interval_col = next((i for i, name in enumerate(header) if name in _INTERVAL_HEADERS), None)
+                    continue
+            row = _validate_row(cells, url_col, interval_col, default_interval)
+            row["line"] = line_number
+            if source is not None:
+                row["source"] = source
+            if "reason" in row:
+                invalid.append(row)
+            elif row["shortcode"] in existing_keys:
+                duplicates.append(_skipped(row, "already tracked"))
+            elif row["shortcode"] in seen:
+                duplicates.append(_skipped(row, "repeated in import"))
+            elif len(reels) >= max_rows:
+                invalid.append(_skipped(row, f"over the {max_rows}-reel import limit"))
+            else:
+                seen.add(row["shortcode"])
+                row.pop("value")
+                reels.append(row)
+
+    return {"reels": reels, "invalid": invalid, "duplicates": duplicates}
+
+
+def _skipped(row: Dict[str, Any], reason: str) -> Dict[str, Any]:
+    skipped = {key: row[key] for key in ("line", "source", "value") if key in row}
+    skipped["reason"] = reason
+    return skipped
+
+
+def _validate_row(cells: List[str], url_col: int, interval_col: Optional[int], default_interval: float) -> Dict[str, Any]:
+    """A reel ({"url", "shortcode", "interval", "value"}) or an invalid row ({"value", "reason"})"""
+    raw_url = cells[url_col] if url_col < len(cells) else ""
+    raw_interval = cells[interval_col] if interval_col is not None and interval_col < len(cells) else None
+    shortcode = reel_shortcode(raw_url)
+    if not shortcode:
+        return {"value": raw_url, "reason": "not an Instagram reel URL"}
+    interval, error = _parse_interval(raw_interval, default_interval)
+    if error:
+        return {"value": raw_url, "reason": error}
+    return {"url": canonical_reel_url(shortcode), "shortcode": shortcode, "interval": interval, "value": raw_url}
@@ -0,0 +1,313 @@
+"""
+Opt-in per-rerun render profiler.
+
+profile_rerun() wraps one script run of the app and profile_section() wraps
+each page function inside it. For every section the profile records wall
+time split into API time (spent waiting on backend calls, see
+track_api_call() and track_api_iter()) and local compute time (everything
+else: pandas/plotly work and Streamlit element emission). API time is the
+union of the intervals during which at least one call of this rerun was in
+flight, so calls running concurrently on worker threads are not counted
+twice.
+
+Optionally each rerun is also captured with cProfile (the script thread
+only) or tracemalloc (process-wide, so concurrent sessions share its
+numbers; tracing is stopped again when the last capturing rerun ends). The slowest reruns of the process are written to
+Config.PROFILER_CONFIG["output_dir"] as rerun-*.json, plus a rerun-*.prof
+for cProfile captures (open with `python -m pstats` or snakeviz); files of
+reruns pushed out of the slowest set are deleted.
+
+Fragment reruns do not go through the app's main() and are not profiled.
+"""
+
+import contextvars
+import cProfile
+import glob
+import heapq
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from config import Config
+
+CAPTURE_MODES = ("none", "cprofile", "tracemalloc")
+
+_current: contextvars.ContextVar[Optional["RerunProfile"]] = contextvars.ContextVar("rerun_profile", default=None)
+
+# Reruns currently capturing with tracemalloc, and whether the profiler (not someone else) started tracing
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+_tracemalloc_started = False
+
+
+class RerunProfile:
+    """Timings of one script run, broken down by section"""
+
+    def __init__(self, page: Optional[str], capture: str = "none"):
+        self.page = page
+        self.capture = capture
+        self.started_at = time.time()
+        self.sections: List[Dict[str, Any]] = []
+        self.total_seconds = 0.0
+        self.api_calls = 0
+        self.record: Optional[Dict[str, Any]] = None  # to_dict() plus captures, set when the rerun ends
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._api_in_flight = 0
+        self._api_since = 0.0
+        self._api_seconds = 0.0
+
+    def api_started(self):
+        with self._lock:
+            if self._api_in_flight == 0:
+                self._api_since = time.perf_counter()
+            self._api_in_flight += 1
+            self.api_calls += 1
+
+    def api_finished(self):
+        with self._lock:
+            self._api_in_flight -= 1
+            if self._api_in_flight == 0:
+                self._api_seconds += time.perf_counter() - self._api_since
+
+    def api_seconds(self) -> float:
+        with self._lock:
+            if self._api_in_flight:
+                return self._api_seconds + time.perf_counter() - self._api_since
+            return self._api_seconds
+
+    @contextmanager
+    def section(self, name: str):
+        start = time.perf_counter()
+        api_before = self.api_seconds()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            api = self.api_seconds() - api_before
+            self.sections.append({
+                "name": name,
+                "seconds": seconds,
+                "api_seconds": api,
+                "compute_seconds": max(seconds - api, 0.0),
+            })
+
+    def finish(self):
+        self.total_seconds = time.perf_counter() - self._start
+
+    def to_dict(self) -> Dict[str, Any]:
+        api = self.api_seconds()
+        return {
+            "started_at": datetime.fromtimestamp(self.started_at).isoformat(),
+            "page": self.page,
+            "capture": self.capture,
+            "total_seconds": self.total_seconds,
+            "api_seconds": api,
+            "compute_seconds": max(self.total_seconds - api, 0.0),
+            "api_calls": self.api_calls,
+            "sections": list(self.sections),
+        }
+
+
+class SlowRerunStore:
+    """Keeps the files of the slowest profiled reruns on disk"""
+
+    def __init__(self, output_dir: str, keep: int = 20):
+        self.output_dir = output_dir
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._heap: Optional[List[tuple]] = None  # (total_seconds, json_path), fastest first
+
+    def _load(self):
+        # Reruns persisted by earlier processes keep competing for a slot
+        self._heap = []
+        for path in glob.glob(os.path.join(self.output_dir, "rerun-*.json")):
+            try:
+                with open(path, encoding="utf-8") as existing:
+                    self._heap.append((float(json.load(existing)["total_seconds"]), path))
+            except (OSError, ValueError, KeyError):
+                continue
+        heapq.heapify(self._heap)
+
+    def qualifies(self, total_seconds: float) -> bool:
+        with self._lock:
+            if self._heap is None:
+                self._load()
+            return len(self._heap) < self.keep or total_seconds > self._heap[0][0]
+
+    def save(self, record: Dict[str, Any], profiler: Optional[cProfile.Profile] = None) -> Optional[str]:
+        """Persist a rerun if it is among the slowest; returns its JSON path"""
+        if not self.qualifies(record["total_seconds"]):
+            return None
+        os.makedirs(self.output_dir, exist_ok=True)
+        stem = os.path.join(
+            self.output_dir,
+            f"rerun-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}-{record['total_seconds'] * 1000:.0f}ms",
+        )
+        if profiler is not None:
+            profiler.dump_stats(stem + ".prof")
+            record["cprofile_file"] = stem + ".prof"
+        with open(stem + ".json", "w", encoding="utf-8") as out:
+            json.dump(record, out, indent=2, default=str)
+        with self._lock:
+            heapq.heappush(self._heap, (record["total_seconds"], stem + ".json"))
+            while len(self._heap) > self.keep:
+                _, evicted = heapq.heappop(self._heap)
+                for path in (evicted, evicted[:-len(".json")] + ".prof"):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+        return stem + ".json"
+
+    def slowest(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            if self._heap is None:
+                self._load()
+            entries = sorted(self._heap, reverse=True)
+        return [{"total_seconds": seconds, "path": path} for seconds, path in entries]
+
+
+_store: Optional[SlowRerunStore] = None
+_store_lock = threading.Lock()
+
+
+def get_slow_rerun_store() -> SlowRerunStore:
+    """Get the process-wide store of the slowest reruns, creating it on first use"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = SlowRerunStore(Config.PROFILER_CONFIG["output_dir"], Config.PROFILER_CONFIG["keep_slowest"])
+        return _store
+
+
+def _cprofile_summary(profiler: cProfile.Profile, top_n: int) -> str:
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(top_n)
+    return out.getvalue()
+
+
+def _acquire_tracemalloc():
+    """Start tracing for a rerun unless it is already on; the first rerun to start it owns it"""
+    global _tracemalloc_users, _tracemalloc_started
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracemalloc_started = True
+        _tracemalloc_users += 1
+
+
+def _release_tracemalloc():
+    """Stop tracing once the last capturing rerun ends, if the profiler started it
+
+    Tracing slows down every allocation in the process, so it must not
+    outlive the reruns that asked for it.
+    """
+    global _tracemalloc_users, _tracemalloc_started
+    with _tracemalloc_lock:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0 and _tracemalloc_started:
+            tracemalloc.stop()
+            _tracemalloc_started = False
+
+
+def _tracemalloc_summary(top_n: int) -> List[Dict[str, Any]]:
+    stats = tracemalloc.take_snapshot().statistics("lineno")[:top_n]
+    return [{"location": str(stat.traceback[0]), "size_bytes": stat.size, "count": stat.count} for stat in stats]
+
+
+@contextmanager
+def profile_rerun(enabled: bool, page: Optional[str] = None, capture: str = "none") -> Iterator[Optional[RerunProfile]]:
+    """Profile the enclosed script run; yields None (and costs nothing) when disabled"""
+    if not enabled:
+        yield None
+        return
+    profile = RerunProfile(page, capture)
+    token = _current.set(profile)
+    profiler = None
+    if capture == "cprofile":
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:  # another profiler is already active on this interpreter
+            profiler = None
+    elif capture == "tracemalloc":
+        _acquire_tracemalloc()
+        memory_start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    try:
+        yield profile
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        profile.finish()
+        _current.reset(token)
+        record = profile.to_dict()
+        top_n = Config.PROFILER_CONFIG["top_n"]
+        store = get_slow_rerun_store()
+        if capture == "tracemalloc":
+            current, peak = tracemalloc.get_traced_memory()
+            record["tracemalloc"] = {"growth_bytes": current - memory_start, "peak_growth_bytes": peak - memory_start}
+        try:
+            if store.qualifies(record["total_seconds"]):
+                if profiler is not None:
+                    record["cprofile_top"] = _cprofile_summary(profiler, top_n)
+                if capture == "tracemalloc":
+                    record["tracemalloc"]["top_allocations"] = _tracemalloc_summary(top_n)
+                record["path"] = store.save(record, profiler)
+        except OSError as e:
+            print(f"Could not persist rerun profile: {e}")
+        finally:
+            if capture == "tracemalloc":
+                _release_tracemalloc()
+        profile.record = record
+
+
+@contextmanager
+def profile_section(name: str):
+    """Time a section (a page function) of the current rerun, if it is being profiled"""
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+    with profile.section(name):
+        yield
+
+
+@contextmanager
+def track_api_call():
+    """Mark a backend call of the current rerun as in flight"""
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+    profile.api_started()
+    try:
+        yield
+    finally:
+        profile.api_finished()
+
+
+def track_api_iter(iterable: Iterable[Any]) -> Iterator[Any]:
+    """Iterate a streamed response body, counting the waits for each chunk as API time"""
+    profile = _current.get()
+    if profile is None:
+        yield from iterable
+        return
+    iterator = iter(iterable)
+    while True:
+        profile.api_started()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            profile.api_finished()
+        yield item
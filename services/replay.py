@@ -0,0 +1,132 @@
+"""
+Replay corpus built from the debug API logs.
+
+build_replay_corpus() turns the entries in st.session_state.api_logs into a
+JSON document that benchmarks/bench_replay.py can replay without a network:
+
+- requests: every logged non-streaming call with its request body and the
+  recorded status, response body and duration
+- streams: every logged /ai/respond stream, rebuilt from the raw-chunk
+  entries (only recorded with "Log raw streaming" on) as its documents plus
+  the original chunk sizes
+
+Pass LogStore.full_entries() so that entries the log store truncated for
+display are exported with their complete bodies. Passwords and tokens are
+redacted; entries that are still truncated (their full bodies no longer
+fit the store's max_full_bytes budget) are skipped because they can no
+longer be replayed faithfully.
+"""
+
+import json
+import time
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+CORPUS_VERSION = 1
+REDACTED = "****"
+_SECRET_KEYS = frozenset({"password", "token", "session_token", "access_token", "refresh_token"})
+
+
+def _redact(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: (REDACTED if k in _SECRET_KEYS and value[k] else _redact(v)) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_redact(v) for v in value]
+    return value
+
+
+def _is_truncated(value: Any) -> bool:
+    if isinstance(value, dict):
+        return bool(value.get("_truncated")) or any(_is_truncated(v) for v in value.values())
+    return False
+
+
+def _stream_documents(response: Any) -> Optional[List[Any]]:
+    """Documents completed by one raw-chunk entry (None for a chunk that completed none)"""
+    if not isinstance(response, dict):
+        return None
+    if set(response) == {"raw"}:
+        return []
+    if set(response) == {"documents"} and isinstance(response["documents"], list):
+        return response["documents"]
+    return [response]
+
+
+def build_replay_corpus(entries: Iterable[Dict[str, Any]], base_url: Optional[str] = None) -> Dict[str, Any]:
+    """Build a replay corpus from log entries, oldest first (iterating a LogStore yields them in that order)"""
+    requests: List[Dict[str, Any]] = []
+    streams: List[Dict[str, Any]] = []
+    skipped = 0
+    stream: Optional[Dict[str, Any]] = None
+
+    def close_stream(summary: Optional[Dict[str, Any]] = None):
+        nonlocal stream, skipped
+        if stream is None:
+            return
+        if stream.pop("incomplete"):
+            skipped += 1
+        elif stream["documents"]:
+            if summary:
+                stream["recorded"] = {
+                    key: summary.get(key)
+                    for key in ("raw_chunks_count", "raw_chunks_bytes", "malformed_documents",
+                                "data_mods_applied", "data_mods_rejected")
+                }
+            streams.append(stream)
+        stream = None
+
+    for entry in entries:
+        if entry.get("stream"):
+            if "raw_chunks_count" in entry:
+                # End-of-stream summary
+                close_stream(entry)
+                continue
+            if stream is not None and stream["project"] != entry.get("project"):
+                close_stream()
+            if stream is None:
+                stream = {"project": entry.get("project"), "documents": [], "chunk_bytes": [], "incomplete": False}
+            documents = _stream_documents(entry.get("response"))
+            if documents is None or _is_truncated(entry.get("response")):
+                stream["incomplete"] = True
+                continue
+            stream["documents"].extend(_redact(documents))
+            stream["chunk_bytes"].append(entry.get("chunk_bytes"))
+            continue
+
+        response = entry.get("response") or {}
+        request = entry.get("request") or {}
+        if "status_code" not in response or _is_truncated(request) or _is_truncated(response):
+            skipped += 1
+            continue
+        url = urlsplit(request.get("url") or "")
+        requests.append({
+            "endpoint": entry.get("endpoint"),
+            "method": entry.get("method"),
+            "path": url.path + (f"?{url.query}" if url.query else ""),
+            "body": _redact(request.get("body")),
+            "status_code": response["status_code"],
+            "response": _redact(response.get("body")),
+            "duration_ms": entry.get("duration_ms"),
+        })
+    close_stream()
+
+    return {
+        "version": CORPUS_VERSION,
+        "exported_at": time.time(),
+        "base_url": base_url,
+        "requests": requests,
+        "streams": streams,
+        "skipped_entries": skipped,
+    }
+
+
+def dump_replay_corpus(corpus: Dict[str, Any]) -> str:
+    return json.dumps(corpus, default=str)
+
+
+def load_replay_corpus(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as corpus_file:
+        corpus = json.load(corpus_file)
+    if corpus.get("version") != CORPUS_VERSION:
+        raise ValueError(f"Unsupported replay corpus version: {corpus.get('version')!r}")
+    return corpus
@@ -0,0 +1,79 @@
+"""
+Per-user TTL + LRU cache for read-only API responses.
+
+One ResponseCache lives in each user's st.session_state, so cached data is
+never shared between users. Entries are keyed by (endpoint name, args) and
+expire after the endpoint's TTL; the least recently used entry is evicted
+once the cache is full. Mutating APIClient calls invalidate by endpoint name.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class ResponseCache:
+    """Size-bounded LRU cache with a per-entry expiry time"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self.evictions = 0
+
+    def _bump(self, name: str, field: str):
+        self._stats.setdefault(name, {"hits": 0, "misses": 0})[field] += 1
+
+    def get(self, name: str, args: Hashable = ()) -> Tuple[bool, Any]:
+        """Return (hit, value) for an endpoint call"""
+        key = (name, args)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._bump(name, "hits")
+                    return True, value
+                del self._entries[key]
+            self._bump(name, "misses")
+            return False, None
+
+    def set(self, name: str, args: Hashable, value: Any, ttl_seconds: float):
+        key = (name, args)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, name: str, args: Optional[Hashable] = None) -> int:
+        """Drop cached entries for an endpoint (all argument variants if args is None)"""
+        with self._lock:
+            if args is not None:
+                return 1 if self._entries.pop((name, args), None) is not None else 0
+            keys = [key for key in self._entries if key[0] == name]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = sum(s["hits"] for s in self._stats.values())
+            misses = sum(s["misses"] for s in self._stats.values())
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": (hits / (hits + misses)) if (hits + misses) else 0.0,
+                "evictions": self.evictions,
+                "per_endpoint": {name: dict(s) for name, s in self._stats.items()},
+            }
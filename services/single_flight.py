@@ -0,0 +1,99 @@
+"""
+Single-flight coalescing of identical in-flight requests.
+
+When several tabs or sessions of the same user load a page at the same
+moment they send identical read requests. SingleFlight lets the first caller
+for a key (the leader) make the call while later callers with the same key
+wait for it and receive a copy of its result, so the backend sees one
+request instead of many. Keys are only shared while a call is in flight;
+nothing is cached afterwards.
+"""
+
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Process-wide group of in-flight calls keyed by request identity"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Run fn, or wait for an identical in-flight call; returns (result, shared)
+
+        Waiters get a deep copy of the leader's result so no two callers ever
+        share a mutable response; the copy is taken from a snapshot made
+        before they are released, so the leader's caller may change its result
+        at once. If the leader's call raises, every waiter raises the same
+        error.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._executed += 1
+            else:
+                call.waiters += 1
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.error = e
+            self._release(key, call)
+            raise
+        self._release(key, call, result)
+        return result, False
+
+    def _release(self, key: Hashable, call: _Call, result: Any = None):
+        """Stop sharing key and wake its waiters, snapshotting the result for them first"""
+        with self._lock:
+            self._calls.pop(key, None)
+            waiters = call.waiters
+        try:
+            if waiters and call.error is None:
+                call.result = copy.deepcopy(result)
+        except Exception as e:
+            call.error = e
+        finally:
+            call.done.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._executed + self._coalesced
+            return {
+                "executed": self._executed,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls),
+                "coalesced_ratio": (self._coalesced / total) if total else 0.0,
+            }
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    return _single_flight
@@ -0,0 +1,113 @@
+"""
+Adaptive auto-refresh for task status panels.
+
+Status panels run inside st.fragment, so refreshing one re-executes only
+that panel instead of the whole page. The panel's own refresh button is
+clicked by a tiny browser-side trigger after a delay chosen here:
+
+- fast while the task is processing
+- backing off exponentially while it stays idle
+- nothing is scheduled while the browser tab is hidden; an overdue refresh
+  fires as soon as the tab becomes visible again
+
+st.fragment(run_every=...) was not enough on its own: its interval is fixed
+until the next full-page run and keeps firing in hidden tabs.
+
+The trigger finds the button by the st-key-<key> CSS class Streamlit adds to
+keyed elements, which needs streamlit>=1.39.
+"""
+
+import html
+import re
+import time
+from typing import Optional
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from config import Config
+
+
+class AdaptivePollSchedule:
+    """Next-refresh delay for one panel: fast while processing, backing off while idle"""
+
+    def __init__(self, fast_seconds: float, idle_seconds: float, max_idle_seconds: float, backoff_factor: float):
+        self.fast_seconds = fast_seconds
+        self.idle_seconds = idle_seconds
+        self.max_idle_seconds = max_idle_seconds
+        self.backoff_factor = backoff_factor
+        self.idle_polls = 0
+
+    def next_delay(self, is_processing: bool) -> float:
+        if is_processing:
+            self.idle_polls = 0
+            return self.fast_seconds
+        delay = self.idle_seconds * (self.backoff_factor ** self.idle_polls)
+        self.idle_polls += 1
+        return min(delay, self.max_idle_seconds)
+
+
+_TRIGGER = """
+<script>
+(function() {{
+  const doc = window.parent.document;
+  const dueAt = Date.now() + {delay_ms};
+  let timer = null;
+  function fire() {{
+    const button = doc.querySelector('.st-key-{button_key} button');
+    if (button) button.click();
+  }}
+  function arm() {{
+    clearTimeout(timer);
+    if (doc.hidden) return;
+    timer = setTimeout(function() {{ if (doc.hidden) return; doc.removeEventListener('visibilitychange', arm); fire(); }},
+                       Math.max(0, dueAt - Date.now()));
+  }}
+  doc.addEventListener('visibilitychange', arm);
+  window.addEventListener('unload', function() {{ doc.removeEventListener('visibilitychange', arm); }});
+  arm();
+}})();
+</script>
+<!-- {nonce} -->
+"""
+
+
+def _css_key(key: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_-]", "-", key)
+
+
+def schedule_auto_refresh(panel_key: str, refresh_button_key: str, is_processing: Optional[bool]):
+    """Arm the next refresh of a status panel, to be called at the end of its fragment
+
+    refresh_button_key is the key of the st.button inside the same fragment;
+    clicking it reruns just that fragment. When the status could not be
+    fetched (is_processing is None) the panel is treated as idle.
+    """
+    poll_config = Config.STATUS_POLL_CONFIG
+    if not poll_config["enabled"]:
+        return
+    if not st.toggle("Auto-refresh", value=True, key=f"{panel_key}_auto_refresh"):
+        st.session_state.pop(f"{panel_key}_poll_schedule", None)
+        return
+
+    schedule = st.session_state.get(f"{panel_key}_poll_schedule")
+    if schedule is None:
+        schedule = AdaptivePollSchedule(
+            fast_seconds=poll_config["fast_seconds"],
+            idle_seconds=poll_config["idle_seconds"],
+            max_idle_seconds=poll_config["max_idle_seconds"],
+            backoff_factor=poll_config["backoff_factor"],
+        )
+        st.session_state[f"{panel_key}_poll_schedule"] = schedule
+    delay = schedule.next_delay(bool(is_processing))
+    st.caption(f"Next refresh in {delay:.0f}s (paused while this tab is hidden)")
+
+    # The nonce changes the HTML every run so the browser drops the previous timer
+    components.html(
+        _TRIGGER.format(
+            delay_ms=int(delay * 1000),
+            button_key=html.escape(_css_key(refresh_button_key)),
+            nonce=time.time_ns(),
+        ),
+        height=0,
+    )
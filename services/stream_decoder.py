@@ -0,0 +1,254 @@
+"""
+Incremental decoder for the AI streaming response.
+
+The backend streams JSON documents (newline-delimited or back to back), but
+HTTP chunk boundaries do not line up with document boundaries: one chunk can
+hold half a document or several of them.
+
+JSONStreamDecoder works in two modes and never re-parses text it has
+already consumed:
+
+- lines (default): a raw newline can never occur inside a JSON string, so
+  text up to the last newline of a chunk is complete and is parsed in one
+  C-speed pass with raw_decode. Only the unfinished tail is held back.
+- scanner: if a document spans lines, or the stream carries no newlines
+  for longer than max_pending_chars, the decoder looks for document
+  boundaries itself. Documents that fit in the buffer go straight to
+  raw_decode. A document cut off by a chunk boundary is held (as parts, not
+  a growing string) and raw_decode is retried only when it may have ended,
+  i.e. a chunk ends in a closing bracket, as servers flush after each
+  document, and the re-parsing done for it so far is no more than its
+  size, or when it has doubled since the last attempt. Either way the
+  re-parsing stays linear in the document's size. Documents longer than
+  max_pending_chars (or malformed ones) are instead scanned for nesting
+  depth and string state across chunks, with string literals skipped whole
+  by a regex.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, List
+
+# Brackets, or a whole string literal consumed in one C-level match (closing quote in group 1)
+_TOKEN = re.compile(r'[{}\[\]]|"[^"\\]*(?:\\.[^"\\]*)*(")?')
+# Rest of a string literal that started in an earlier chunk
+_STRING_REST = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*(")?')
+_FRAME_START = re.compile(r'[{\[]')
+_NON_WHITESPACE = re.compile(r'\S')
+
+
+class JSONStreamDecoder:
+    """Split a chunked text/bytes stream into parsed JSON documents"""
+
+    def __init__(self, encoding: str = "utf-8", max_pending_chars: int = 65536):
+        self.max_pending_chars = max_pending_chars
+        self._bytes_decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._json = json.JSONDecoder()
+        self.scanner_mode = False
+        # Lines mode: unfinished tail kept as parts to avoid quadratic concatenation
+        self._parts: List[str] = []
+        self._pending = 0
+        # Scanner mode state
+        self._buffer = ""
+        self._scan_pos = 0
+        self._depth = 0
+        self._in_string = False
+        # Scanner mode: parts of a cut-off document waiting for a raw_decode retry
+        self._held: List[str] = []
+        self._held_len = 0
+        self._held_work = 0  # characters re-parsed for the held document so far
+        self._held_retry_at = 0
+        # Counters for diagnostics and benchmarks
+        self.frames_decoded = 0
+        self.frames_malformed = 0
+        self.skipped_chars = 0
+
+    def feed(self, chunk) -> List[Any]:
+        """Consume one chunk and return every document it completed"""
+        if isinstance(chunk, (bytes, bytearray)):
+            chunk = self._bytes_decoder.decode(chunk)
+        if not chunk:
+            return []
+        if self.scanner_mode:
+            return self._scan(chunk)
+
+        newline = chunk.rfind("\n")
+        if newline == -1:
+            self._parts.append(chunk)
+            self._pending += len(chunk)
+            if self._pending > self.max_pending_chars:
+                # No line breaks for a long time: switch to tracking document boundaries
+                return self._switch_to_scanner("")
+            return []
+
+        complete = "".join(self._parts) + chunk[:newline + 1] if self._parts else chunk[:newline + 1]
+        tail = chunk[newline + 1:]
+        self._parts = [tail] if tail else []
+        self._pending = len(tail)
+        return self._parse_complete(complete, final=False)
+
+    def finish(self) -> List[Any]:
+        """Flush the decoder at end of stream; an unfinished document is counted as malformed"""
+        documents = self.feed(self._bytes_decoder.decode(b"", final=True))
+        if self._held:
+            # Last chance for a held document
+            self._held_retry_at = 0
+            documents.extend(self._scan(""))
+        if self.scanner_mode:
+            if self._buffer or self._held:
+                self._held = []
+                self._held_len = 0
+                self.frames_malformed += 1
+            self._buffer = ""
+            self._scan_pos = 0
+            self._depth = 0
+            self._in_string = False
+        elif self._parts:
+            remainder = "".join(self._parts)
+            self._parts = []
+            self._pending = 0
+            documents.extend(self._parse_complete(remainder, final=True))
+        return documents
+
+    @property
+    def pending_chars(self) -> int:
+        """Characters held for a document that has not finished yet"""
+        return len(self._buffer) + self._held_len if self.scanner_mode else self._pending
+
+    def _parse_complete(self, text: str, final: bool) -> List[Any]:
+        """raw_decode every document in text, which ends on a line boundary"""
+        documents = []
+        pos = 0
+        n = len(text)
+        while True:
+            m = _NON_WHITESPACE.search(text, pos)
+            if m is None:
+                return documents
+            pos = m.start()
+            if text[pos] not in "{[":
+                # Not the start of a document (e.g. an SSE prefix): skip to the next one
+                start = _FRAME_START.search(text, pos)
+                end = start.start() if start else n
+                self.skipped_chars += len(text[pos:end].strip())
+                pos = end
+                continue
+            try:
+                document, pos = self._json.raw_decode(text, pos)
+            except json.JSONDecodeError as e:
+                if e.pos >= len(text.rstrip()) and not final:
+                    # The document continues past this line: finish it with the scanner
+                    documents.extend(self._switch_to_scanner(text[pos:]))
+                    return documents
+                self.frames_malformed += 1
+                next_line = text.find("\n", pos)
+                pos = next_line + 1 if next_line != -1 else n
+                continue
+            documents.append(document)
+            self.frames_decoded += 1
+
+    def _switch_to_scanner(self, text: str) -> List[Any]:
+        pending = text + "".join(self._parts)
+        self._parts = []
+        self._pending = 0
+        self.scanner_mode = True
+        return self._scan(pending)
+
+    def _scan(self, chunk: str) -> List[Any]:
+        work = 0
+        resumed = bool(self._held)
+        if resumed:
+            self._held.append(chunk)
+            self._held_len += len(chunk)
+            tail = chunk.rstrip()
+            may_have_ended = tail[-1:] in ("}", "]") and self._held_work <= self._held_len
+            if not (may_have_ended or self._held_len >= self._held_retry_at or self._held_len > self.max_pending_chars):
+                return []
+            chunk = "".join(self._held)
+            work = self._held_work + len(chunk)
+            self._held = []
+            self._held_len = 0
+        buf = self._buffer + chunk if self._buffer else chunk
+        n = len(buf)
+        i = self._scan_pos
+        depth = self._depth
+        in_string = self._in_string
+        frame_start = 0 if depth else None
+        retry = False
+        documents = []
+
+        while i < n:
+            if depth == 0:
+                m = _FRAME_START.search(buf, i)
+                if m is None:
+                    self.skipped_chars += len(buf[i:].strip())
+                    i = n
+                    break
+                self.skipped_chars += len(buf[i:m.start()].strip())
+                frame_start = m.start()
+                # Documents that lie entirely inside the buffer are parsed directly;
+                # only the one cut off by the chunk boundary is scanned
+                try:
+                    document, i = self._json.raw_decode(buf, frame_start)
+                except json.JSONDecodeError as e:
+                    if n - frame_start <= self.max_pending_chars and (
+                            e.pos >= len(buf.rstrip()) or e.msg.startswith("Unterminated string")):
+                        # Cut off by the chunk boundary: hold a network-sized document for a
+                        # later raw_decode retry, which is faster than scanning it
+                        retry = True
+                        if frame_start or not resumed:
+                            work = n - frame_start  # a new document, parsed once so far
+                        break
+                    depth = 1
+                    i = m.end()
+                    continue
+                documents.append(document)
+                self.frames_decoded += 1
+                frame_start = None
+            elif in_string:
+                m = _STRING_REST.match(buf, i)
+                i = m.end()
+                if m.group(1) is None:
+                    # String continues in the next chunk (a trailing backslash is rescanned then)
+                    break
+                in_string = False
+            else:
+                m = _TOKEN.search(buf, i)
+                if m is None:
+                    i = n
+                    break
+                c = m.group()[0]
+                i = m.end()
+                if c == '"':
+                    if m.group(1) is None:
+                        in_string = True
+                        break
+                elif c == '{' or c == '[':
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        try:
+                            documents.append(json.loads(buf[frame_start:i]))
+                            self.frames_decoded += 1
+                        except ValueError:
+                            self.frames_malformed += 1
+                        frame_start = None
+
+        if retry:
+            held = buf[frame_start:] if frame_start else buf
+            self._held = [held]
+            self._held_len = len(held)
+            self._held_work = work
+            self._held_retry_at = 2 * len(held)
+            self._buffer = ""
+            self._scan_pos = 0
+        elif depth:
+            self._buffer = buf[frame_start:]
+            self._scan_pos = i - frame_start
+        else:
+            self._buffer = ""
+            self._scan_pos = 0
+        self._depth = depth
+        self._in_string = in_string
+        return documents
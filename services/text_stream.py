@@ -0,0 +1,70 @@
+"""
+Helpers for building and rendering streamed AI replies.
+
+TextAccumulator collects text pieces in a list, so a reply is built in
+linear time however many tokens arrive. ThrottledRenderer redraws a
+Streamlit placeholder at most `fps` times per second, so a long answer
+is not re-rendered in full once per token.
+"""
+
+import time
+from typing import Callable, List, Optional
+
+
+class TextAccumulator:
+    """Append-only text buffer that joins its pieces lazily"""
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._length = 0
+
+    def append(self, piece: str):
+        if piece:
+            self._parts.append(piece)
+            self._length += len(piece)
+
+    @property
+    def text(self) -> str:
+        # Collapse to a single part so repeated reads do not re-join everything
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+
+class ThrottledRenderer:
+    """Redraw a placeholder from an accumulator at a bounded frame rate"""
+
+    def __init__(self, placeholder, accumulator: TextAccumulator, fps: float = 10.0,
+                 template: str = "{text}", clock: Callable[[], float] = time.monotonic):
+        self.placeholder = placeholder
+        self.accumulator = accumulator
+        self.min_interval = 1.0 / fps if fps > 0 else 0.0
+        self.template = template
+        self.clock = clock
+        self.renders = 0
+        self._last_render: Optional[float] = None
+        self._rendered_length = -1
+
+    def update(self):
+        """Render if the frame interval has passed since the last render"""
+        now = self.clock()
+        if self._last_render is not None and now - self._last_render < self.min_interval:
+            return
+        self._render(now)
+
+    def flush(self):
+        """Render whatever has not been shown yet (call once the stream ends)"""
+        if self._rendered_length != len(self.accumulator):
+            self._render(self.clock())
+
+    def _render(self, now: float):
+        self.placeholder.markdown(self.template.format(text=self.accumulator.text))
+        self._last_render = now
+        self._rendered_length = len(self.accumulator)
+        self.renders += 1
@@ -0,0 +1,287 @@
+"""
+Pooled HTTP transport shared by every APIClient in the Streamlit process.
+
+Streamlit re-executes main.py on every rerun, so anything created there is
+thrown away after each widget interaction. This module is imported once per
+process, which lets one keep-alive requests.Session per backend environment
+survive across reruns and user sessions.
+
+The transport is also the resilience layer: idempotent requests are retried
+with jittered exponential backoff, and a per-environment circuit breaker
+fails fast while the backend is down instead of letting every session keep
+hammering it.
+"""
+
+import random
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import Config
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request while the backend's circuit is open"""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker: closed -> open -> half_open -> closed
+
+    After failure_threshold consecutive failures the circuit opens and
+    requests fail fast. Once reset_timeout_seconds have passed a single probe
+    is let through (half_open); its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._times_opened = 0
+        self._short_circuited = 0
+
+    def before_request(self):
+        """Raise CircuitOpenError unless a request may be sent now"""
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout_seconds:
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self._state == self.CLOSED:
+                return
+            if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            self._short_circuited += 1
+            retry_in = max(0.0, self.reset_timeout_seconds - (time.monotonic() - self._opened_at))
+        raise CircuitOpenError(f"Backend unavailable, circuit open (next attempt in {retry_in:.0f}s)")
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self):
+        """Let another half-open probe through after one that ended inconclusively"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == self.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self._times_opened += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def get_state(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "times_opened": self._times_opened,
+                "short_circuited": self._short_circuited,
+            }
+
+
+class PooledTransport:
+    """Keep-alive requests.Session with a bounded connection pool for one base URL"""
+
+    def __init__(self, base_url: str, pool_connections: int = 4, pool_maxsize: int = 20,
+                 pool_block: bool = False, keep_alive: bool = True,
+                 resilience_config: Optional[Dict[str, Any]] = None):
+        self.base_url = base_url.rstrip('/')
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+
+        self.session = requests.Session()
+        # The session is shared by all users, so never let the backend's cookies
+        # leak from one user's request into another's. Auth uses Bearer headers.
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=0,
+        )
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+
+        resilience = resilience_config or Config.RESILIENCE_CONFIG
+        self.retry_config = resilience["retry"]
+        breaker_config = resilience["circuit_breaker"]
+        self.breaker = CircuitBreaker(
+            failure_threshold=breaker_config["failure_threshold"],
+            reset_timeout_seconds=breaker_config["reset_timeout_seconds"],
+        ) if breaker_config["enabled"] else None
+
+        self._lock = threading.Lock()
+        self._requests_sent = 0
+        self._requests_failed = 0
+        self._in_flight = 0
+        self._retries = 0
+        self._retries_succeeded = 0
+
+    def _is_backend_failure(self, response: Optional[requests.Response], error: Optional[Exception]) -> bool:
+        if error is not None:
+            return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+        return response.status_code in self.retry_config["breaker_statuses"]
+
+    def _is_retryable(self, response: Optional[requests.Response], error: Optional[Exception]) -> bool:
+        if error is not None:
+            # Only retry when the request never reached the backend; a read timeout
+            # means it is slow, and repeating the call would only add load
+            return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.ConnectTimeout)) \
+                and not isinstance(error, CircuitOpenError)
+        return response.status_code in self.retry_config["retry_statuses"]
+
+    def _backoff_seconds(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """Full-jitter exponential backoff, honouring a numeric Retry-After header"""
+        cap = self.retry_config["backoff_max_seconds"]
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), cap)
+        return random.uniform(0, min(cap, self.retry_config["backoff_base_seconds"] * (2 ** attempt)))
+
+    def _send_once(self, method: str, url: str, **kwargs) -> requests.Response:
+        if self.breaker is not None:
+            self.breaker.before_request()
+        with self._lock:
+            self._requests_sent += 1
+            self._in_flight += 1
+        response, error = None, None
+        try:
+            response = self.session.request(method=method, url=url, **kwargs)
+            return response
+        except requests.exceptions.RequestException as e:
+            error = e
+            with self._lock:
+                self._requests_failed += 1
+            raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            if self.breaker is not None:
+                if response is None and error is None:
+                    self.breaker.release_probe()
+                elif self._is_backend_failure(response, error):
+                    self.breaker.record_failure()
+                elif response is not None:
+                    self.breaker.record_success()
+                else:
+                    # e.g. an invalid URL: says nothing about the backend's health
+                    self.breaker.release_probe()
+
+    def request(self, method: str, url: str, idempotent: Optional[bool] = None, **kwargs) -> requests.Response:
+        """Send a request through the pooled session
+
+        idempotent requests (by default the methods in the retry config) are
+        retried on connection failures and retryable status codes. Streaming
+        requests are never retried. Raises CircuitOpenError while the circuit
+        is open.
+        """
+        method = method.upper()
+        if idempotent is None:
+            idempotent = method in self.retry_config["idempotent_methods"]
+        attempts = self.retry_config["max_attempts"] if idempotent and not kwargs.get("stream") else 1
+
+        for attempt in range(attempts):
+            response, error = None, None
+            try:
+                response = self._send_once(method, url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                error = e
+            last_attempt = attempt == attempts - 1
+            if last_attempt or not self._is_retryable(response, error):
+                if attempt and error is None and response.ok:
+                    with self._lock:
+                        self._retries_succeeded += 1
+                if error is not None:
+                    raise error
+                return response
+            delay = self._backoff_seconds(attempt, response)
+            if response is not None:
+                # Hand the connection back to the pool before sleeping
+                response.close()
+            with self._lock:
+                self._retries += 1
+            time.sleep(delay)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return request counters and urllib3 connection reuse statistics"""
+        connections_opened = 0
+        pool_requests = 0
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            try:
+                pool = pools[key]
+            except KeyError:
+                continue
+            connections_opened += getattr(pool, "num_connections", 0)
+            pool_requests += getattr(pool, "num_requests", 0)
+
+        reused = max(pool_requests - connections_opened, 0)
+        with self._lock:
+            return {
+                "base_url": self.base_url,
+                "pool_maxsize": self.pool_maxsize,
+                "keep_alive": self.keep_alive,
+                "requests_sent": self._requests_sent,
+                "requests_failed": self._requests_failed,
+                "in_flight": self._in_flight,
+                "connections_opened": connections_opened,
+                "connections_reused": reused,
+                "reuse_ratio": (reused / pool_requests) if pool_requests else 0.0,
+                "retries": self._retries,
+                "retries_succeeded": self._retries_succeeded,
+                "circuit": self.breaker.get_state() if self.breaker is not None else None,
+            }
+
+    def close(self):
+        self.session.close()
+
+
+_transports: Dict[str, PooledTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(base_url: str) -> PooledTransport:
+    """Get the process-wide transport for a backend, creating it on first use"""
+    key = base_url.rstrip('/')
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            pool_config = Config.HTTP_POOL_CONFIG
+            transport = PooledTransport(
+                key,
+                pool_connections=pool_config["pool_connections"],
+                pool_maxsize=pool_config["pool_maxsize"],
+                pool_block=pool_config["pool_block"],
+                keep_alive=pool_config["keep_alive"],
+            )
+            _transports[key] = transport
+        return transport
+
+
+def get_all_transport_metrics() -> list[Dict[str, Any]]:
+    """Metrics for every backend environment used so far in this process"""
+    with _transports_lock:
+        transports = list(_transports.values())
+    return [t.get_metrics() for t in transports]
@@ -0,0 +1,49 @@
+import threading
+import time
+
+from services.concurrency import iter_concurrently, map_concurrently
+
+
+def test_iter_concurrently_yields_every_item_once():
+    results = dict(iter_concurrently(lambda n: n * n if n != 3 else 1 / 0, range(20), max_workers=4))
+    assert results == {n: (n * n if n != 3 else None) for n in range(20)}
+    assert map_concurrently(lambda n: n + 1, [1, 2, 3], max_workers=2) == [2, 3, 4]
+
+
+def test_iter_concurrently_bounds_calls_queued_ahead_of_the_consumer():
+    started = []
+    lock = threading.Lock()
+
+    def call(n):
+        with lock:
+            started.append(n)
+        return n
+
+    consumed = 0
+    for _ in iter_concurrently(call, range(50), max_workers=2):
+        consumed += 1
+        time.sleep(0.002)
+        with lock:
+            assert len(started) - consumed <= 4
+    assert consumed == 50
+
+
+def test_stopping_early_cancels_queued_calls_without_waiting():
+    release = threading.Event()
+    started = []
+
+    def call(n):
+        started.append(n)
+        if n:
+            release.wait(5)
+        return n
+
+    results = iter_concurrently(call, range(100), max_workers=2)
+    assert next(results) == (0, 0)
+    begin = time.monotonic()
+    results.close()
+    assert time.monotonic() - begin < 1
+    release.set()
+    time.sleep(0.1)
+    # Only the calls already running or queued in the window ever started
+    assert len(started) <= 5
@@ -0,0 +1,93 @@
+import pytest
+
+from services.data_mods import apply_data_mods
+
+
+def make_cache():
+    return {
+        "global_data": {"ai_memory": {}},
+        "projects": {"demo": {"chats": [{"text": "hi"}], "mod_count": 3, "meta": {}}},
+    }
+
+
+# Streamed reply: every mod after the first shares a parent, so the batch is grouped
+STREAM = [{"key_path": ["projects", "demo", "chats"], "mode": "append", "value": {"text": ""}}] + [
+    {"key_path": ["projects", "demo", "chats", -1, "text"], "mode": "edit", "value": "x" * n} for n in range(1, 6)
+]
+# Every mod on a different parent, so the batch is applied without grouping
+SPREAD = [
+    {"key_path": ["projects", "demo", "meta", "tone"], "mode": "create", "value": "warm"},
+    {"key_path": ["global_data", "ai_memory", "m1"], "mode": "edit", "value": 1},
+    {"key_path": ["projects", "demo", "chats", 0, "text"], "mode": "edit", "value": "hello"},
+    {"key_path": ["projects", "other", "notes", "a"], "mode": "create", "value": 2},
+    {"key_path": ["projects", "demo", "missing", "x"], "mode": "edit", "value": 3},
+]
+
+
+@pytest.mark.parametrize("mods", [STREAM, SPREAD, STREAM + SPREAD, SPREAD + STREAM])
+def test_grouped_and_ungrouped_batches_give_the_same_result(mods):
+    one_by_one = make_cache()
+    for mod in mods:
+        apply_data_mods(one_by_one, [mod])
+    batched = make_cache()
+    report = apply_data_mods(batched, iter(mods))
+    assert batched == one_by_one
+    assert report["applied"] + report["rejected"] == len(mods)
+
+
+def test_stream_batch():
+    cache = make_cache()
+    report = apply_data_mods(cache, STREAM)
+    assert cache["projects"]["demo"]["chats"] == [{"text": "hi"}, {"text": "xxxxx"}]
+    assert report == {"applied": 6, "rejected": 0, "modified_projects": {"demo"}}
+
+
+def test_spread_batch():
+    cache = make_cache()
+    report = apply_data_mods(cache, SPREAD)
+    assert cache["projects"]["demo"]["meta"] == {"tone": "warm"}
+    assert cache["projects"]["demo"]["chats"][0]["text"] == "hello"
+    assert cache["projects"]["other"] == {"notes": {"a": 2}}
+    assert cache["global_data"]["ai_memory"] == {"m1": 1}
+    assert "missing" not in cache["projects"]["demo"]
+    assert report == {"applied": 4, "rejected": 1, "modified_projects": {"demo", "other"}}
+
+
+def test_list_modes_and_malformed_mods():
+    cache = make_cache()
+    chats = ["projects", "demo", "chats"]
+    report = apply_data_mods(cache, [
+        {"key_path": chats + [1], "mode": "create", "value": {"text": "new"}},
+        {"key_path": chats + [5], "mode": "create", "value": {}},
+        {"key_path": chats + [0], "mode": "del"},
+        {"key_path": chats + [9], "mode": "del"},
+        {"key_path": chats + [0, "tags"], "mode": "append", "value": "a"},
+        {"key_path": ["projects", "demo", "mod_count"], "mode": "edit", "value": 4},
+        {"key_path": "not-a-list", "mode": "edit"},
+        {"key_path": chats, "mode": "rename"},
+        "not a mod",
+    ])
+    assert cache["projects"]["demo"]["chats"] == [{"text": "new", "tags": ["a"]}]
+    assert cache["projects"]["demo"]["mod_count"] == 4
+    assert (report["applied"], report["rejected"]) == (4, 5)
+
+
+def test_no_mods():
+    assert apply_data_mods(make_cache(), None) == {"applied": 0, "rejected": 0, "modified_projects": set()}
+
+
+def test_paths_through_leaves_and_missing_keys():
+    cache = make_cache()
+    demo = ["projects", "demo"]
+    report = apply_data_mods(cache, [
+        {"key_path": demo + ["chats", 0, "text", 0], "mode": "edit", "value": "H"},
+        {"key_path": demo + ["mod_count", "x"], "mode": "create", "value": 1},
+        {"key_path": demo + ["meta", "a", "b", "c"], "mode": "create", "value": 1},
+        {"key_path": demo + ["meta", "a", "b", "d"], "mode": "edit", "value": 2},
+        {"key_path": demo + ["meta", "x", "y"], "mode": "edit", "value": 3},
+        {"key_path": demo + ["meta", "a", "b", "c"], "mode": "edit", "value": 4},
+    ])
+    assert cache["projects"]["demo"]["chats"] == [{"text": "hi"}]
+    assert cache["projects"]["demo"]["mod_count"] == 3
+    assert cache["projects"]["demo"]["meta"] == {"a": {"b": {"c": 4, "d": 2}}}
+    assert (report["applied"], report["rejected"]) == (3, 3)
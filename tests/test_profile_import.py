@@ -0,0 +1,49 @@
+from config import Config
+from services.profile_import import normalize_handle, parse_profile_handles, tracked_handles
+
+
+def test_normalize_handle_accepts_handles_and_profile_urls():
+    assert normalize_handle("@FoodXTaste") == "foodxtaste"
+    assert normalize_handle("https://www.instagram.com/another_brand/") == "another_brand"
+    assert normalize_handle("instagram.com/third.brand?igsh=abc") == "third.brand"
+    assert normalize_handle("m.instagram.com/x_y") == "x_y"
+
+
+def test_normalize_handle_rejects_invalid_names():
+    for raw in ["", "@", ".dot", "dot.", "has-dash", "a" * 31, "https://example.com/brand"]:
+        assert normalize_handle(raw) is None, raw
+
+
+def test_normalize_handle_rejects_reserved_instagram_paths():
+    for raw in [
+        "https://www.instagram.com/explore/",
+        "instagram.com/reels",
+        "https://www.instagram.com/p/",
+        "https://www.instagram.com/p/ABC123/",
+        "https://www.instagram.com/stories/brand/",
+        "https://www.instagram.com/accounts/login/",
+        "@explore",
+        "reel",
+    ]:
+        assert normalize_handle(raw) is None, raw
+
+
+def test_parse_profile_handles_skips_invalid_and_duplicates():
+    existing = tracked_handles([{"target_profile": "@Tracked"}, {"target_profile": ""}])
+    parsed = parse_profile_handles(
+        "@brand, https://www.instagram.com/Brand/\nnot-valid tracked instagram.com/explore/ second.brand",
+        existing,
+    )
+    assert parsed["handles"] == ["brand", "second.brand"]
+    assert [(r["value"], r["reason"]) for r in parsed["duplicates"]] == [
+        ("https://www.instagram.com/Brand/", "repeated in list"),
+        ("tracked", "already tracked"),
+    ]
+    assert [r["value"] for r in parsed["invalid"]] == ["not-valid", "instagram.com/explore/"]
+
+
+def test_parse_profile_handles_enforces_the_import_limit():
+    max_rows = Config.BULK_IMPORT_CONFIG["max_rows"]
+    parsed = parse_profile_handles(" ".join(f"brand{i}" for i in range(max_rows + 2)))
+    assert len(parsed["handles"]) == max_rows
+    assert [r["reason"] for r in parsed["invalid"]] == [f"over the {max_rows}-profile import limit"] * 2
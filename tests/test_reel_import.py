@@ -0,0 +1,71 @@
+from services.reel_import import (
+    canonical_reel_url,
+    existing_reel_keys,
+    parse_reel_import,
+    parse_reel_imports,
+    reel_shortcode,
+)
+
+
+def test_reel_shortcode_accepts_reel_and_post_urls():
+    assert reel_shortcode("https://www.instagram.com/reel/ABC123/") == "ABC123"
+    assert reel_shortcode("instagram.com/p/XyZ_-9?igsh=1") == "XyZ_-9"
+    assert reel_shortcode("https://m.instagram.com/someone/reel/Q1/") == "Q1"
+    assert reel_shortcode("https://example.com/reel/ABC123/") is None
+    assert reel_shortcode("") is None
+
+
+def test_pasted_list_with_intervals():
+    parsed = parse_reel_import(
+        "https://www.instagram.com/reel/A1/\nhttps://www.instagram.com/reel/B2/, 7\n\n# comment\n",
+        default_interval=2.0,
+    )
+    assert [(r["shortcode"], r["interval"], r["line"]) for r in parsed["reels"]] == [("A1", 2.0, 1), ("B2", 7.0, 2)]
+    assert parsed["invalid"] == [] and parsed["duplicates"] == []
+    assert parsed["reels"][0]["url"] == canonical_reel_url("A1")
+
+
+def test_invalid_rows_and_duplicates():
+    parsed = parse_reel_import(
+        "not a url\nhttps://www.instagram.com/reel/A1/, abc\nhttps://www.instagram.com/reel/A1/, 99\n"
+        "https://www.instagram.com/reel/B2/\nhttps://www.instagram.com/reel/B2/\nhttps://www.instagram.com/reel/C3/",
+        default_interval=2.0,
+        existing_keys=existing_reel_keys([{"reel_url": "https://www.instagram.com/reel/C3/"}]),
+    )
+    assert [r["shortcode"] for r in parsed["reels"]] == ["B2"]
+    assert [(r["line"], r["reason"]) for r in parsed["invalid"]] == [
+        (1, "not an Instagram reel URL"),
+        (2, "invalid interval 'abc'"),
+        (3, "interval must be between 0.5 and 30.0 days"),
+    ]
+    assert [(r["line"], r["reason"]) for r in parsed["duplicates"]] == [(5, "repeated in import"), (6, "already tracked")]
+
+
+def test_csv_header_columns_in_any_order():
+    parsed = parse_reel_import(
+        "interval_days,url\n5,https://www.instagram.com/reel/A1/\n,https://www.instagram.com/reel/B2/\n",
+        default_interval=2.0,
+    )
+    assert [(r["shortcode"], r["interval"], r["line"]) for r in parsed["reels"]] == [("A1", 5.0, 2), ("B2", 2.0, 3)]
+    assert parsed["invalid"] == []
+
+
+def test_header_only_upload_without_pasted_text():
+    parsed = parse_reel_imports([("pasted list", ""), ("reels.csv", "url,interval\n")], default_interval=2.0)
+    assert parsed == {"reels": [], "invalid": [], "duplicates": []}
+
+
+def test_uploaded_csv_keeps_its_header_and_line_numbers():
+    parsed = parse_reel_imports(
+        [
+            ("pasted list", "https://www.instagram.com/reel/A1/\n"),
+            ("reels.csv", "url,interval\nhttps://www.instagram.com/reel/A1/,3\nhttps://www.instagram.com/reel/B2/,4\nbad,1\n"),
+        ],
+        default_interval=2.0,
+    )
+    assert [(r["source"], r["line"], r["shortcode"], r["interval"]) for r in parsed["reels"]] == [
+        ("pasted list", 1, "A1", 2.0),
+        ("reels.csv", 3, "B2", 4.0),
+    ]
+    assert [(r["source"], r["line"], r["reason"]) for r in parsed["duplicates"]] == [("reels.csv", 2, "repeated in import")]
+    assert [(r["source"], r["line"], r["value"]) for r in parsed["invalid"]] == [("reels.csv", 4, "bad")]
@@ -0,0 +1,48 @@
+import tracemalloc
+
+import pytest
+
+from services import render_profiler
+from services.render_profiler import SlowRerunStore, profile_rerun, profile_section
+
+
+@pytest.fixture(autouse=True)
+def slow_rerun_store(tmp_path, monkeypatch):
+    store = SlowRerunStore(str(tmp_path), keep=2)
+    monkeypatch.setattr(render_profiler, "get_slow_rerun_store", lambda: store)
+    return store
+
+
+def test_tracemalloc_capture_stops_tracing_it_started():
+    assert not tracemalloc.is_tracing()
+    with profile_rerun(True, "dashboard", capture="tracemalloc") as outer:
+        with profile_rerun(True, "projects", capture="tracemalloc"):
+            assert tracemalloc.is_tracing()
+        # Still tracing for the rerun that has not finished yet
+        assert tracemalloc.is_tracing()
+        data = [bytearray(1024) for _ in range(100)]
+    assert not tracemalloc.is_tracing()
+    assert outer.record["tracemalloc"]["peak_growth_bytes"] > 0
+    assert outer.record["tracemalloc"]["top_allocations"]
+    del data
+
+
+def test_tracemalloc_started_elsewhere_is_left_on():
+    tracemalloc.start()
+    try:
+        with profile_rerun(True, capture="tracemalloc"):
+            pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_sections_and_slowest_reruns(slow_rerun_store):
+    for page in ("a", "b", "c"):
+        with profile_rerun(True, page) as profile:
+            with profile_section("body"):
+                pass
+        assert [s["name"] for s in profile.record["sections"]] == ["body"]
+    assert len(slow_rerun_store.slowest()) == 2
+    with profile_rerun(False) as profile:
+        assert profile is None
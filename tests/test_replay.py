@@ -0,0 +1,42 @@
+from services.log_store import LogStore
+from services.replay import REDACTED, build_replay_corpus
+
+
+def request_entry(body, path="/ig-tracking/get_profile_tracking_task/abc"):
+    return {
+        "endpoint": path,
+        "method": "GET",
+        "request": {"url": f"http://backend.invalid{path}", "body": {"password": "secret"}},
+        "response": {"status_code": 200, "body": body},
+        "duration_ms": 12.0,
+    }
+
+
+def test_truncated_entries_are_exported_with_full_bodies():
+    store = LogStore(max_body_bytes=100, max_full_bytes=10_000)
+    big = {"posts": [{"caption": "x" * 50} for _ in range(20)]}
+    store.append(request_entry(big))
+    store.append(request_entry({"ok": True}))
+
+    assert next(iter(store))["response"]["body"]["_truncated"]
+    corpus = build_replay_corpus(store.full_entries())
+    assert corpus["skipped_entries"] == 0
+    assert [r["response"] for r in corpus["requests"]] == [big, {"ok": True}]
+    assert corpus["requests"][0]["body"] == {"password": REDACTED}
+
+
+def test_full_bodies_are_bounded_and_follow_eviction():
+    store = LogStore(max_entries=3, max_body_bytes=100, max_full_bytes=3_000)
+    for i in range(4):
+        store.append(request_entry({"i": i, "text": "x" * 1000}))
+    assert store.get_stats()["full_bytes"] <= 3_000
+    corpus = build_replay_corpus(store.full_entries())
+    # Entry 0 was evicted from the log; of the rest only the two newest full bodies fit the budget
+    assert [r["response"]["i"] for r in corpus["requests"]] == [2, 3]
+    assert corpus["skipped_entries"] == 1
+
+
+def test_without_a_full_body_budget_truncated_entries_are_skipped():
+    store = LogStore(max_body_bytes=100)
+    store.append(request_entry({"text": "x" * 1000}))
+    assert build_replay_corpus(store.full_entries())["skipped_entries"] == 1
@@ -0,0 +1,71 @@
+import threading
+
+import pytest
+
+from services.single_flight import SingleFlight
+
+
+def run_with_waiter(flight, fn, on_result=lambda result: None):
+    """Start a leader call of fn, join one waiter to it, and return (leader result, waiter thread, waiter box)
+
+    on_result runs on the leader's thread as soon as its call returns.
+    """
+    entered, release = threading.Event(), threading.Event()
+
+    def leader_fn():
+        entered.set()
+        release.wait(5)
+        return fn()
+
+    box = {}
+
+    def waiter():
+        try:
+            box["value"] = flight.do("key", lambda: pytest.fail("waiter must not run the call"))
+        except Exception as e:
+            box["error"] = e
+
+    leader_box = {}
+
+    def lead():
+        try:
+            leader_box["value"] = flight.do("key", leader_fn)
+        except Exception as e:
+            leader_box["error"] = e
+        else:
+            on_result(leader_box["value"][0])
+
+    leader = threading.Thread(target=lead)
+    leader.start()
+    entered.wait(5)
+    thread = threading.Thread(target=waiter)
+    thread.start()
+    while flight.get_stats()["coalesced"] < 1:
+        thread.join(0.001)
+    release.set()
+    leader.join(5)
+    return leader_box.get("value"), thread, box
+
+
+def test_leader_may_mutate_its_result_without_touching_waiters():
+    flight = SingleFlight()
+    # The leader's caller changes its response right away, typically before the waiter wakes up
+    (result, shared), waiter, box = run_with_waiter(
+        flight, lambda: {"posts": [1, 2]}, on_result=lambda result: result["posts"].append(3)
+    )
+    assert not shared and result == {"posts": [1, 2, 3]}
+    waiter.join(5)
+    assert box["value"] == ({"posts": [1, 2]}, True)
+    assert flight.get_stats()["in_flight"] == 0
+
+
+def test_waiters_raise_the_leaders_error():
+    flight = SingleFlight()
+
+    def boom():
+        raise ValueError("backend down")
+
+    _, waiter, box = run_with_waiter(flight, boom)
+    waiter.join(5)
+    assert isinstance(box["error"], ValueError)
+    assert flight.do("key", lambda: 1) == (1, False)
@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+from services.stream_decoder import JSONStreamDecoder
+
+DOCUMENTS = [
+    {"result": True, "response": {"text": "café — ὠ0 {not a brace} \"quoted\" \\"}},
+    {"result": True, "response": {"data_mods": [{"key_path": ["projects", "demo"], "mode": "append", "value": [1, 2]}]}},
+    [1, {"nested": [[], {}]}, "]"],
+]
+
+
+def decode(chunks, **kwargs):
+    decoder = JSONStreamDecoder(**kwargs)
+    documents = []
+    for chunk in chunks:
+        documents.extend(decoder.feed(chunk))
+    documents.extend(decoder.finish())
+    return documents, decoder
+
+
+def split_every(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("separator", ["\n", ""])
+@pytest.mark.parametrize("size", [1, 3, 7, 64, 10000])
+def test_documents_split_across_chunks(separator, size):
+    data = separator.join(json.dumps(doc, ensure_ascii=False) for doc in DOCUMENTS).encode("utf-8")
+    # Byte chunks of size 1 and 3 also cut multibyte characters in half
+    documents, decoder = decode(split_every(data, size), max_pending_chars=16)
+    assert documents == DOCUMENTS
+    assert decoder.frames_malformed == 0
+    assert decoder.pending_chars == 0
+
+
+def test_coalesced_documents_in_one_chunk():
+    documents, decoder = decode(["\n".join(json.dumps(doc) for doc in DOCUMENTS * 50) + "\n"])
+    assert documents == DOCUMENTS * 50
+    assert not decoder.scanner_mode
+
+
+def test_newline_free_stream_switches_to_scanner():
+    data = "".join(json.dumps(doc) for doc in DOCUMENTS * 20)
+    documents, decoder = decode(split_every(data, 50), max_pending_chars=100)
+    assert decoder.scanner_mode
+    assert documents == DOCUMENTS * 20
+
+
+def test_document_longer_than_max_pending_is_scanned():
+    big = {"text": "x" * 5000, "items": list(range(500))}
+    data = json.dumps(big) + json.dumps(DOCUMENTS[0])
+    documents, decoder = decode(split_every(data, 100), max_pending_chars=256)
+    assert documents == [big, DOCUMENTS[0]]
+
+
+def test_document_spanning_lines():
+    data = json.dumps(DOCUMENTS[1], indent=2) + "\n" + json.dumps(DOCUMENTS[0]) + "\n"
+    documents, _ = decode(split_every(data, 20))
+    assert documents == [DOCUMENTS[1], DOCUMENTS[0]]
+
+
+def test_sse_prefixes_are_skipped():
+    data = 'data: {"a": 1}\n\ndata: {"b": 2}\n: keep-alive\n'
+    documents, decoder = decode(split_every(data, 5))
+    assert documents == [{"a": 1}, {"b": 2}]
+    assert decoder.skipped_chars == len("data:") * 2 + len(": keep-alive")
+
+
+@pytest.mark.parametrize("max_pending_chars", [65536, 4])
+def test_malformed_document_does_not_swallow_the_next(max_pending_chars):
+    data = '{"a": 1}\n{"b": nope}\n{"c": 3}\n'
+    documents, decoder = decode(split_every(data, 4), max_pending_chars=max_pending_chars)
+    assert documents == [{"a": 1}, {"c": 3}]
+    assert decoder.frames_malformed == 1
+
+
+def test_unfinished_document_at_end_is_malformed():
+    documents, decoder = decode(['{"a": 1}{"b": [1, 2'], max_pending_chars=4)
+    assert documents == [{"a": 1}]
+    assert decoder.frames_malformed == 1
+
+
+def test_held_document_is_reparsed_a_linear_amount():
+    big = {"items": [{"id": i, "tags": ["a", "b"], "text": "x" * 20} for i in range(300)]}
+    data = json.dumps(big) * 2
+    decoder = JSONStreamDecoder(max_pending_chars=len(data))
+    parsed = []
+    raw_decode = decoder._json.raw_decode
+
+    def counting_raw_decode(text, idx=0):
+        parsed.append(len(text) - idx)
+        return raw_decode(text, idx)
+
+    decoder._json.raw_decode = counting_raw_decode
+    decoder._switch_to_scanner("")
+    documents = []
+    for chunk in split_every(data, 7):
+        documents.extend(decoder.feed(chunk))
+    documents.extend(decoder.finish())
+    assert documents == [big, big]
+    # Chunks ending in "}" or "]" are frequent here, yet each document is re-parsed a bounded number of times over
+    assert sum(parsed) <= 6 * len(data)
@@ -0,0 +1,118 @@
+import pytest
+import requests
+
+from services.transport import CircuitBreaker, CircuitOpenError, PooledTransport
+
+
+def make_response(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content, response._content_consumed = b"", True
+    return response
+
+
+class FakeSession:
+    """Stands in for requests.Session, answering with a scripted sequence of statuses or exceptions"""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return make_response(outcome)
+
+
+def make_transport(outcomes, failure_threshold=5, max_attempts=3):
+    transport = PooledTransport("http://backend.invalid", resilience_config={
+        "retry": {
+            "max_attempts": max_attempts,
+            "backoff_base_seconds": 0,
+            "backoff_max_seconds": 0,
+            "retry_statuses": [429, 502, 503, 504],
+            "breaker_statuses": [500, 502, 503, 504],
+            "idempotent_methods": ["GET"],
+        },
+        "circuit_breaker": {"enabled": True, "failure_threshold": failure_threshold, "reset_timeout_seconds": 60},
+    })
+    transport.session = FakeSession(outcomes)
+    return transport
+
+
+def test_retry_that_recovers_is_counted_as_succeeded():
+    transport = make_transport([503, requests.exceptions.ConnectionError("refused"), 200])
+    assert transport.request("GET", "http://backend.invalid/x").status_code == 200
+    metrics = transport.get_metrics()
+    assert (metrics["requests_sent"], metrics["requests_failed"]) == (3, 1)
+    assert (metrics["retries"], metrics["retries_succeeded"]) == (2, 1)
+    assert metrics["circuit"]["state"] == "closed"
+    assert metrics["circuit"]["consecutive_failures"] == 0
+
+
+@pytest.mark.parametrize("final_status", [404, 429])
+def test_retry_ending_in_client_error_is_not_a_success(final_status):
+    transport = make_transport([503, final_status], max_attempts=2)
+    assert transport.request("GET", "http://backend.invalid/x").status_code == final_status
+    metrics = transport.get_metrics()
+    assert (metrics["retries"], metrics["retries_succeeded"]) == (1, 0)
+
+
+def test_exhausted_retries_raise_the_last_error():
+    transport = make_transport([requests.exceptions.ConnectionError("refused")] * 3)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        transport.request("GET", "http://backend.invalid/x")
+    metrics = transport.get_metrics()
+    assert (metrics["requests_sent"], metrics["retries"], metrics["retries_succeeded"]) == (3, 2, 0)
+    assert metrics["circuit"]["consecutive_failures"] == 3
+
+
+def test_non_idempotent_and_streaming_requests_are_not_retried():
+    transport = make_transport([503, 503])
+    assert transport.request("POST", "http://backend.invalid/x").status_code == 503
+    assert transport.request("GET", "http://backend.invalid/x", stream=True).status_code == 503
+    assert transport.session.calls == 2
+    assert transport.get_metrics()["retries"] == 0
+
+
+def test_read_timeout_is_not_retried_but_counts_against_the_backend():
+    transport = make_transport([requests.exceptions.ReadTimeout("slow")])
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        transport.request("GET", "http://backend.invalid/x")
+    assert transport.session.calls == 1
+    assert transport.get_metrics()["circuit"]["consecutive_failures"] == 1
+
+
+def test_open_circuit_fails_fast_without_sending():
+    transport = make_transport([500, 500, 200], failure_threshold=2)
+    transport.request("POST", "http://backend.invalid/x")
+    transport.request("POST", "http://backend.invalid/x")
+    with pytest.raises(CircuitOpenError):
+        transport.request("GET", "http://backend.invalid/x")
+    metrics = transport.get_metrics()
+    assert transport.session.calls == 2
+    assert metrics["circuit"]["state"] == "open"
+    assert (metrics["circuit"]["times_opened"], metrics["circuit"]["short_circuited"]) == (1, 1)
+
+
+def test_half_open_probe_closes_or_reopens_the_circuit(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("services.transport.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=30)
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    now[0] += 30
+    breaker.before_request()  # the probe
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()  # only one probe at a time
+    breaker.record_failure()
+    assert breaker.get_state()["state"] == "open"
+
+    now[0] += 30
+    breaker.before_request()
+    breaker.record_success()
+    assert breaker.get_state() == {"state": "closed", "consecutive_failures": 0, "times_opened": 2, "short_circuited": 2}